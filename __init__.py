@@ -10,6 +10,9 @@ nhk = NHK()
 nhknews_action = QAction("NHK News", mw)
 LangU_menu.addAction(nhknews_action)
 qconnect(nhknews_action.triggered, nhk.check_setting)
+dedupe_action = QAction("NHK News: Deduplicate Audio", mw)
+LangU_menu.addAction(dedupe_action)
+qconnect(dedupe_action.triggered, nhk.dedupe_audio)
 
 
 
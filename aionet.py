@@ -0,0 +1,138 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from . import net
+except ImportError:
+    import net
+
+# requests in flight at once over all coroutines of the engine
+CONCURRENCY = 200
+# threads doing the engine's disk work, cache files and download chunks, so it never runs on the loop
+IO_WORKERS = 8
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def available() -> bool:
+    return aiohttp is not None
+
+
+class AsyncEngine:
+    """
+    an asyncio event loop on its own thread with one aiohttp session,
+    coroutines are submitted from any thread with submit() and at most concurrency requests are in flight at once.
+    get_text shares the response cache of net.get_text
+    """
+
+    def __init__(self, concurrency=CONCURRENCY):
+        if aiohttp is None:
+            raise RuntimeError('aiohttp is not installed')
+        self.concurrency = concurrency
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(
+            concurrent.futures.ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix='fetch-io'))
+        self._thread = threading.Thread(target=self.loop.run_forever, name='fetch-loop', daemon=True)
+        self._thread.start()
+        self._semaphore = None
+        self._session = None
+        self.submit(self._open()).result()
+
+    async def _open(self):
+        # both belong to the loop, so they are created on it
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._session = aiohttp.ClientSession(
+            headers={'User-Agent': net.USER_AGENT},
+            timeout=aiohttp.ClientTimeout(sock_connect=net.TIMEOUT[0], sock_read=net.TIMEOUT[1]),
+            connector=aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300))
+
+    def submit(self, coroutine) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    async def get_text(self, url: str, fresh: float = 0):
+        """
+        same as net.get_text, without a thread waiting on the request,
+        reading and writing the response cache runs on worker threads, never on the loop
+        """
+        cache = await asyncio.to_thread(net.response_cache)
+        cached = await asyncio.to_thread(cache.get, url)
+        headers = {}
+        if cached:
+            meta, text = cached
+            if time.time() - meta['stored_at'] < fresh:
+                return text
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        async with self._semaphore:
+            async with self._session.get(url, headers=headers) as res:
+                status = res.status
+                if status == 200:
+                    text = await res.text()
+                    etag, last_modified = res.headers.get('ETag'), res.headers.get('Last-Modified')
+        if status == 304 and cached:
+            await asyncio.to_thread(cache.touch, url)
+            return cached[1]
+        if status != 200:
+            return None
+        await asyncio.to_thread(cache.put, url, text, etag, last_modified)
+        return text
+
+    async def download(self, url: str, path: str, chunk_size: int = net.CHUNK_SIZE) -> bool:
+        """same as net.download, the partial file is opened, written and moved on worker threads"""
+        part = await asyncio.to_thread(net.claim_partial, url)
+        try:
+            headers = await asyncio.to_thread(net.download_headers, part)
+            async with self._semaphore:
+                async with self._session.get(url, headers=headers) as res:
+                    mode = await asyncio.to_thread(net.download_mode, res.status, res.headers, part)
+                    if mode is None:
+                        return False
+                    if mode != 'complete':
+                        f = await asyncio.to_thread(open, part, mode)
+                        try:
+                            async for chunk in res.content.iter_chunked(chunk_size):
+                                await asyncio.to_thread(f.write, chunk)
+                        finally:
+                            await asyncio.to_thread(f.close)
+                        size = net.expected_size(res.status, res.headers)
+                        if size is not None and await asyncio.to_thread(net.partial_size, part) != size:
+                            return False
+            await asyncio.to_thread(net.finish_download, part, path)
+            return True
+        finally:
+            await asyncio.to_thread(net.release_partial, part)
+
+    def close(self):
+        self.submit(self._session.close()).result()
+        self.submit(self.loop.shutdown_default_executor()).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+def engine(concurrency=CONCURRENCY) -> AsyncEngine:
+    """the engine every async fetcher of the add-on goes through, concurrency only counts on first call"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = AsyncEngine(concurrency)
+    return _engine
+
+
+def close() -> None:
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.close()
+            _engine = None
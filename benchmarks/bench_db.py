@@ -0,0 +1,128 @@
+"""
+per-call overhead of Table lookups, the baseline query path against the cached SQL builder
+python benchmarks/bench_db.py [rows] [calls]
+"""
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import timeit
+from sqlite3 import Cursor
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db as database  # noqa: E402
+
+
+class LegacyDatabase:
+    """
+    the query path of db.Database before this work, copied verbatim from the baseline,
+    only the QObject base and the methods a lookup doesn't reach are left out
+    """
+
+    def __init__(self, db_path):
+        super().__init__()
+        self.path = db_path
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+
+    def execute(self, sql: str, *args: Any, **kwargs: Any) -> Cursor:
+        sql = sql.strip()
+        if kwargs:
+            result = self._db.execute(sql, kwargs)
+        else:
+            result = self._db.execute(sql, args)
+        if re.match('insert|update|delete', sql.lower()):
+            self.commit()
+        return result
+
+    def fetchall(self, sql: str, *args: Any, **kwargs: Any) -> Any:
+        cursor = self.execute(sql, *args, **kwargs)
+        result = cursor.fetchall()
+        cursor.close()
+        return result
+
+    def table(self, name):
+        return LegacyDatabase.Table(self, name)
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    class Table:
+        def __init__(self, db, name):
+            self.db = db
+            self.name = name
+
+        def select(self, columns, *args, **kwargs):
+            columns_string = ", ".join(columns) if isinstance(columns, list) else columns
+            if not kwargs:
+                if not args:
+                    result = self.db.fetchall(f'select {columns_string} from {self.name} ')
+                else:
+                    result = self.db.fetchall(
+                        f'select {columns_string} from {self.name} where {" and ".join(args)}')
+            else:
+                condition = ''
+                for key, value in kwargs.items():
+                    if not condition:
+                        condition += f'{key}=?'
+                    else:
+                        condition += f'and {key}=?'
+                result = self.db.fetchall(
+                    f'select {columns_string} from {self.name} where {condition}', *kwargs.values())
+
+            return result
+
+        def get(self, columns: list or str, *args: Any, **kwargs: Any) -> list:
+            """
+            get a list of first items of search result,
+            db.table('name').get('id', 'id>15')
+            db.table('name').get('id', id=15)
+            """
+            result = self.select(columns, *args, **kwargs)
+            items = [x[0] for x in result]
+            return items
+
+        def getone(self, columns: list or str, *args: Any, **kwargs: Any) -> Any:
+            """get only one
+            """
+            result = self.get(columns, *args, **kwargs)
+            if result:
+                return result[0]
+            else:
+                return None
+
+
+def main(rows=20000, calls=20000):
+    with tempfile.TemporaryDirectory() as folder:
+        db = database.Database(os.path.join(folder, 'bench.db'))
+        db.migrate()
+        db.table('urls').insertmany('url', [f'https://example.com/{n}' for n in range(rows)])
+        urls = db.table('urls')
+        legacy_db = LegacyDatabase(db.path)
+        legacy_urls = legacy_db.table('urls')
+        url = f'https://example.com/{rows // 2}'
+
+        assert legacy_urls.getone('id', url=url) == urls.getone('id', url=url)
+        # both produce the same text on every call, so sqlite3's statement cache reuses the prepared
+        # statement either way, the difference is assembling the text and the fetch path around it
+        cases = {
+            'baseline getone': lambda: legacy_urls.getone('id', url=url),
+            'getone (build_sql, fetchone)': lambda: urls.getone('id', url=url),
+            'baseline get': lambda: legacy_urls.get('id', url=url),
+            'get (build_sql)': lambda: urls.get('id', url=url),
+            'build_sql only (cache hit)': lambda: urls.select_sql('id', keys=('url',), limit=1),
+        }
+        for name, case in cases.items():
+            seconds = min(timeit.repeat(case, number=calls, repeat=5))
+            print(f'{name:45} {seconds / calls * 1e6:8.2f} us/call')
+        legacy_db.close()
+        db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""
+parse time per page of each html parser backend over saved article pages
+python benchmarks/bench_parsers.py [folder with saved .html pages] [repeat]
+without a folder a synthetic page shaped like a WeChat news article is used
+"""
+import glob
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parsers  # noqa: E402
+
+
+def synthetic_article(sections=8, filler=400) -> str:
+    """news sections, hidden word lists, audio players and a lot of unrelated markup like a real page"""
+    parts = ['<html><head><title>t</title><script>var a = 1;</script></head><body><h1> 【NHK新闻听译】标题 </h1>']
+    for n in range(sections):
+        parts.append(f'<mpvoice voice_encode_fileid="MzU1NDQ5NDIwNV8y{n:04d}" name="{n}"></mpvoice>')
+        parts.append('<section data-autoskip="1"><p>'
+                     + 'きょうは（1）が多いです。今天（1）很多。' * 6 + '</p></section>')
+        parts.append('<section style="overflow: hidden;"><section><p>（1）雨 あめ</p><p>（2）風 かぜ</p></section></section>')
+    for n in range(filler):
+        parts.append(f'<div class="rich_media_content" id="d{n}"><span style="color: red">filler {n}</span>'
+                     f'<a href="https://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&amp;mid={n}&amp;idx=1">'
+                     f'【NHK新闻听译】{n}</a></div>')
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def main(folder=None, repeat=20):
+    if folder:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(folder, '*.html'))):
+            with open(path, encoding='utf-8') as f:
+                pages.append(f.read())
+    else:
+        pages = [synthetic_article()]
+    print(f'{len(pages)} pages, {sum(map(len, pages)) / len(pages) / 1024:.0f} KB on average')
+    for name, backend in parsers.BACKENDS.items():
+        if not backend.available():
+            print(f'{name:12} not installed')
+            continue
+        parser = backend()
+        sections = sum(len(parser.find_all(page, 'section', **{'data-autoskip': '1'})) for page in pages)
+        seconds = min(timeit.repeat(
+            lambda: [parser.find_all(page, 'section', **{'data-autoskip': '1'}) for page in pages],
+            number=repeat, repeat=3))
+        print(f'{name:12} {seconds / repeat / len(pages) * 1000:8.2f} ms/page  ({sections} sections found)')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else None, *[int(arg) for arg in sys.argv[2:]])
@@ -0,0 +1,136 @@
+"""
+text helpers of TaskManager before and after textutils on a synthetic corpus of news paragraphs,
+per paragraph and with the language of all sentences classified in one batch
+python benchmarks/bench_text.py [paragraphs]
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import textutils  # noqa: E402
+
+
+class Legacy:
+    """the helpers as TaskManager had them"""
+
+    @staticmethod
+    def is_jp(p):
+        if len(re.findall(r'[ぁ-んァ-ンー]+', p)) > 1:
+            return True
+        elif len(re.findall('[ぁ-んァ-ンー]', p[1:-1])) == len(p[1:-1]):
+            return True
+        else:
+            return False
+
+    @staticmethod
+    def is_replaceable(text):
+        return bool(re.search(r'[(（]\s*\d+\s*[)）]', text))
+
+    @staticmethod
+    def remove_certain_text(text):
+        for part in ['生词', '背景知识', '単語', '单词']:
+            if part in text:
+                text = text[:text.index(part)]
+        return text
+
+    @staticmethod
+    def replace_brackets_with_words(jp, words):
+        for n, word in enumerate(words):
+            jp = re.sub(fr'[(（]\s*{n + 1}\s*[)）]', word, jp)
+        return jp
+
+    def split_text(self, text):
+        text = re.sub(r'(。」|。”|。)', r'\g<1>\n', text)
+        sentences = text.split('\n')
+        jp, cn = "", ""
+        p = ""
+        current_lang_is_jp = True
+        for sentence in sentences:
+            if self.is_jp(sentence) != current_lang_is_jp:
+                if current_lang_is_jp:
+                    jp += f'<p>{p}</p>\n'
+                else:
+                    cn += f'<p>{p}</p>\n'
+                current_lang_is_jp = not current_lang_is_jp
+                p = ""
+            if all([current_lang_is_jp, self.is_jp(sentence)]):
+                p += sentence.strip()
+            elif all([not current_lang_is_jp, not self.is_jp(sentence)]):
+                p += sentence.strip()
+        return jp, cn
+
+
+def corpus(paragraphs, seed=0):
+    """paragraphs of japanese sentences with numbered blanks followed by their chinese translation"""
+    rng = random.Random(seed)
+    kana = 'あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをんアイウエオカキクケコー'
+    kanji = '日本政府東京都気象庁地震発生今年中国語新聞記者会見経済'
+    items = []
+    for _ in range(paragraphs):
+        sentences = []
+        for n in range(rng.randint(3, 8)):
+            jp = ''.join(rng.choice(kana + kanji) for _ in range(rng.randint(10, 40)))
+            sentences.append(f'{jp}（{n + 1}）{rng.choice(kana) * 3}。')
+        for _ in range(rng.randint(3, 8)):
+            sentences.append(''.join(rng.choice(kanji) for _ in range(rng.randint(10, 40))) + '。')
+        text = ''.join(sentences) + rng.choice(['', '生词：（1）あめ', '背景知识 …'])
+        words = [''.join(rng.choice(kanji) for _ in range(2)) for _ in range(8)]
+        items.append((text, words))
+    return items
+
+
+def run(helpers, items):
+    result = []
+    for text, words in items:
+        text = helpers.remove_certain_text(text)
+        jp, cn = helpers.split_text(text)
+        if helpers.is_replaceable(jp):
+            jp = helpers.replace_brackets_with_words(jp, words)
+        result.append((jp, cn))
+    return result
+
+
+def run_batch(items):
+    """the same work with every paragraph's sentences classified in one batch"""
+    texts = [textutils.remove_certain_text(text) for text, _ in items]
+    result = []
+    for (jp, cn), (_, words) in zip(textutils.split_texts(texts), items):
+        if textutils.is_replaceable(jp):
+            jp = textutils.replace_brackets_with_words(jp, words)
+        result.append((jp, cn))
+    return result
+
+
+def main(paragraphs=5000):
+    items = corpus(paragraphs)
+    print(f'{paragraphs} paragraphs, {sum(len(text) for text, _ in items) / 1024:.0f} KB of text')
+    timings = {}
+    outputs = {}
+    for name, helpers in [('legacy', Legacy()), ('textutils', textutils)]:
+        start = time.perf_counter()
+        outputs[name] = run(helpers, items)
+        timings[name] = time.perf_counter() - start
+        print(f'{name:10} {timings[name] * 1000:8.1f} ms')
+    start = time.perf_counter()
+    outputs['batch'] = run_batch(items)
+    timings['batch'] = time.perf_counter() - start
+    print(f'{"batch":10} {timings["batch"] * 1000:8.1f} ms  (numpy {"on" if textutils.np is not None else "off"})')
+    assert outputs['legacy'] == outputs['textutils'] == outputs['batch'], 'textutils output differs from legacy'
+    print(f'speedup {timings["legacy"] / timings["textutils"]:.1f}x per paragraph, '
+          f'{timings["legacy"] / timings["batch"]:.1f}x batched, outputs identical')
+
+    sentences = [sentence for text, _ in items for sentence in textutils.SENTENCE_END.sub(r'\g<1>\n', text).split('\n')]
+    for name, classify in [('is_jp loop', lambda: [textutils.is_jp(sentence) for sentence in sentences]),
+                           ('kana runs', lambda: textutils._classify_runs(sentences)),
+                           ('numpy', lambda: textutils._classify_numpy(sentences) if textutils.np is not None else None)]:
+        start = time.perf_counter()
+        classify()
+        print(f'classify {len(sentences)} sentences, {name:10} {(time.perf_counter() - start) * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    from .urlkeys import article_id
+except ImportError:
+    from urlkeys import article_id
+
+
+def normalized_url(url: str) -> str:
+    """scheme and host lowercased, query sorted and fragment dropped"""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+
+def entry_url(url: str) -> str:
+    """
+    what a cache entry is stored under, article links by their (__biz, mid, idx) like urlkeys.url_key,
+    so every share link of an article hits one entry whatever chksm or sn it carries, other links normalized
+    """
+    identity = article_id(url)
+    if identity is None:
+        return normalized_url(url)
+    return 'article:{}:{}:{}'.format(*identity)
+
+
+class ResponseCache:
+    """
+    text responses on disk, keyed by entry_url,
+    each entry is <key>.body with the text and <key>.json with the validators and a sha1 of the body.
+    entries older than max_age are dropped, the least recently used go first once the folder exceeds max_bytes
+    """
+
+    def __init__(self, folder, max_bytes=64 * 1024 * 1024, max_age=30 * 24 * 3600):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._size = None
+        os.makedirs(self.folder, exist_ok=True)
+
+    def key(self, url: str) -> str:
+        return hashlib.sha1(entry_url(url).encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str) -> tuple:
+        return os.path.join(self.folder, key + '.body'), os.path.join(self.folder, key + '.json')
+
+    def get(self, url: str):
+        """
+        :return: (meta, text) or None, meta has etag, last_modified, sha1 and stored_at
+        """
+        body_path, meta_path = self._paths(self.key(url))
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if time.time() - meta['stored_at'] > self.max_age:
+                self._remove(body_path, meta_path)
+                return None
+            with open(body_path, 'rb') as f:
+                text = f.read().decode('utf-8')
+            os.utime(body_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return meta, text
+
+    def put(self, url: str, text: str, etag: str = None, last_modified: str = None) -> dict:
+        body = text.encode('utf-8')
+        meta = {'url': entry_url(url), 'etag': etag, 'last_modified': last_modified,
+                'sha1': hashlib.sha1(body).hexdigest(), 'stored_at': time.time()}
+        body_path, meta_path = self._paths(self.key(url))
+        old_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+        self._write(body_path, body)
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        with self._lock:
+            if self._size is not None:
+                self._size += len(body) - old_size
+        self.evict()
+        return meta
+
+    def touch(self, url: str) -> None:
+        """mark an entry as revalidated by the server, only its .json is rewritten, the body is left as it is"""
+        body_path, meta_path = self._paths(self.key(url))
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            # fails when the entry was just evicted, so no .json is left without its body
+            os.utime(body_path)
+            meta['stored_at'] = time.time()
+            self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        except (OSError, ValueError):
+            pass
+
+    def evict(self) -> None:
+        """drop least recently used entries until the folder is within max_bytes"""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in os.scandir(self.folder)
+                                 if entry.name.endswith('.body'))
+            if self._size <= self.max_bytes:
+                return
+            bodies = sorted((entry for entry in os.scandir(self.folder) if entry.name.endswith('.body')),
+                            key=lambda entry: entry.stat().st_mtime)
+            for entry in bodies:
+                if self._size <= self.max_bytes * 0.9:
+                    break
+                self._size -= entry.stat().st_size
+                self._remove(entry.path, entry.path[:-len('.body')] + '.json')
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _remove(*paths: str) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
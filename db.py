@@ -1,31 +1,359 @@
 import datetime
+import html
+import os
 import re
 import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from sqlite3 import Cursor
 from typing import Any
 
 from PyQt6.QtCore import QObject
 
+try:
+    from .urlkeys import merge_duplicate_urls
+except ImportError:
+    from urlkeys import merge_duplicate_urls
+
+
+WRITE_STATEMENTS = ('insert', 'update', 'delete', 'replace')
+READ_STATEMENTS = ('select',)
+
+# bound parameters allowed in one statement by sqlite builds older than 3.32
+MAX_VARIABLES = 999
+RETURNING_SUPPORTED = sqlite3.sqlite_version_info >= (3, 35)
+
+# prepared statements kept per connection, every statement built by build_sql is one entry
+STATEMENT_CACHE_SIZE = 256
+
+# schema of user_files/data.db, one entry per version, PRAGMA user_version records the last one applied.
+# an entry is a list of statements or a callable taking the Database, never edit an entry once released,
+# append a new one instead
+MIGRATIONS = [
+    # 1: initial tables
+    [
+        'create table if not exists urls (ID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, URL TEXT, TITLE TEXT)',
+        'create table if not exists notes (ID INTEGER PRIMARY KEY NOT NULL, PAGE_ID INTEGER, AUDIO_URL TEXT)',
+        'create table if not exists users (ID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, NAME TEXT)',
+        'create table if not exists log (NOTE_ID INTEGER, USER_ID INTEGER)',
+    ],
+    # 2: merge duplicated rows then add unique indexes, notes.ID is the rowid and needs no index
+    [
+        """update notes set PAGE_ID=(select min(u.ID) from urls u
+                                     where u.URL=(select URL from urls where ID=notes.PAGE_ID))
+           where PAGE_ID in (select ID from urls)""",
+        'delete from urls where ID not in (select min(ID) from urls group by URL)',
+        'create unique index if not exists urls_url on urls (URL)',
+        """update log set USER_ID=(select min(u.ID) from users u
+                                   where u.NAME=(select NAME from users where ID=log.USER_ID))
+           where USER_ID in (select ID from users)""",
+        'delete from users where ID not in (select min(ID) from users group by NAME)',
+        'create unique index if not exists users_name on users (NAME)',
+        'delete from log where rowid not in (select min(rowid) from log group by NOTE_ID, USER_ID)',
+        'create unique index if not exists log_note_user on log (NOTE_ID, USER_ID)',
+    ],
+    # 3: crawl checkpoint, newest article mid seen per album and the pages left to walk
+    [
+        'create table if not exists albums (ID TEXT PRIMARY KEY NOT NULL, HEAD_MID INTEGER, SEEN_AT TEXT)',
+        'create table if not exists frontier (URL TEXT PRIMARY KEY NOT NULL, ADDED_AT TEXT)',
+    ],
+    # 4: article key of each url, filled in by 6
+    [
+        'alter table urls add column KEY INTEGER',
+        'create unique index if not exists urls_key on urls (KEY)',
+    ],
+    # 5: content hash of a note's audio file, see media.file_hash
+    [
+        'alter table notes add column AUDIO_HASH TEXT',
+    ],
+    # 6: one row per account so article keys are exact, see urlkeys.article_keys
+    merge_duplicate_urls,
+]
+
+
+@lru_cache(maxsize=512)
+def build_sql(kind: str, table: str, columns: Any = (), conditions: tuple = (), keys: tuple = (),
+              order_by: str = None, limit: bool = False, conflict: str = None, rows: int = 1,
+              upsert: tuple = None, update: tuple = (), returning: Any = None) -> str:
+    """
+    build the text of a statement once per shape, values are always bound as parameters
+    so the same text maps onto the same prepared statement in sqlite3's statement cache
+    build_sql('select', 'urls', 'id', keys=('url',), limit=True) -> 'select id from urls where url=? limit ?'
+    build_sql('insert', 'urls', ('url',), upsert=('url',)) -> 'insert into urls (url) values (?) on conflict (url) do nothing'
+    """
+    columns_string = columns if isinstance(columns, str) else ", ".join(columns)
+    where = ' and '.join(list(conditions) + [f'{key}=?' for key in keys])
+    if kind == 'select':
+        sql = f'select {columns_string} from {table}'
+    elif kind == 'insert':
+        insert = f'insert or {conflict}' if conflict else 'insert'
+        columns_count = 1 if isinstance(columns, str) else len(columns)
+        row = f'({", ".join("?" * columns_count)})'
+        sql = f'{insert} into {table} ({columns_string}) values {", ".join([row] * rows)}'
+        if upsert:
+            sql += f' on conflict ({", ".join(upsert)}) do '
+            sql += f'update set {", ".join(f"{column}=excluded.{column}" for column in update)}' if update else 'nothing'
+        if returning:
+            sql += f' returning {returning if isinstance(returning, str) else ", ".join(returning)}'
+        return sql
+    elif kind == 'update':
+        sql = f'update {table} set {", ".join(f"{column}=?" for column in columns)}'
+    elif kind == 'delete':
+        sql = f'delete from {table}'
+    else:
+        raise ValueError(f'unknown statement kind: {kind}')
+    if where:
+        sql += f' where {where}'
+    if order_by:
+        sql += f' order by {order_by}'
+    if limit:
+        sql += ' limit ?'
+    return sql
+
+
+def shape(columns: Any) -> Any:
+    """hashable form of a column argument for build_sql"""
+    return columns if isinstance(columns, str) else tuple(columns)
+
+
+@lru_cache(maxsize=1024)
+def statement_shape(sql: str) -> str:
+    """
+    collapse literals, whitespace and repeated value rows so statements differing only in data share one shape
+    "select id from urls where id>15" -> "select id from urls where id>?"
+    """
+    sql = re.sub(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b", '?', sql)
+    sql = re.sub(r'\s+', ' ', sql).strip()
+    return re.sub(r'(\((?:\?, )*\?\))(?:, \1)+', r'\1, ...', sql)
+
+
+class QueryProfiler:
+    """
+    timing of statements run through Database.execute/executemany, grouped by statement shape
+    db.enable_profiling()
+    ...
+    db.profiler.stats()
+    """
+
+    def __init__(self, samples: int = 2048):
+        self.samples = samples
+        self._lock = threading.Lock()
+        self._shapes = {}
+
+    def record(self, sql: str, seconds: float, calls: int = 1) -> None:
+        shape = statement_shape(sql)
+        with self._lock:
+            entry = self._shapes.get(shape)
+            if entry is None:
+                entry = self._shapes[shape] = {'count': 0, 'total': 0.0, 'max': 0.0,
+                                               'durations': deque(maxlen=self.samples)}
+            entry['total'] += seconds
+            if calls:
+                entry['count'] += calls
+                entry['max'] = max(entry['max'], seconds)
+                entry['durations'].append(seconds)
+            elif entry['durations']:
+                # time spent fetching rows belongs to the last execution of the statement
+                entry['durations'][-1] += seconds
+                entry['max'] = max(entry['max'], entry['durations'][-1])
+
+    def stats(self) -> list:
+        """one dict per statement shape, slowest total first, times are in seconds"""
+        with self._lock:
+            entries = [(shape, entry.copy(), sorted(entry['durations'])) for shape, entry in self._shapes.items()]
+        result = []
+        for shape, entry, durations in entries:
+            result.append({'sql': shape,
+                           'count': entry['count'],
+                           'total': entry['total'],
+                           'p50': durations[int(len(durations) * 0.50)] if durations else 0.0,
+                           'p95': durations[min(len(durations) - 1, int(len(durations) * 0.95))] if durations else 0.0,
+                           'max': entry['max']})
+        return sorted(result, key=lambda item: item['total'], reverse=True)
+
+    def report(self, top: int = 10) -> list:
+        """html lines for the Logger window"""
+        lines = []
+        for item in self.stats()[:top]:
+            lines.append(f'<span style="color:SlateGray">{item["count"]}x total {item["total"] * 1000:.1f}ms '
+                         f'p50 {item["p50"] * 1000:.2f}ms p95 {item["p95"] * 1000:.2f}ms '
+                         f'max {item["max"] * 1000:.2f}ms</span> {html.escape(item["sql"])}')
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+
 
 class Database(QObject):
-    def __init__(self, db_path):
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path, journal_mode='WAL', synchronous='NORMAL', timeout=10.0):
+        """
+        reads go through a connection owned by the calling thread, everything else
+        goes through one writer connection guarded by a lock.
+        journal_mode and synchronous are passed straight to the sqlite pragmas,
+        WAL + NORMAL only syncs at checkpoints instead of on every commit
+        """
         super().__init__()
         self.path = db_path
-        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self.timeout = timeout
+        self._db = self.connect()
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._readers = {}
+        self._readers_lock = threading.Lock()
+        self.profiler = None
+        self.set_pragmas(journal_mode=journal_mode, synchronous=synchronous)
+
+    def connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, check_same_thread=False, timeout=self.timeout,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+
+    @classmethod
+    def shared(cls, db_path, **kwargs: Any) -> 'Database':
+        """
+        one Database per file for the whole add-on,
+        later callers get the same instance with their pragmas applied
+        """
+        key = os.path.abspath(db_path)
+        with cls._shared_lock:
+            db = cls._shared.get(key)
+            if db is None:
+                db = cls._shared[key] = cls(db_path, **kwargs)
+            else:
+                db.set_pragmas(**{k: v for k, v in kwargs.items() if k in ('journal_mode', 'synchronous')})
+        return db
+
+    def set_pragmas(self, **pragmas: Any) -> None:
+        """db.set_pragmas(journal_mode='WAL', synchronous='NORMAL')"""
+        with self._write_lock:
+            for key, value in pragmas.items():
+                if value is not None:
+                    self._db.execute(f'pragma {key}={value}')
+
+    @property
+    def reader(self) -> sqlite3.Connection:
+        """connection of the current thread, created on first use"""
+        connection = getattr(self._local, 'db', None)
+        if connection is None:
+            connection = self.connect()
+            connection.execute('pragma query_only=1')
+            self._local.db = connection
+            with self._readers_lock:
+                self._close_dead_readers()
+                self._readers[threading.get_ident()] = connection
+        return connection
+
+    def _close_dead_readers(self) -> None:
+        alive = {thread.ident for thread in threading.enumerate()}
+        for ident in [ident for ident in self._readers if ident not in alive]:
+            self._readers.pop(ident).close()
+
+    def enable_profiling(self, samples: int = 2048) -> QueryProfiler:
+        """start timing statements, see QueryProfiler"""
+        if self.profiler is None:
+            self.profiler = QueryProfiler(samples)
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        self.profiler = None
 
     def execute(self, sql: str, *args: Any, **kwargs: Any) -> Cursor:
         sql = sql.strip()
-        if kwargs:
-            result = self._db.execute(sql, kwargs)
-        else:
-            result = self._db.execute(sql, args)
-        if re.match('insert|update|delete', sql.lower()):
-            self.commit()
+        parameters = kwargs if kwargs else args
+        if self.profiler is None:
+            return self._execute(sql, parameters)
+        start = time.perf_counter()
+        result = self._execute(sql, parameters)
+        self.profiler.record(sql, time.perf_counter() - start)
+        return result
+
+    def _execute(self, sql: str, parameters: Any) -> Cursor:
+        if sql[:6].lower() in READ_STATEMENTS and not getattr(self._local, 'depth', 0):
+            return self.reader.execute(sql, parameters)
+        with self._write_lock:
+            result = self._db.execute(sql, parameters)
+            if sql[:7].lower().startswith(WRITE_STATEMENTS):
+                self.autocommit()
         return result
 
     def executemany(self, sql: str, iterable: Any) -> None:
-        self._db.executemany(sql, [(item,) for item in iterable])
-        self.commit()
+        start = time.perf_counter()
+        with self._write_lock:
+            self._db.executemany(sql, [item if isinstance(item, (tuple, list)) else (item,) for item in iterable])
+            self.autocommit()
+        if self.profiler is not None:
+            self.profiler.record(sql, time.perf_counter() - start)
+
+    def _record_fetch(self, sql: str, start: float) -> None:
+        if self.profiler is not None:
+            self.profiler.record(sql.strip(), time.perf_counter() - start, calls=0)
+
+    @contextmanager
+    def transaction(self):
+        """
+        group writes into one commit, nested transactions join the outermost one.
+        the writer is held by the calling thread until the outermost one finishes
+        with db.transaction():
+            db.table('notes').insert(id=1, page_id=1)
+            db.table('log').insert(note_id=1, user_id=1)
+        """
+        with self._write_lock:
+            self._local.depth = self.transaction_depth + 1
+            try:
+                yield self
+            except BaseException:
+                self._local.depth -= 1
+                if not self._local.depth:
+                    self._db.rollback()
+                raise
+            else:
+                self._local.depth -= 1
+                if not self._local.depth:
+                    self.commit()
+
+    @property
+    def transaction_depth(self) -> int:
+        return getattr(self._local, 'depth', 0)
+
+    @property
+    def in_transaction(self) -> bool:
+        return self.transaction_depth > 0
+
+    def autocommit(self) -> None:
+        """commit unless a transaction is open"""
+        if not self.in_transaction:
+            self.commit()
+
+    @property
+    def version(self) -> int:
+        return self.fetchone('pragma user_version')[0]
+
+    def migrate(self, migrations: list = None) -> int:
+        """
+        bring the schema up to date in place, each version is applied in its own transaction
+        :return: the schema version after migrating
+        """
+        migrations = MIGRATIONS if migrations is None else migrations
+        with self._write_lock:
+            version = self.version
+            for number, migration in enumerate(migrations[version:], start=version + 1):
+                with self.transaction():
+                    if not self._db.in_transaction:
+                        self._db.execute('begin')
+                    if callable(migration):
+                        migration(self)
+                    else:
+                        for sql in migration:
+                            self.execute(sql)
+                    self.execute(f'pragma user_version={number}')
+                version = number
+        return version
 
     def create_table(self, table, **kwargs):
         table_string = ','.join([f'{key} {value}' for key, value in kwargs.items()])
@@ -34,8 +362,10 @@ class Database(QObject):
 
     def fetchone(self, sql: str, *args: Any, **kwargs: Any) -> Any:
         cursor = self.execute(sql, *args, **kwargs)
+        start = time.perf_counter()
         result = cursor.fetchone()
         cursor.close()
+        self._record_fetch(sql, start)
         return result
 
     def get(self, sql, *args: Any, **kwargs: Any) -> Any:
@@ -44,14 +374,32 @@ class Database(QObject):
 
     def fetchall(self, sql: str, *args: Any, **kwargs: Any) -> Any:
         cursor = self.execute(sql, *args, **kwargs)
+        start = time.perf_counter()
         result = cursor.fetchall()
         cursor.close()
+        self._record_fetch(sql, start)
         return result
 
+    def iter_fetch(self, sql: str, *args: Any, chunk_size: int = 500, **kwargs: Any):
+        """yield rows of a query, only chunk_size rows are held in memory at a time"""
+        cursor = self.execute(sql, *args, **kwargs)
+        try:
+            while rows := cursor.fetchmany(chunk_size):
+                yield from rows
+        finally:
+            cursor.close()
+
+    def iter_get(self, sql: str, *args: Any, **kwargs: Any):
+        """yield first items of a query, see iter_fetch"""
+        for row in self.iter_fetch(sql, *args, **kwargs):
+            yield row[0]
+
     def fetchmany(self, sql: str, size: int, *args: Any, **kwargs: Any) -> list:
         cursor = self.execute(sql, *args, **kwargs)
+        start = time.perf_counter()
         result = cursor.fetchmany(size)
         cursor.close()
+        self._record_fetch(sql, start)
         return result
 
     def table(self, name):
@@ -65,13 +413,20 @@ class Database(QObject):
         return result
 
     def cursor(self) -> Cursor:
-        return self._db.cursor()
+        return self.reader.cursor()
 
     def commit(self) -> None:
-        self._db.commit()
+        with self._write_lock:
+            self._db.commit()
 
     def close(self) -> None:
-        self._db.close()
+        with self._readers_lock:
+            for connection in self._readers.values():
+                connection.close()
+            self._readers.clear()
+        self._local = threading.local()
+        with self._write_lock:
+            self._db.close()
 
     class Table:
         def __init__(self, db, name):
@@ -81,25 +436,33 @@ class Database(QObject):
         def column(self, column):
             return Database.Table.Column(self, column)
 
-        def select(self, columns, *args, **kwargs):
-            columns_string = ", ".join(columns) if isinstance(columns, list) else columns
-            if not kwargs:
-                if not args:
-                    result = self.db.fetchall(f'select {columns_string} from {self.name} ')
-                else:
-                    result = self.db.fetchall(
-                        f'select {columns_string} from {self.name} where {" and ".join(args)}')
-            else:
-                condition = ''
-                for key, value in kwargs.items():
-                    if not condition:
-                        condition += f'{key}=?'
-                    else:
-                        condition += f'and {key}=?'
-                result = self.db.fetchall(
-                    f'select {columns_string} from {self.name} where {condition}', *kwargs.values())
+        def batch(self):
+            """
+            with db.table('urls').batch():
+                db.table('urls').insert(url='...')
+                db.table('urls').delete(id=3)
+            """
+            return self.db.transaction()
 
-            return result
+        def select_sql(self, columns, args=(), keys=(), order_by=None, limit=None) -> str:
+            """select statement of this table, keys become key=? placeholders"""
+            return build_sql('select', self.name, shape(columns), tuple(args), tuple(keys), order_by, limit is not None)
+
+        def select(self, columns, *args, order_by: str = None, limit: int = None, **kwargs):
+            """
+            db.table('urls').select(['id', 'url'], 'id>15', order_by='id desc', limit=10)
+            db.table('urls').select('id', url='...')
+            """
+            sql = self.select_sql(columns, args, kwargs.keys(), order_by, limit)
+            values = list(kwargs.values()) if limit is None else [*kwargs.values(), limit]
+            return self.db.fetchall(sql, *values)
+
+        def iter_select(self, columns, *args, order_by: str = None, limit: int = None, chunk_size: int = 500,
+                        **kwargs):
+            """same as select but yields rows, fetching chunk_size rows at a time"""
+            sql = self.select_sql(columns, args, kwargs.keys(), order_by, limit)
+            values = list(kwargs.values()) if limit is None else [*kwargs.values(), limit]
+            yield from self.db.iter_fetch(sql, *values, chunk_size=chunk_size)
 
         def get(self, columns: list or str, *args: Any, **kwargs: Any) -> list:
             """
@@ -111,10 +474,19 @@ class Database(QObject):
             items = [x[0] for x in result]
             return items
 
-        def getone(self, columns: list or str, *args: Any, **kwargs: Any) -> Any:
+        def iter_get(self, columns: list or str, *args: Any, **kwargs: Any):
+            """
+            yield first items of search result,
+            for url in db.table('urls').iter_get('url', order_by='id'): ...
+            """
+            for row in self.iter_select(columns, *args, **kwargs):
+                yield row[0]
+
+        def getone(self, columns: list or str, *args: Any, order_by: str = None, **kwargs: Any) -> Any:
             """get only one
             """
-            result = self.get(columns, *args, **kwargs)
+            sql = build_sql('select', self.name, shape(columns), args, tuple(kwargs), order_by, True)
+            result = self.db.fetchone(sql, *kwargs.values(), 1)
             if result:
                 return result[0]
             else:
@@ -123,9 +495,22 @@ class Database(QObject):
         def getmany(self, size, columns: list or str, *args: Any, **kwargs: Any) -> Any:
             """
             get specific number of items
+            db.table('urls').getmany(30, 'url', order_by='id')
+            """
+            return self.get(columns, *args, limit=size, **kwargs)
+
+        def lookup(self, key: str, value: str, keys: Any) -> dict:
             """
-            result = self.get(columns, *args, **kwargs)
-            return result[:size]
+            map key column onto value column for the given keys, one query per MAX_VARIABLES keys
+            db.table('urls').lookup('url', 'id', urls) -> {url: id}
+            """
+            keys = list(dict.fromkeys(keys))
+            result = {}
+            for start in range(0, len(keys), MAX_VARIABLES):
+                chunk = keys[start:start + MAX_VARIABLES]
+                condition = f'{key} in ({", ".join("?" * len(chunk))})'
+                result.update(self.db.fetchall(build_sql('select', self.name, (key, value), (condition,)), *chunk))
+            return result
 
         def insert(self, **kwargs):
             """
@@ -133,25 +518,58 @@ class Database(QObject):
             :param kwargs:
             :return:
             """
-            columns = kwargs.keys()
-            values = kwargs.values()
-            self.db.execute(
-                f'insert into {self.name} ({", ".join(columns)}) values ({", ".join(list("?" * len(values)))})',
-                *values)
+            self.db.execute(build_sql('insert', self.name, tuple(kwargs)), *kwargs.values())
 
-        def insertmany(self, columns, values):
+        def insertmany(self, columns, values, conflict=None):
             """
             db.table('name').insert('column', ['value1', 'value2'])
             db.table('name').insert(['col1', 'col2'], [('value1', 'value2'), ('value3', 'value4')]
+            db.table('users').insertmany('name', names, conflict='ignore')
             """
-            if isinstance(columns, list):
-                self.db.executemany(
-                    f'insert into {self.name} ({", ".join(columns)}) values ({", ".join(list("?" * len(columns)))})',
-                    values)
-            else:
-                self.db.executemany(
-                    f'insert into {self.name} ({columns}) values (?)',
-                    values)
+            self.db.executemany(build_sql('insert', self.name, shape(columns), conflict=conflict), values)
+
+        def upsert_many(self, columns, values, conflict_columns, update_columns=()) -> None:
+            """
+            insert rows in one prepared statement, rows clashing with a unique index on conflict_columns
+            are skipped, or have update_columns overwritten when given
+            db.table('urls').upsert_many('url', urls, ('url',))
+            db.table('notes').upsert_many(['id', 'page_id', 'audio_url'], rows, ('id',), ('page_id', 'audio_url'))
+            """
+            sql = build_sql('insert', self.name, shape(columns), upsert=tuple(conflict_columns), update=tuple(update_columns))
+            self.db.executemany(sql, values)
+
+        def insert_many_returning(self, columns, values, returning='id', conflict=None) -> list:
+            """
+            insert rows with multi-row statements and return the rows of the returning columns,
+            rows skipped by conflict='ignore' return nothing, and sqlite doesn't promise the order
+            so return the key column as well when rows have to be matched up
+            db.table('urls').insert_many_returning('url', urls, returning=['id', 'url'], conflict='ignore')
+            """
+            columns = shape(columns)
+            values = [row if isinstance(row, (tuple, list)) else (row,) for row in values]
+            columns_count = 1 if isinstance(columns, str) else len(columns)
+            returning = shape(returning)
+            result = []
+            with self.db.transaction():
+                if not RETURNING_SUPPORTED:
+                    return self._insert_returning_one_by_one(columns, values, returning, conflict)
+                chunk_size = max(1, MAX_VARIABLES // columns_count)
+                for start in range(0, len(values), chunk_size):
+                    chunk = values[start:start + chunk_size]
+                    sql = build_sql('insert', self.name, columns, conflict=conflict, rows=len(chunk),
+                                    returning=returning)
+                    result += self.db.fetchall(sql, *[value for row in chunk for value in row])
+            return result
+
+        def _insert_returning_one_by_one(self, columns, values, returning, conflict) -> list:
+            result = []
+            returning_string = returning if isinstance(returning, str) else ", ".join(returning)
+            for row in values:
+                cursor = self.db.execute(build_sql('insert', self.name, columns, conflict=conflict), *row)
+                if cursor.rowcount:
+                    result.append(self.db.fetchone(
+                        f'select {returning_string} from {self.name} where rowid=?', cursor.lastrowid))
+            return result
 
         def update(self, columns: Any, values: Any, new_values: Any) -> None:
             if isinstance(columns, list):
@@ -159,22 +577,17 @@ class Database(QObject):
                     new_values), "length of columns ,values and new values should be equal"
                 for n in range(len(columns)):
                     self.db.execute(
-                        f'update {self.name} set {columns[n]}=? where {columns[n]}=?', new_values[n], values[n])
+                        build_sql('update', self.name, (columns[n],), keys=(columns[n],)), new_values[n], values[n])
             else:
-                self.db.execute(
-                    f'update {self.name} set {columns}=? where {columns}=?', new_values, values)
+                self.db.execute(build_sql('update', self.name, (columns,), keys=(columns,)), new_values, values)
 
         def delete(self, *args, **kwargs) -> None:
-            if not args:
-                condition = ''
-                for key, value in kwargs.items():
-                    if not condition:
-                        condition += f'{key}=?'
-                    else:
-                        condition += f' and {key}=?'
-                self.db.execute(f'delete from {self.name} where {condition}', *kwargs.values())
-            else:
-                self.db.execute(f'delete from {self.name} where {" and ".join(args)}')
+            assert args or kwargs, "delete needs at least one condition"
+            self.db.execute(build_sql('delete', self.name, conditions=args, keys=tuple(kwargs)), *kwargs.values())
+
+        def deletemany(self, column: str, values: Any) -> None:
+            """db.table('log').deletemany('note_id', [1, 2, 3])"""
+            self.db.executemany(build_sql('delete', self.name, keys=(column,)), values)
 
         class Column:
             def __init__(self, table_instance, column):
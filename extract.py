@@ -0,0 +1,86 @@
+import html as html_module
+import re
+from collections import namedtuple
+
+# what TaskManager needs from an article page
+Article = namedtuple('Article', ['sections', 'words_list', 'audio_ids'])
+
+TOKEN_PATTERN = re.compile(
+    r'<!--.*?-->|<(/?)([a-zA-Z][\w:-]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>', re.DOTALL)
+RAW_TEXT_TAGS = {'script', 'style'}
+AUTOSKIP_PATTERN = re.compile(r'data-autoskip\s*=\s*(?:"1"|\'1\'|1(?![^\s/]))')
+VOICE_PATTERN = re.compile(r'voice_encode_fileid="(.*?)"')
+TAG_PATTERN = re.compile('<.+?>')
+WORD_PATTERN = re.compile(r'[（(]?\d+[.）)]\s*([ぁ-んァ-ンー\u4e00-\u9fff]+)[^ぁ-んァ-ンー\u4e00-\u9fff]')
+
+
+def words_in_hidden_section(raw: str) -> list:
+    """new words listed in a hidden section as (1)word"""
+    text = TAG_PATTERN.sub('', raw).replace('&nbsp;', ' ')
+    return WORD_PATTERN.findall(text)
+
+
+def extract_article(html: str) -> Article:
+    """
+    one pass over the tags of an article page, without building a tree, collecting
+        sections: text of every section[data-autoskip="1"] in document order
+        words_list: new words of every hidden (overflow: hidden) block that wraps a section,
+                    the text runs from the hidden tag to the first </section> after it
+        audio_ids: voice_encode_fileid of every audio player
+    """
+    sections = []
+    words_list = []
+    audio_ids = []
+    # one frame per open section: index in sections or None, and the text collected so far
+    open_sections = []
+    collecting = []
+    hidden_start = None
+    seen_section = False
+    text_start = 0
+
+    position = 0
+    while match := TOKEN_PATTERN.search(html, position):
+        if collecting and match.start() > text_start:
+            text = html_module.unescape(html[text_start:match.start()])
+            for parts in collecting:
+                parts.append(text)
+        position = text_start = match.end()
+        closing, tag, attrs = match.groups()
+        if tag is None:
+            continue
+        tag = tag.lower()
+
+        if not closing:
+            if 'voice_encode_fileid' in attrs:
+                audio_ids.extend(VOICE_PATTERN.findall(attrs))
+            if tag == 'section':
+                seen_section = True
+                if AUTOSKIP_PATTERN.search(attrs):
+                    sections.append(None)
+                    parts = []
+                    collecting.append(parts)
+                    open_sections.append((len(sections) - 1, parts))
+                else:
+                    open_sections.append((None, None))
+            if hidden_start is None and seen_section and 'overflow: hidden' in attrs:
+                hidden_start = match.end()
+            if tag in RAW_TEXT_TAGS and not attrs.rstrip().endswith('/'):
+                end = html.find(f'</{tag}', match.end())
+                position = text_start = len(html) if end == -1 else end
+        elif tag == 'section':
+            if hidden_start is not None:
+                raw = html[hidden_start:match.start()]
+                if 'section' in raw:
+                    words_list.append(words_in_hidden_section(raw))
+                hidden_start = None
+            if open_sections:
+                index, parts = open_sections.pop()
+                if index is not None:
+                    sections[index] = ''.join(parts)
+                    collecting.remove(parts)
+
+    # sections left open by broken markup keep what they collected
+    for index, parts in open_sections:
+        if index is not None:
+            sections[index] = ''.join(parts)
+    return Article(sections, words_list, audio_ids)
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import re
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+SOUND = re.compile(r'\[sound:([^\]]+)\]')
+UNSAFE = re.compile(r'[^A-Za-z0-9_-]')
+# bytes hashed at a time, clips are never read into memory whole
+CHUNK_SIZE = 64 * 1024
+PROGRESS_EVERY = 500
+
+
+def media_id(audio_url: str) -> Optional[str]:
+    """WeChat mediaid of an audio link, None for links without one"""
+    ids = parse_qs(urlsplit(audio_url).query).get('mediaid')
+    return ids[0] if ids and ids[0] else None
+
+
+def audio_filename(audio_url: str) -> str:
+    """
+    media file name of an audio link, named after its mediaid so the same clip is stored once
+    however many articles or imports use it, links without a mediaid get a name of their own
+    """
+    if mediaid := media_id(audio_url):
+        return f'nhknews_{UNSAFE.sub("_", mediaid)}.mp3'
+    return uuid4().hex + '.mp3'
+
+
+def file_hash(path: str) -> str:
+    """sha1 of a file's content"""
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def dedupe_audio(col, db, progress=None) -> tuple:
+    """
+    point every nhknews note at the media file named after its mediaid and drop the copies it leaves unused,
+    a file is renamed when the mediaid one doesn't exist yet, and kept when its content differs from it.
+    fields are read straight from the notes table, only notes that change are loaded and updated.
+    the content hash of every note's audio not recorded yet is stored in notes.AUDIO_HASH
+    :param progress: called with a message every PROGRESS_EVERY notes or files
+    :return: (notes changed, files removed)
+    """
+    progress = progress or (lambda message: None)
+    model = col.models.by_name('nhknews')
+    if not model:
+        return 0, 0
+    field_index = {field['name']: field['ord'] for field in model['flds']}
+    sound_index, audio_url_index = field_index['Pronunciation'], field_index['AudioUrl']
+    media_dir = col.media.dir()
+    hashes = {}
+
+    def content_hash(name):
+        if name not in hashes:
+            path = os.path.join(media_dir, name)
+            hashes[name] = file_hash(path) if os.path.exists(path) else None
+        return hashes[name]
+
+    rows = col.db.all('select id, flds from notes where mid=?', model['id'])
+    # note id: file its sound tag refers to once the pass is done
+    filenames = {}
+    renamed = {}
+    stale = set()
+    for n, (nid, flds) in enumerate(rows, start=1):
+        if n % PROGRESS_EVERY == 0:
+            progress(f'Checked {n}/{len(rows)} notes')
+        fields = flds.split('\x1f')
+        if not (match := SOUND.search(fields[sound_index])):
+            continue
+        current = filenames[nid] = match.group(1)
+        if not media_id(fields[audio_url_index]):
+            continue
+        target = audio_filename(fields[audio_url_index])
+        current_path, target_path = os.path.join(media_dir, current), os.path.join(media_dir, target)
+        if current == target or not (os.path.exists(current_path) or os.path.exists(target_path)):
+            continue
+        if not os.path.exists(target_path):
+            os.replace(current_path, target_path)
+            if current in hashes:
+                hashes[target] = hashes.pop(current)
+        elif os.path.exists(current_path):
+            if content_hash(current) != content_hash(target):
+                continue
+            stale.add(current)
+        renamed[nid] = (current, target)
+        filenames[nid] = target
+
+    notes = []
+    for nid, (current, target) in renamed.items():
+        note = col.get_note(nid)
+        note['Pronunciation'] = note['Pronunciation'].replace(f'[sound:{current}]', f'[sound:{target}]')
+        notes.append(note)
+    if notes:
+        col.update_notes(notes)
+
+    # a copy is only dropped once no nhknews note refers to it any more
+    removable = sorted(name for name in stale - set(filenames.values())
+                       if os.path.exists(os.path.join(media_dir, name)))
+    if removable:
+        col.media.trash_files(removable)
+
+    recorded = set(db.get('select ID from notes where AUDIO_HASH is not null'))
+    to_hash = [(nid, name) for nid, name in filenames.items() if nid not in recorded or nid in renamed]
+    hash_rows = []
+    for n, (nid, name) in enumerate(to_hash, start=1):
+        if n % PROGRESS_EVERY == 0:
+            progress(f'Hashed audio of {n}/{len(to_hash)} notes')
+        if value := content_hash(name):
+            hash_rows.append((value, nid))
+    with db.transaction():
+        db.executemany('update notes set AUDIO_HASH=? where ID=?', hash_rows)
+    return len(notes), len(removable)
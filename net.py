@@ -0,0 +1,231 @@
+import errno
+import hashlib
+import os
+import shutil
+import threading
+import time
+from typing import Optional
+from uuid import uuid4
+
+import requests
+from requests import RequestException  # noqa: F401, re-exported for callers
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+try:
+    from .cache import ResponseCache
+except ImportError:
+    from cache import ResponseCache
+
+USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) '
+              'Chrome/101.0.4951.64 Safari/537.36')
+# (connect, read) seconds
+TIMEOUT = (5, 30)
+# connections kept alive per host, enough for the crawler, the task pool and the title workers together
+POOL_SIZE = 32
+
+# article pages don't change once published, they are served from the cache for this many seconds
+ARTICLE_FRESHNESS = 7 * 24 * 3600
+
+# bytes read from a download stream at a time, all that is held in memory per download
+CHUNK_SIZE = 64 * 1024
+
+_session = None
+_session_lock = threading.Lock()
+_cache = None
+# partial files a download is writing right now
+_partials = set()
+_partial_lock = threading.Lock()
+
+
+def session() -> requests.Session:
+    """
+    the session every fetcher of the add-on goes through,
+    keeps connections alive per host so handshakes are paid once
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def create_session() -> requests.Session:
+    new_session = requests.Session()
+    new_session.headers.update({'User-Agent': USER_AGENT,
+                                'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']})
+    retry = Retry(total=2, connect=2, read=1, backoff_factor=0.3,
+                  status_forcelist=(500, 502, 503, 504), allowed_methods=('GET', 'HEAD'))
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=POOL_SIZE, max_retries=retry)
+    new_session.mount('https://', adapter)
+    new_session.mount('http://', adapter)
+    return new_session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """net.get(url) -> response, same arguments as requests.get with a default timeout"""
+    kwargs.setdefault('timeout', TIMEOUT)
+    return session().get(url, **kwargs)
+
+
+def response_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        with _session_lock:
+            if _cache is None:
+                _cache = ResponseCache(os.path.join(os.path.dirname(__file__), 'user_files', 'http_cache'))
+    return _cache
+
+
+def get_text(url: str, fresh: float = 0, **kwargs):
+    """
+    text of a page or None when the server doesn't answer 200,
+    cached pages younger than fresh seconds are served from disk, older ones are revalidated
+    with If-None-Match/If-Modified-Since and served from disk when the server answers 304
+    """
+    cache = response_cache()
+    cached = cache.get(url)
+    if cached:
+        meta, text = cached
+        if time.time() - meta['stored_at'] < fresh:
+            return text
+        headers = kwargs.setdefault('headers', {})
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+    res = get(url, **kwargs)
+    if res.status_code == 304 and cached:
+        cache.touch(url)
+        return cached[1]
+    if res.status_code != 200:
+        return None
+    cache.put(url, res.text, res.headers.get('ETag'), res.headers.get('Last-Modified'))
+    return res.text
+
+
+def partial_path(url: str) -> str:
+    """where the unfinished download of url is kept, so a later run picks it up whatever it is saved as"""
+    folder = os.path.join(os.path.dirname(__file__), 'user_files', 'partial')
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.part')
+
+
+def claim_partial(url: str) -> str:
+    """
+    partial_path of url for one download at a time,
+    a second download of the same url meanwhile gets a file of its own that is not resumed
+    """
+    part = partial_path(url)
+    with _partial_lock:
+        if part not in _partials:
+            _partials.add(part)
+            return part
+    return f'{part[:-len(".part")]}-{uuid4().hex}.part'
+
+
+def release_partial(part: str) -> None:
+    """end the claim, a private partial file left over can't be resumed and is removed"""
+    with _partial_lock:
+        if part in _partials:
+            _partials.remove(part)
+            return
+    if os.path.exists(part):
+        os.remove(part)
+
+
+def partial_size(part: str) -> int:
+    return os.path.getsize(part) if os.path.exists(part) else 0
+
+
+def download_headers(part: str) -> dict:
+    """
+    headers of a download into part, identity encoding keeps the bytes written the same bytes
+    the server counts Range offsets in, Range asks for what part is missing when it has bytes to resume from
+    """
+    headers = {'Accept-Encoding': 'identity'}
+    if offset := partial_size(part):
+        headers['Range'] = f'bytes={offset}-'
+    return headers
+
+
+def content_total(headers) -> Optional[int]:
+    """size of the whole file from Content-Range, bytes a-b/N or bytes */N, None when it isn't given"""
+    total = headers.get('Content-Range', '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+
+
+def download_mode(status: int, headers, part: str) -> Optional[str]:
+    """
+    how a response to download_headers(part) is stored, 'ab' continues part, 'wb' starts it over,
+    'complete' means part already holds the whole file and None that the response can't be used.
+    a partial file the server doesn't answer for is removed, so the next download starts from scratch
+    """
+    offset = partial_size(part)
+    if status == 200:
+        return 'wb'
+    if status == 206 and offset and headers.get('Content-Range', '').startswith(f'bytes {offset}-'):
+        return 'ab'
+    if status == 416 and offset and content_total(headers) == offset:
+        return 'complete'
+    if status in (206, 416) and os.path.exists(part):
+        os.remove(part)
+    return None
+
+
+def expected_size(status: int, headers) -> Optional[int]:
+    """size part should have once the body is written, None when the response doesn't tell"""
+    if status == 206:
+        return content_total(headers)
+    length = headers.get('Content-Length', '')
+    return int(length) if length.isdigit() else None
+
+
+def finish_download(part: str, path: str) -> None:
+    """move a finished partial file to path in one step, readers of path never see half a file"""
+    try:
+        os.replace(part, path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # another file system, copy next to path first so the last step is still a rename
+        temporary = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.tmp')
+        shutil.copyfile(part, temporary)
+        os.replace(temporary, path)
+        os.remove(part)
+
+
+def download(url: str, path: str, chunk_size: int = CHUNK_SIZE, **kwargs) -> bool:
+    """
+    stream url into path chunk by chunk, False when the server doesn't answer with the file.
+    the body goes to a partial file first, an interrupted download leaves it behind and the next call
+    asks only for the missing bytes with a Range request. path only ever gets a file of the full size
+    """
+    part = claim_partial(url)
+    try:
+        kwargs.setdefault('headers', {}).update(download_headers(part))
+        with get(url, stream=True, **kwargs) as res:
+            mode = download_mode(res.status_code, res.headers, part)
+            if mode is None:
+                return False
+            if mode != 'complete':
+                with open(part, mode) as f:
+                    for chunk in res.iter_content(chunk_size):
+                        f.write(chunk)
+                size = expected_size(res.status_code, res.headers)
+                if size is not None and partial_size(part) != size:
+                    # cut short, what arrived is kept for the next call to resume
+                    return False
+        finish_download(part, path)
+        return True
+    finally:
+        release_partial(part)
+
+
+def close() -> None:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -2,11 +2,12 @@ from PyQt6.QtCore import QThread
 
 from aqt import mw
 from aqt.qt import *
-from aqt import ProfileManager
+from aqt import gui_hooks
 
-from .workers import UrlWorker, TaskManager
+from .workers import AudioDeduper, UrlWorker, TaskManager
 from .deck import DeckDialog
 from .log import Logger
+from . import aionet, parsers
 from .db import Database
 from .download import DownloadWindow
 
@@ -26,6 +27,8 @@ class NHK(QObject):
         self.download_window = None
         self.scrap = None
         self.scrap_thread = None
+        self.audio_deduper = None
+        self.dedupe_thread = None
         self.logger = Logger()
         self.nhknews_deck_name = None
         self.addon_folder = os.path.dirname(__file__)
@@ -44,56 +47,18 @@ class NHK(QObject):
         self.init_task_manager()
 
     def init_db(self):
-        table_names = ['urls', 'notes', 'users', 'log']
-        for name in table_names:
-            self.create_table(name)
-
-        pm = ProfileManager()
-        pm.setupMeta()
-        user_names = pm.profiles()
-        for username in user_names:
-            self.db.table('users').insert(name=username)
-
-    def create_table(self, name):
-        if name == 'urls':
-            self.db.create_table(name,
-                                 ID='INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL',
-                                 URL='TEXT',
-                                 TITLE='TEXT')
-        elif name == 'notes':
-            self.db.create_table(name,
-                                 ID='INTEGER PRIMARY KEY NOT NULL',
-                                 PAGE_ID='INTEGER',
-                                 AUDIO_URL='TEXT'
-                                 )
-
-        elif name == 'users':
-            self.db.create_table(name,
-                                 ID='INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL',
-                                 NAME='TEXT')
-        elif name == 'log':
-            self.db.create_table(name,
-                                 NOTE_ID='INTEGER',
-                                 USER_ID='INTEGER')
-
-    def table_exists(self, name: str) -> bool:
-        """check if a table exists in database"""
-        return name in self.db.tables
-
-    def check_db(self):
-        """check if table exists"""
-        for table_name in ['urls', 'notes', 'users', 'log']:
-            if not self.table_exists(table_name):
-                self.create_table(table_name)
+        """bring database schema up to date and record anki profiles"""
+        self.db.migrate()
+        # the profile manager anki already has open, a new one would open prefs21.db again
+        self.db.table('users').insertmany('name', self.mw.pm.profiles(), conflict='ignore')
 
     def check_setting(self):
-        # init database if db not exists
-        if not self.db:
-            self.db = Database(self.db_path)
-            self.init_db()
-        else:
-            self.db = Database(self.db_path)
-            self.check_db()
+        config = mw.addonManager.getConfig(__name__) or {}
+        self.db = Database.shared(self.db_path, synchronous=config.get('db_synchronous', 'NORMAL'))
+        if config.get('profile_db'):
+            self.db.enable_profiling()
+        parsers.use(config.get('html_parser'))
+        self.init_db()
 
         # prepare nhknews model
         nhknews_model = mw.col.models.by_name('nhknews')
@@ -157,8 +122,36 @@ class NHK(QObject):
         self.task_manager.moveToThread(self.task_thread)
         self.task_manager.message_signal.connect(self.logger.update_message)
         self.task_manager.all_tasks_finished_signal.connect(self.logger.scroll_to_bottom)
+        self.task_manager.all_tasks_finished_signal.connect(self.report_db_profile)
+        gui_hooks.profile_will_close.append(self.task_manager.recorder.close)
+        gui_hooks.profile_will_close.append(aionet.close)
         self.task_thread.start()
 
+    def dedupe_audio(self):
+        """rename nhknews audio after its mediaid and drop the duplicate copies of earlier imports"""
+        if self.dedupe_thread is not None and self.dedupe_thread.isRunning():
+            return
+        if self.db is None:
+            config = mw.addonManager.getConfig(__name__) or {}
+            self.db = Database.shared(self.db_path, synchronous=config.get('db_synchronous', 'NORMAL'))
+            self.init_db()
+        self.audio_deduper = AudioDeduper()
+        self.dedupe_thread = QThread()
+        self.audio_deduper.moveToThread(self.dedupe_thread)
+        self.dedupe_thread.started.connect(self.audio_deduper.run)
+        self.audio_deduper.message_signal.connect(self.logger.update_message)
+        self.audio_deduper.finished_signal.connect(self.dedupe_thread.quit)
+        self.logger.show()
+        self.dedupe_thread.start()
+
+    def report_db_profile(self):
+        """write the slowest statements into the logger when profile_db is set in config"""
+        if self.db and self.db.profiler:
+            self.logger.update_message('<b>Database statements by total time</b>')
+            for line in self.db.profiler.report():
+                self.logger.update_message(line)
+            self.db.profiler.reset()
+
     def set_urls(self):
         task_number = self.download_window.spinBox.value()
         urls = self.url_worker.urls_to_handle[:task_number]
@@ -186,7 +179,7 @@ class NHK(QObject):
             self.download_window.download_button.clicked.connect(self.logger.show)
             self.download_window.download_button.clicked.connect(self.set_urls)
 
-            self.logger.download_more_button.clicked.connect(self.url_worker.run)
+            self.logger.download_more_button.clicked.connect(self.url_worker.download_more)
 
             self.url_thread.start()
         else:
@@ -0,0 +1,126 @@
+from collections import namedtuple
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxHTMLParser
+except ImportError:
+    try:
+        # selectolax before 1.0 only has the modest backend
+        from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+    except ImportError:
+        SelectolaxHTMLParser = None
+
+# what callers get back from every backend, text of all descendants and the attributes of the tag
+Element = namedtuple('Element', ['text', 'attrs'])
+
+
+class Parser:
+    """
+    a backend finds tags by name and attributes, attribute value True only asks for the attribute to be present
+    parser.find_all(html, 'section', **{'data-autoskip': '1'})
+    """
+    name = None
+
+    @staticmethod
+    def available() -> bool:
+        return False
+
+    def find_all(self, html: str, tag: str, **attrs) -> list:
+        raise NotImplementedError
+
+    @staticmethod
+    def matches(element_attrs: dict, attrs: dict) -> bool:
+        for key, value in attrs.items():
+            if key not in element_attrs:
+                return False
+            if value is not True and element_attrs[key] != value:
+                return False
+        return True
+
+
+class HtmlParser(Parser):
+    """BeautifulSoup on the standard library parser, always there but the slowest"""
+    name = 'html.parser'
+
+    @staticmethod
+    def available() -> bool:
+        return BeautifulSoup is not None
+
+    def find_all(self, html: str, tag: str, **attrs) -> list:
+        soup = BeautifulSoup(html, 'html.parser')
+        return [Element(element.text, dict(element.attrs)) for element in soup.find_all(tag, attrs=attrs)]
+
+
+class LxmlParser(Parser):
+    """lxml's C parser, no BeautifulSoup tree on top"""
+    name = 'lxml'
+
+    @staticmethod
+    def available() -> bool:
+        return lxml is not None
+
+    def find_all(self, html: str, tag: str, **attrs) -> list:
+        root = lxml.html.document_fromstring(html)
+        return [Element(element.text_content(), dict(element.attrib))
+                for element in root.iter(tag) if self.matches(element.attrib, attrs)]
+
+
+class SelectolaxParser(Parser):
+    """selectolax, css selectors evaluated in C"""
+    name = 'selectolax'
+
+    @staticmethod
+    def available() -> bool:
+        return SelectolaxHTMLParser is not None
+
+    def find_all(self, html: str, tag: str, **attrs) -> list:
+        selector = tag + ''.join(f'[{key}]' if value is True else f'[{key}="{value}"]' for key, value in attrs.items())
+        return [Element(node.text(deep=True), dict(node.attributes))
+                for node in SelectolaxHTMLParser(html).css(selector)]
+
+
+BACKENDS = {backend.name: backend for backend in (SelectolaxParser, LxmlParser, HtmlParser)}
+# fastest first
+PREFERENCE = ['selectolax', 'lxml', 'html.parser']
+
+_parser = None
+
+
+def get_parser(name: str = None) -> Parser:
+    """backend called name, or the fastest available one when it isn't installed"""
+    names = [name] + PREFERENCE if name else PREFERENCE
+    for backend_name in names:
+        backend = BACKENDS.get(backend_name)
+        if backend and backend.available():
+            return backend()
+    raise ImportError('no html parser available, install beautifulsoup4')
+
+
+def use(name: str = None) -> Parser:
+    """set the backend used by find_all"""
+    global _parser
+    _parser = get_parser(name)
+    return _parser
+
+
+def find_all(html: str, tag: str, **attrs) -> list:
+    """
+    find tags with the chosen backend, falling back to html.parser if it fails on a page
+    parsers.find_all(html, 'li', **{'data-title': True}) -> [Element(text, attrs), ...]
+    """
+    if not html:
+        return []
+    parser = _parser or use()
+    try:
+        return parser.find_all(html, tag, **attrs)
+    except Exception:
+        if parser.name == HtmlParser.name:
+            raise
+        return HtmlParser().find_all(html, tag, **attrs)
@@ -0,0 +1,166 @@
+import queue
+import threading
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+_STOP = object()
+
+
+class Stage:
+    """
+    one step of a Pipeline, workers threads take items from a bounded queue and hand every item
+    the handler returns (it returns an iterable, empty to drop the item) to the next stage
+    """
+
+    def __init__(self, name, handler, workers=1, max_queued=100):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue = queue.Queue(maxsize=max_queued)
+        self.next = None
+        self.threads = []
+        self.lock = threading.Lock()
+        self.processed = 0
+        self.busy = 0
+        self.busy_seconds = 0.0
+        self.max_depth = 0
+        self.started = None
+
+    def put(self, item):
+        """blocks while the stage is full, that is what keeps a fast stage from running ahead"""
+        self.queue.put(item)
+        with self.lock:
+            self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def stats(self) -> dict:
+        with self.lock:
+            elapsed = time.perf_counter() - self.started if self.started else 0.0
+            return {
+                'stage': self.name,
+                'workers': self.workers,
+                'busy': self.busy,
+                'queued': self.queue.qsize(),
+                'max_queued': self.max_depth,
+                'processed': self.processed,
+                'per_second': self.processed / elapsed if elapsed else 0.0,
+                'busy_seconds': self.busy_seconds,
+            }
+
+
+class AsyncStage(Stage):
+    """
+    a stage whose handler is a coroutine function run on the event loop of engine,
+    workers is how many items are in flight at once instead of a number of threads
+    """
+
+    def __init__(self, name, handler, engine, workers=100, max_queued=100):
+        super().__init__(name, handler, workers, max_queued)
+        self.engine = engine
+
+
+class Pipeline(QObject):
+    """
+    stages connected by bounded queues, each with its own worker threads so network, cpu and
+    collection bound work overlap, a failing item is reported with error_signal and dropped
+    """
+    error_signal = pyqtSignal(str, object, str)
+
+    def __init__(self, stages: list):
+        super().__init__()
+        self.stages = stages
+        for stage, next_stage in zip(stages, stages[1:]):
+            stage.next = next_stage
+
+    def start(self):
+        for stage in self.stages:
+            stage.started = time.perf_counter()
+            if isinstance(stage, AsyncStage):
+                stage.threads = [threading.Thread(target=self._run_async, args=(stage,), name=stage.name, daemon=True)]
+            else:
+                stage.threads = [threading.Thread(target=self._run, args=(stage,), name=f'{stage.name}-{n}',
+                                                  daemon=True) for n in range(stage.workers)]
+            for thread in stage.threads:
+                thread.start()
+
+    def put(self, item):
+        self.stages[0].put(item)
+
+    def join(self):
+        """no more items, wait until every stage has drained and stop the threads"""
+        for stage in self.stages:
+            for _ in stage.threads:
+                stage.queue.put(_STOP)
+            for thread in stage.threads:
+                thread.join()
+            stage.threads = []
+
+    def stats(self) -> list:
+        return [stage.stats() for stage in self.stages]
+
+    def depths(self) -> str:
+        """queue depth of every stage, short enough for a progress message"""
+        return ' → '.join(f'{stage.name} {stage.queue.qsize()}' for stage in self.stages)
+
+    def report(self) -> str:
+        rows = ''.join(
+            f'<tr><td>{s["stage"]}</td><td>{s["workers"]}</td><td>{s["processed"]}</td>'
+            f'<td>{s["per_second"]:.1f}</td><td>{s["max_queued"]}</td><td>{s["busy_seconds"]:.1f}</td></tr>'
+            for s in self.stats())
+        return ('<table><tr><th>stage</th><th>workers</th><th>items</th><th>items/s</th><th>max queued</th>'
+                f'<th>busy s</th></tr>{rows}</table>')
+
+    def _run(self, stage):
+        while (item := stage.queue.get()) is not _STOP:
+            with stage.lock:
+                stage.busy += 1
+            start = time.perf_counter()
+            try:
+                results = list(stage.handler(item) or ())
+            except Exception as e:
+                results = []
+                self.error_signal.emit(stage.name, item, f'{type(e).__name__}: {e}')
+            self._finish(stage, start, results)
+
+    def _run_async(self, stage):
+        """
+        submits items to the event loop while fewer than stage.workers are in flight,
+        finished ones are handed on by a second thread so a full next stage never blocks the loop
+        """
+        slots = threading.BoundedSemaphore(stage.workers)
+        finished = queue.Queue()
+
+        def forward():
+            while (done := finished.get()) is not _STOP:
+                item, future, start = done
+                try:
+                    results = list(future.result() or ())
+                except Exception as e:
+                    results = []
+                    self.error_signal.emit(stage.name, item, f'{type(e).__name__}: {e}')
+                self._finish(stage, start, results)
+                slots.release()
+
+        forwarder = threading.Thread(target=forward, name=f'{stage.name}-forward', daemon=True)
+        forwarder.start()
+        while (item := stage.queue.get()) is not _STOP:
+            slots.acquire()
+            with stage.lock:
+                stage.busy += 1
+            start = time.perf_counter()
+            future = stage.engine.submit(stage.handler(item))
+            future.add_done_callback(lambda f, item=item, start=start: finished.put((item, f, start)))
+        # every slot back means nothing is in flight any more
+        for _ in range(stage.workers):
+            slots.acquire()
+        finished.put(_STOP)
+        forwarder.join()
+
+    def _finish(self, stage, start, results):
+        with stage.lock:
+            stage.busy -= 1
+            stage.processed += 1
+            stage.busy_seconds += time.perf_counter() - start
+        if stage.next is not None:
+            for result in results:
+                stage.next.put(result)
@@ -0,0 +1,112 @@
+import queue
+import random
+import threading
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .urlkeys import lookup_page_ids
+
+_FLUSH = object()
+_STOP = object()
+
+
+class NoteRecorder(QObject):
+    """
+    write-behind recorder for notes and log rows,
+    put() only queues the record, one writer thread stores them in batches of batch_size
+    or after interval seconds, whichever comes first
+    """
+    message_signal = pyqtSignal(str)
+
+    def __init__(self, db, batch_size=50, interval=1.0, max_pending=1000):
+        super().__init__()
+        self.db = db
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._user_ids = {}
+
+    def start(self):
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='note-recorder', daemon=True)
+                self._thread.start()
+
+    def put(self, note_id, page_url, audio_url, user, audio_hash=None):
+        """queue one note, blocks only when max_pending records are waiting"""
+        self.start()
+        self.queue.put((note_id, page_url, audio_url, audio_hash, user))
+
+    def flush(self):
+        """write everything queued so far and wait until it is stored"""
+        if self._thread is None:
+            return
+        self.queue.put(_FLUSH)
+        self.queue.join()
+
+    def close(self):
+        """flush and stop the writer thread"""
+        if self._thread is None:
+            return
+        self.queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _FLUSH or item is _STOP:
+                self._write(batch)
+                batch = []
+                self.queue.task_done()
+                if item is _STOP:
+                    break
+                continue
+
+            if item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.interval
+                batch.append(item)
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch):
+        """store a batch in one transaction, then mark its records done"""
+        if not batch:
+            return
+        try:
+            page_ids = lookup_page_ids(self.db.table('urls'), [page_url for _, page_url, *_ in batch])
+            for user in {user for *_, user in batch}:
+                if user not in self._user_ids:
+                    self._user_ids[user] = self.db.table('users').getone('id', name=user)
+            with self.db.transaction():
+                self.db.table('notes').upsert_many(
+                    ['id', 'page_id', 'audio_url', 'audio_hash'],
+                    [(note_id, page_ids.get(page_url), audio_url, audio_hash)
+                     for note_id, page_url, audio_url, audio_hash, _ in batch],
+                    ('id',), ('page_id', 'audio_url', 'audio_hash'))
+                self.db.table('log').upsert_many(
+                    ['note_id', 'user_id'],
+                    [(note_id, self._user_ids[user]) for note_id, *_, user in batch],
+                    ('note_id', 'user_id'))
+        except Exception as e:
+            self.message_signal.emit(f'<span style="color:salmon">Recording {len(batch)} notes failed: {e}</span>')
+        else:
+            for note_id, *_, user in batch:
+                color = f'#{random.randint(0, 2 ** 24 - 1):06x}'
+                self.message_signal.emit(
+                    f'Wrote Card ID <b style="color:{color}">{note_id}</b> info for User <b style="color:{color}">{user}</b> into database')
+        finally:
+            for _ in batch:
+                self.queue.task_done()
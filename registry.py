@@ -0,0 +1,41 @@
+from typing import Callable, Iterable
+
+
+class UrlRegistry:
+    """
+    ordered set of urls, keeps insertion order for display and checks membership in O(1)
+    registry = UrlRegistry(urls)
+    if registry.add(url): ...  # url was not seen before
+    """
+
+    def __init__(self, urls: Iterable[str] = (), key: Callable[[str], object] = None):
+        self.key = key or (lambda url: url)
+        self._urls = {}
+        self.update(urls)
+
+    def add(self, url: str) -> bool:
+        """add url, return False if it was already registered"""
+        key = self.key(url)
+        if key in self._urls:
+            return False
+        self._urls[key] = url
+        return True
+
+    def update(self, urls: Iterable[str]) -> list:
+        """add urls, return the ones that were new"""
+        return [url for url in urls if self.add(url)]
+
+    def discard(self, url: str) -> None:
+        self._urls.pop(self.key(url), None)
+
+    def __contains__(self, url: str) -> bool:
+        return self.key(url) in self._urls
+
+    def __iter__(self):
+        return iter(self._urls.values())
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __repr__(self) -> str:
+        return f'UrlRegistry({len(self)} urls)'
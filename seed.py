@@ -0,0 +1,36 @@
+import gzip
+import os
+
+try:
+    from .urlkeys import article_id, canonical_url
+except ImportError:
+    from urlkeys import article_id, canonical_url
+
+# news pages published before 2022-06-05, one "mid idx sn" line per article under a "__biz" header line
+SEED_FILE = os.path.join(os.path.dirname(__file__), 'seed_urls.gz')
+
+
+def load_seed_urls(path: str = SEED_FILE) -> list:
+    """canonical links of the seed articles, newest first"""
+    with gzip.open(path, 'rt', encoding='ascii') as f:
+        biz = f.readline().strip()
+        urls = []
+        for line in f:
+            mid, idx, sn = line.split()
+            urls.append(f'https://mp.weixin.qq.com/s?__biz={biz}&mid={mid}&idx={idx}&sn={sn}')
+    return urls
+
+
+def write_seed_urls(urls: list, path: str = SEED_FILE) -> None:
+    """write links of one account into a seed file, links are stored without share tokens"""
+    lines = []
+    biz = None
+    for url in urls:
+        identity = article_id(url)
+        assert identity, f'{url} is not an article link'
+        assert biz in (None, identity[0]), 'seed links should come from one account'
+        biz, mid, idx = identity
+        sn = canonical_url(url).partition('&sn=')[2]
+        lines.append(f'{mid} {idx} {sn}')
+    with gzip.GzipFile(path, 'wb', mtime=0) as f:
+        f.write('\n'.join([biz] + lines).encode('ascii') + b'\n')
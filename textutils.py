@@ -0,0 +1,133 @@
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+KANA = 'ぁ-んァ-ンー'
+KANA_CODE_POINTS = [*range(ord('ぁ'), ord('ん') + 1), *range(ord('ァ'), ord('ン') + 1), ord('ー')]
+# every run of kana collapses into one KANA_MARK, sentences are joined with '\n' which is never a kana
+KANA_MARK = '\x00'
+# below this many characters a batch is classified without numpy, setting up the arrays costs more than it saves
+NUMPY_THRESHOLD = 4096
+KANA_RUN = re.compile(f'[{KANA}]+')
+ONLY_KANA = re.compile(f'[{KANA}]*')
+BRACKETED_NUMBER = re.compile(r'[(（]\s*(\d+)\s*[)）]')
+SENTENCE_END = re.compile(r'(。」|。”|。)')
+# everything from the first of these headings on is not part of the news
+UNWANTED_PARTS = re.compile('生词|背景知识|単語|单词')
+
+if np is not None:
+    IS_KANA = np.zeros(0x10000, dtype=bool)
+    IS_KANA[KANA_CODE_POINTS] = True
+
+
+def is_jp(p: str) -> bool:
+    """Check if text is japanese"""
+    # if there are at least two blocks of kana return true
+    runs = KANA_RUN.finditer(p)
+    if next(runs, None) and next(runs, None):
+        return True
+    # if all are kana return true
+    return ONLY_KANA.fullmatch(p, 1, max(1, len(p) - 1)) is not None
+
+
+def is_replaceable(text: str) -> bool:
+    """check if there are brackets and digits in the text to be replaced"""
+    return BRACKETED_NUMBER.search(text) is not None
+
+
+def remove_certain_text(text: str) -> str:
+    """Get rid of some unwanted text"""
+    if match := UNWANTED_PARTS.search(text):
+        return text[:match.start()]
+    return text
+
+
+def replace_brackets_with_words(jp: str, words: list) -> str:
+    """replace (n) in text with the nth word, in one pass"""
+    words_by_number = {str(n + 1): word for n, word in enumerate(words)}
+
+    def replace(match):
+        return words_by_number.get(match.group(1), match.group(0))
+
+    return BRACKETED_NUMBER.sub(replace, jp)
+
+
+def classify(sentences: list):
+    """
+    is_jp of every sentence at once, a numpy boolean array when numpy is installed and the batch is big enough,
+    otherwise a list of bools
+    """
+    if np is not None and sum(map(len, sentences)) >= NUMPY_THRESHOLD:
+        return _classify_numpy(sentences)
+    return _classify_runs(sentences)
+
+
+def _classify_runs(sentences: list) -> list:
+    result = []
+    collapsed = KANA_RUN.sub(KANA_MARK, '\n'.join(sentences)).split('\n')
+    for sentence, runs in zip(sentences, collapsed):
+        blocks = runs.count(KANA_MARK)
+        # all inside the ends are kana when the only block is all that's left between them
+        result.append(blocks > 1 or len(sentence) <= 2
+                      or blocks == 1 and len(runs) - (runs[0] != KANA_MARK) - (runs[-1] != KANA_MARK) == 1)
+    return result
+
+
+def _classify_numpy(sentences: list):
+    count = len(sentences)
+    code_points = np.frombuffer('\n'.join(sentences).encode('utf-32-le'), dtype=np.uint32)
+    is_kana = np.zeros(len(code_points), dtype=bool)
+    bmp = code_points < 0x10000
+    is_kana[bmp] = IS_KANA[code_points[bmp]]
+    sentence_ids = np.cumsum(code_points == ord('\n'))
+
+    # a block starts at a kana that doesn't follow a kana, '\n' keeps blocks from crossing sentences
+    block_starts = is_kana.copy()
+    block_starts[1:] &= ~is_kana[:-1]
+    blocks = np.bincount(sentence_ids[block_starts], minlength=count)
+
+    lengths = np.fromiter(map(len, sentences), dtype=np.int64, count=count)
+    offsets = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+    kana = np.bincount(sentence_ids[is_kana], minlength=count)
+    long_enough = lengths >= 2
+    first = np.where(long_enough, is_kana[np.minimum(offsets, len(is_kana) - 1)], False)
+    last = np.where(long_enough, is_kana[np.clip(offsets + lengths - 1, 0, len(is_kana) - 1)], False)
+    inner_all_kana = ~long_enough | (kana - first - last == lengths - 2)
+    return (blocks > 1) | inner_all_kana
+
+
+def split_texts(texts: list) -> list:
+    """
+    split_text of many texts, the sentences of all of them are classified in one batch
+    and each text is then aligned in a single linear pass
+    """
+    sentence_lists = [SENTENCE_END.sub(r'\g<1>\n', text).split('\n') for text in texts]
+    flags = classify([sentence for sentences in sentence_lists for sentence in sentences])
+    result = []
+    position = 0
+    for sentences in sentence_lists:
+        result.append(_align(sentences, flags[position:position + len(sentences)]))
+        position += len(sentences)
+    return result
+
+
+def _align(sentences: list, flags) -> tuple:
+    """every language switch closes a <p> of the previous language"""
+    jp, cn = [], []
+    p = []
+    current_lang_is_jp = True
+    for sentence, sentence_is_jp in zip(sentences, flags):
+        if sentence_is_jp != current_lang_is_jp:
+            (jp if current_lang_is_jp else cn).append(f'<p>{"".join(p)}</p>\n')
+            current_lang_is_jp = not current_lang_is_jp
+            p = []
+        p.append(sentence.strip())
+    return ''.join(jp), ''.join(cn)
+
+
+def split_text(text: str) -> tuple:
+    """split text into jp and cn two segments"""
+    return split_texts([text])[0]
@@ -1,16 +1,18 @@
-import requests
+import os
+
 from PyQt6.QtCore import Qt, QObject, pyqtSignal, QThreadPool
 from PyQt6.QtWidgets import QWidget, QApplication, QListWidgetItem
 import sys
 
-from bs4 import BeautifulSoup
-
 try:
     from .forms.titles import Ui_Form
     from .db import Database
+    from . import net, parsers
 except ImportError:
     from db import Database
     from forms.titles import Ui_Form
+    import net
+    import parsers
 
 
 class Worker(QObject):
@@ -19,20 +21,16 @@ class Worker(QObject):
     def __init__(self, url):
         super().__init__()
         self.url = url
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/101.0.4951.64 Safari/537.36'}
 
     def run(self):
         self.get_news_title(self.url)
 
     def get_news_title(self, url):
         """Get new title"""
-        res = requests.get(url, headers=self.headers)
-        if res.status_code == 200:
-            html = res.text
-            soup = BeautifulSoup(html, features='html.parser')
-            title = soup.h1.text.strip()
-            self.title_signal.emit(url, title)
+        html = net.get_text(url, fresh=net.ARTICLE_FRESHNESS)
+        if html is not None:
+            if headings := parsers.find_all(html, 'h1'):
+                self.title_signal.emit(url, headings[0].text.strip())
 
 
 class ChooseTitles(QWidget, Ui_Form):
@@ -43,8 +41,8 @@ class ChooseTitles(QWidget, Ui_Form):
         super().__init__()
         self.thread_pool = QThreadPool()
         self.url_title_dict = {}
-        self.db = Database('user_files/data.db')
-        self.urls = self.db.get('select url from urls')[:30]
+        self.db = Database.shared(os.path.join(os.path.dirname(__file__), 'user_files', 'data.db'))
+        self.urls = self.db.table('urls').getmany(30, 'url', order_by='id')
         self.setupUi(self)
         self.custom_ui()
         self.show()
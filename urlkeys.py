@@ -0,0 +1,115 @@
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+ARTICLE_HOST = 'mp.weixin.qq.com'
+
+
+def article_id(url: str) -> Optional[tuple]:
+    """
+    (__biz, mid, idx) identifying a WeChat article, None for links without them,
+    share tokens like chksm and the #rd suffix are ignored
+    """
+    parts = urlsplit(url.strip().replace('&amp;', '&'))
+    query = parse_qs(parts.query)
+    try:
+        biz, mid, idx = query['__biz'][0], int(query['mid'][0]), int(query['idx'][0])
+    except (KeyError, IndexError, ValueError):
+        return None
+    return biz, mid, idx
+
+
+def account_ids(accounts_table, bizs, create: bool = False) -> dict:
+    """{__biz: id of its row in accounts table}, with create=True accounts not seen before are added"""
+    ids = accounts_table.lookup('biz', 'id', bizs)
+    if create and (missing := [biz for biz in dict.fromkeys(bizs) if biz not in ids]):
+        # ids have to fit 23 bits of the key, so only new accounts are inserted and none is skipped
+        accounts_table.insertmany('biz', missing, conflict='ignore')
+        ids.update(accounts_table.lookup('biz', 'id', missing))
+    return ids
+
+
+def pack_key(account: int, mid: int, idx: int) -> Optional[int]:
+    """account id (23 bits), mid (36 bits) and idx (4 bits) in one sqlite integer, None when one doesn't fit"""
+    if account >= 1 << 23 or mid >= 1 << 36 or idx >= 1 << 4:
+        return None
+    return account << 40 | mid << 4 | idx
+
+
+def article_keys(db, urls, create: bool = False) -> dict:
+    """
+    {url: article key} of the urls with an article identity,
+    every account has its own row in accounts, so two articles never share a key
+    """
+    identities = {url: identity for url in urls if (identity := article_id(url)) is not None}
+    accounts = account_ids(db.table('accounts'), [biz for biz, _, _ in identities.values()], create)
+    keys = {}
+    for url, (biz, mid, idx) in identities.items():
+        if biz in accounts and (key := pack_key(accounts[biz], mid, idx)) is not None:
+            keys[url] = key
+    return keys
+
+
+def record_urls(db, urls) -> None:
+    """insert urls rows with their article keys, a link to an article already recorded is ignored"""
+    urls = list(urls)
+    with db.transaction():
+        keys = article_keys(db, urls, create=True)
+        db.table('urls').insertmany(['url', 'key'], [(url, keys.get(url)) for url in urls], conflict='ignore')
+
+
+def url_key(url: str):
+    """dedupe key of a link, its (__biz, mid, idx) when there is one, otherwise the link itself"""
+    identity = article_id(url)
+    return url if identity is None else identity
+
+
+def canonical_url(url: str) -> str:
+    """shortest link opening the same article, links without an article identity are returned as they are"""
+    identity = article_id(url)
+    if identity is None:
+        return url
+    biz, mid, idx = identity
+    query = {'__biz': biz, 'mid': mid, 'idx': idx}
+    if sn := parse_qs(urlsplit(url.replace('&amp;', '&')).query).get('sn'):
+        query['sn'] = sn[0]
+    return f'https://{ARTICLE_HOST}/s?{urlencode(query, safe="=")}'
+
+
+def lookup_page_ids(urls_table, urls) -> dict:
+    """{url: id of its row in urls table}, matched on article key and on the link itself for links without one"""
+    urls = list(dict.fromkeys(urls))
+    keys = article_keys(urls_table.db, urls)
+    ids_by_key = urls_table.lookup('key', 'id', keys.values())
+    ids_by_url = urls_table.lookup('url', 'id', [url for url in urls if url not in keys])
+    result = {}
+    for url in urls:
+        page_id = ids_by_key.get(keys[url]) if url in keys else ids_by_url.get(url)
+        if page_id is not None:
+            result[url] = page_id
+    return result
+
+
+def merge_duplicate_urls(db) -> None:
+    """
+    migration step: give every account a row in accounts and every urls row its article key,
+    fold rows of the same article into the oldest one and point notes at it
+    """
+    db.execute('create table if not exists accounts (ID INTEGER PRIMARY KEY NOT NULL, BIZ TEXT)')
+    db.execute('create unique index if not exists accounts_biz on accounts (BIZ)')
+    # keys written before accounts existed hashed __biz, they are all worked out again
+    db.execute('update urls set KEY=null')
+    rows = db.fetchall('select ID, URL from urls order by ID')
+    keys = article_keys(db, [url for _, url in rows if url], create=True)
+    kept = {}
+    duplicates = []
+    for page_id, url in rows:
+        key = keys.get(url)
+        if key is None:
+            continue
+        if key in kept:
+            duplicates.append((kept[key], page_id))
+        else:
+            kept[key] = page_id
+    db.executemany('update notes set PAGE_ID=? where PAGE_ID=?', duplicates)
+    db.executemany('delete from urls where ID=?', [page_id for _, page_id in duplicates])
+    db.executemany('update urls set KEY=? where ID=?', [(key, page_id) for key, page_id in kept.items()])
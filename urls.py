@@ -1,636 +0,0 @@
-urls_before_20220605 = [
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515555&idx=3&sn=6bff20cfcde23e4122ff84a6de4942ef&chksm=fbe04c31cc97c52743f4479bbf16c05d776efe1908a84290511cb69cdf061e82b352dfd694d3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515516&idx=3&sn=cf1236305608bd5d701b21827dd09549&chksm=fbe04ceecc97c5f8f1668fa185ad2afc8b6be567bd2026c9ef496d8f781d09267cc2c0b59b1b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515503&idx=3&sn=a30d5ba876e554a2f5bb18a64e7d8afb&chksm=fbe04cfdcc97c5eb8aed82337d8c0ee4a385319b809e296e8671501382e4464a6a83af96e623#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515439&idx=3&sn=063323e37e3d1a9487237ee49eba17b5&chksm=fbe04cbdcc97c5abab6688eef02b07d349b77c4968b14711a4b6fc5489877e33e13096fb933d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515381&idx=2&sn=70a34bc4d29b3ee1bb9937975164649c&chksm=fbe04d67cc97c471c7787f0ed53b7fc6bcac1b897c081324ce95e945905175c9e2e2f6249b4c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515269&idx=3&sn=9fd1ca492bde373135b291a85f1f9bde&chksm=fbe04d17cc97c40108b9f42737e8a1e32881ba836f70d8f56414c2665e17d4eee5a5f9e6aa9c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515138&idx=3&sn=d580d5d299af4b890e08baff7b80007e&chksm=fbe04d90cc97c486317c058204ccaabc409a47442417b3a34213f190f06618f771af1e2950fa#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515138&idx=4&sn=a3f9da7fd79d39a69759e1ca7e563139&chksm=fbe04d90cc97c486b166a69f692c051e7a67b087d92c9e0a67d81074de7f400afc15bf7441b1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515071&idx=4&sn=100cf164572f63522986a5aa9d057247&chksm=fbe04a2dcc97c33b6673964040e07eb25ed459da79a10734e62da1804be8157b71e0c8de0103#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515025&idx=3&sn=a70f4033cf1064ce1ee7703eb0bfa320&chksm=fbe04a03cc97c315fed349478b5384bef83eac8a7d10484ad282d5455a0361fa2c54dc4c11fd#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247515015&idx=2&sn=3b4df27e046b808b53e93ab0e1ec6b25&chksm=fbe04a15cc97c3033ae26e8a77f642170a7be3356d6bc27755747b58a9e8b4874771de1532ee#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514993&idx=2&sn=285e36cc794862582d96d5d713a2bdec&chksm=fbe04ae3cc97c3f50d394025c56e54a1c14103908971732c1d059f1d2d5c900f14ba8df07911#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514962&idx=2&sn=8fb79006f3df3ae19093a5e68fa444bc&chksm=fbe04ac0cc97c3d64d46391ffd086ad88b4344503fbf1ed38fda953e4fb0e261637597414ed6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514962&idx=3&sn=68f649e3369d645990fcc66c5b7c1853&chksm=fbe04ac0cc97c3d6ba6e7ff63ec51a9054169cbe00cc4efb3a6950428e838133f210338a5512#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514917&idx=2&sn=45d7eb94e03dddb008c72f893f22a370&chksm=fbe04ab7cc97c3a180af1b23bdb79eb5a273239a8917826457d5b3de4ca7e1ca1f45060754e2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514888&idx=2&sn=412e3a55db078c5195ce783c8a5da724&chksm=fbe04a9acc97c38cf08d2f378e5053bbb731f3ae46e9cf5852337fddc5fce6d1e8c03be566d3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514859&idx=2&sn=081ff371bc4f4de44d72feac1ac008c5&chksm=fbe04b79cc97c26f711dd03ff63827cf082a8127908408ec481c424d13d67128812f9689a264#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514806&idx=2&sn=099db5bb5473eca93afa4903aa5732c2&chksm=fbe04b24cc97c23252d1a0afd45d4ff70cec0c7e5f547a9a8d1dd7b3a7c5d01934fab8d7f60b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514757&idx=2&sn=e21bf5cc6918c593cf23b05c1d6ad5e9&chksm=fbe04b17cc97c201109fcce6d9620705ce34be2c082312e0c79682238b4d8f6640bf0dc62fda#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514747&idx=2&sn=f934d2ec1a8711e652a99d01dd625ac6&chksm=fbe04be9cc97c2ff061448d6df77681eb6bef07fed7885d9c0de8e11c51c6914eee0acb153bc#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514747&idx=4&sn=cce40599884ecc346dec453c1d52e552&chksm=fbe04be9cc97c2fffe19e7bef20126bb22518c3f41f68ac9ad72a5c1adf8207ea50ed1cbee1a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514677&idx=2&sn=ae252bf912ee484ee934f2e740af7410&chksm=fbe04ba7cc97c2b1a0b773157b826631e0b9a32362740c2d05f97a868a4ea4eda19a1a5cc403#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514625&idx=3&sn=b1f3cb4c47daf3107ee343c97af9de69&chksm=fbe04b93cc97c2854cc373ecf4beff8665d7020f7612495791eb520bf834a23a8e25574ba507#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514597&idx=2&sn=106e4a1dd4dc643c09b1aa60ee30672e&chksm=fbe04877cc97c1615bb409b88d585a08a046576db943cc5826d96045374af18761645e7dd067#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514589&idx=2&sn=85e3eb1c701c856568b4a0fa70c8cd79&chksm=fbe0484fcc97c159241811f1f6689d44f179c7dfd57736da5cf0cdde606ba5c0df3399cbf08f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514548&idx=3&sn=c23e404d61b539ad99d34726f7f031c7&chksm=fbe04826cc97c1300f88c5c46d778ed952e27b5c0c49cd65981ee585d8945d54f5534c2adccb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514489&idx=4&sn=01287099c2aa8d22c1d69e5a39c65d6f&chksm=fbe048ebcc97c1fd11c5f5a75abe2087d2392c8fe28bea3edcc3757346faaf28e52d84695d72#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514412&idx=2&sn=ca9bfa335b4d532f6c1da7e3e741f267&chksm=fbe048becc97c1a83251c72bb82df46cffe51e2906ed13f5c31e360c4516b724fd10300e834a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514349&idx=2&sn=a32f586389cecc9700d9add89e5a2c51&chksm=fbe0497fcc97c069f697203bd3b47707d3324bd5f220599ad5209908c6a0454d2bf521f2c2ec#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514338&idx=3&sn=294656af0c620e3b4a06309b4c0d781a&chksm=fbe04970cc97c06647c585d5739c2387e91f244429194fa19689fc8b5a4a761bf16bf2f6a983#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514325&idx=2&sn=3fb182d93719675e604bee2e91e5381d&chksm=fbe04947cc97c0510dc88cc4fd5f0341ac33c8bc9925f5b1b9a7f46739f780070eb48f918e19#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514286&idx=2&sn=bec545cc9c2f11de5e15e947004af323&chksm=fbe0493ccc97c02a8985cc43f17c3420cbc8262795df1897430d8c7420593eb3d7e6ff0f03b2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514256&idx=2&sn=cd1023eb1e7e3f19833f6bcfe7430db5&chksm=fbe04902cc97c014de88d575675a53565aae6b138be28c1804378adc1bf345ffaa95a0c70445#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514241&idx=3&sn=50b371887eea1ad80e6e6ebcba7bdd31&chksm=fbe04913cc97c00540577632b3523e0f94f3a75cfaf8268f775b83709c21986b3348cb6d367c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514230&idx=3&sn=6b5637f7a9a4190be65e9b0db8361a0f&chksm=fbe049e4cc97c0f297cec038fe1f3f54dfcf5c94bffcaf4d751cb89db53dd27dfb7c0a842834#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514201&idx=2&sn=e0f0281a72377e1658e8a62dedc84e51&chksm=fbe049cbcc97c0dded7532058151d45c540239cb3974fdb9e2867e16fd0d1a804b23f3f404d2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514168&idx=2&sn=d7fb2b0d473442f7d3b51ec9ad046110&chksm=fbe049aacc97c0bcb02aa4ae9ae509f8ed87ad517d63b3ecc80a89355cd06c75877ea497bc60#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514132&idx=3&sn=56fedb5b6464983c33603086e3ba6a9d&chksm=fbe04986cc97c0903fa4b2872252cbb40e0ecadbc2b8fc4a24c0402fded1f0e143e264dd0790#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514057&idx=2&sn=576cc88abae98b0181fd6569dc8dafa6&chksm=fbe0465bcc97cf4dba8fbda5e14a8a05fd52728be0200e2fecbd2ccd2de50a69b817d357000b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514043&idx=3&sn=c0eea3f32e5864e61d282a4461366515&chksm=fbe04629cc97cf3f9cf2e635294754dfd8e98e3277d72b5547a8cb079afaec7006add7ce97a8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247514002&idx=3&sn=5e29f238f9ba90192dda2e992e46fcad&chksm=fbe04600cc97cf16a3a99b4c7674ac6fd99ed5e7cf1422efac478a9155e0da19b9fa2f81cd92#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513951&idx=2&sn=ced34b3f6d8fb79c39fc915c47cacd3a&chksm=fbe046cdcc97cfdbce574469d479d97aacb97de6f5788ed8d2a39186d64410da05ee2ac3acc6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513941&idx=2&sn=51f2df4cabbca283ff3db4fe106f7b69&chksm=fbe046c7cc97cfd138a03e6d5baec413e325a69adb5d6c13bfb78d053be052004b0c6498c770#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513832&idx=2&sn=b87472d3b432adfb5528ea753f6b35e3&chksm=fbe0477acc97ce6c888766802206fa06b327c8bbe19d4e483960b938f3c201414ee667833347#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513802&idx=2&sn=c369ac60f4181b51887c5e097b1b0dc7&chksm=fbe04758cc97ce4ee21fac1339f0803323236960cc72c7f4d413fc1b8c2225c6fb8863143cb8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513792&idx=3&sn=a9bd099db1b1776587747ceee0dc6968&chksm=fbe04752cc97ce445daa134d8ece33e01ecc06e09ba74f9e7742857c1635c7feb4e5cbdf436d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513766&idx=3&sn=1ee2239036114247249b3b1436a4feaf&chksm=fbe04734cc97ce225c578ec4796dc6089454ea23b5dfe29e525e5f5186b6c4e8a5c742d55134#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513700&idx=2&sn=66bcf9da321593f6b1426847a3e9efc5&chksm=fbe047f6cc97cee06bb5b9eba52d1ebdba129c19d25c1d16f4ff176f3cb0cc81b6ccf38876d3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513693&idx=2&sn=6498a0b7434112e84c04e52f03f41832&chksm=fbe047cfcc97ced954a43fd49b6cb6f7e673499000e1a757547de9edeb58ba73ea558bffb228#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513680&idx=2&sn=4babbbe1aac75b34eff251e7b93feecc&chksm=fbe047c2cc97ced43e3c0d53a3006b980d112567c8918175e794381db6470f9a8c492bba17fb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513652&idx=3&sn=4449f41b2a01b957e3b7b376c01bca26&chksm=fbe047a6cc97ceb06b852fd3653e5aee36e327d061985f7f741a07dd1c505f7cb96a28521516#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513601&idx=3&sn=059a9c7a05007617dbb5ef338ea8ed39&chksm=fbe04793cc97ce8537d32e2bcb5d782ce94379f2dd93dc5fb4fe6ed6c5bdc03483deb1d4850f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513575&idx=3&sn=2cb54e484246680f9d04bf9091db85ab&chksm=fbe04475cc97cd63e11be8bfb0e63d5997d952f459573568a9a0d0834f2be79c4f607ad32f9c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513537&idx=2&sn=64ace6d5b773cb258366402ba7cf9d11&chksm=fbe04453cc97cd45c3af8bf3a518c60ec29892f01d638bc1efdd6cdc6bec9d8770cb6d694b5f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513504&idx=3&sn=938d91b7dc9300f583fb9e27603270c3&chksm=fbe04432cc97cd242a9d2acdf120ef75bd433454db728a8728d52bce1617c3ee404bd4dad821#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513472&idx=2&sn=a5a2914a51d7b0c42f3a81722aa527d8&chksm=fbe04412cc97cd04220a38adc823ae4edb689a562226189c7450f7d4a9e0ae17b88727638344#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513456&idx=2&sn=ee002173ba43cf2a293e0a20967f0d75&chksm=fbe044e2cc97cdf4e159ef40c16b602ffffbb2f4fec123b5d0383568d9ba7adad79b13517944#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513436&idx=2&sn=0dd362abb38e713c315ebf1bad24cff2&chksm=fbe044cecc97cdd8614ee3a54edb911da2bac09b86ccd48e0189f67f85424aad0c692b1489a7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513415&idx=2&sn=84b7cbebff186bcb7e77c2d74226e51a&chksm=fbe044d5cc97cdc34bf40c292834ea3d13065be46b8d84360c78c3ab2176ac768dec27b57bed#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513363&idx=2&sn=d6790c43fb4942e01582f03b968a5dac&chksm=fbe04481cc97cd97f1d5ae1fd2c94b1b9ffdcef79dc87528c5f2d51379ebc25f59eb8dd3f0e8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513339&idx=3&sn=dc0f577393a79331a16650069f4a3b10&chksm=fbe04569cc97cc7f6b80de1d2cd132dccf55264b0eb6a9b52bd58288b885e0512be74f86129c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513294&idx=2&sn=b5796731fe2080a7659abec94f3db842&chksm=fbe0455ccc97cc4abc80bbc8f088c20d8b287b6dbf10edd60708a79ad9ab32632ee8463a5dac#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513269&idx=4&sn=992eea38e313cc879868a050cebc950f&chksm=fbe04527cc97cc310f752eddfd0f9beed92a9294cd735ebda9451b7b1d8b329889f07d5ce069#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513175&idx=2&sn=161f39a3bc357eda4ef636b9b390993e&chksm=fbe045c5cc97ccd3791587ffe9142cba886dbb6b19562818aac3860c0ac543270d2a29e1f0c4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513149&idx=3&sn=becae05d5bf984d29fbbd9c106d9f1c8&chksm=fbe045afcc97ccb95eefd98faaff8b6aa6f5f72a9eede4a6bd9307c72ea45cf079fc3518711f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513117&idx=2&sn=9a6f0f64563fb6d3216b5849471a8d93&chksm=fbe0458fcc97cc99ab63237ce2d1ba2fbce147ee6316091d214c8c4aceb2b57d258db0fda373#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513073&idx=2&sn=d98d1a35950bba721e1406c522634daa&chksm=fbe04263cc97cb7538fb4121eb4e8906163f31734aa79d4468abc0b0c56486125434f846f8bc#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513060&idx=2&sn=e479f7bd12a1803ecd49447266ecb865&chksm=fbe04276cc97cb601fb3af1f2361e9df492ad7740f12441e8b689ef1c35e39bd8d27d1e8a2bf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513027&idx=2&sn=aeb6b23798a56e59084d5ceec213da7c&chksm=fbe04251cc97cb47371eef034451460fd0565c30c86af20b1e89d11b941a098b8d6de2384103#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247513002&idx=2&sn=de21e8f5baec426371966c970ec0cd9c&chksm=fbe04238cc97cb2ebaf7e476659406162698903f7079e6eacfae14c974046c7313cefa9938fe#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512982&idx=2&sn=d61dbc2cb95c170469658b8dc3e32e7f&chksm=fbe04204cc97cb1202d1513519fff294e3e09dcaec263b19ff927c573a10e8e46254e02bad02#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512926&idx=2&sn=132d577797d93e105588f2a610ae9b89&chksm=fbe042cccc97cbda41b54624e94c55b9c8713ddfa9032869a926487147b37742eaad369e28f4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512854&idx=2&sn=15e4a14da89ab9423f51fd2f88caf452&chksm=fbe04284cc97cb92a3038c0d5239371fdcf88946597fcf23f106942bba9d636757d0bcefcfdc#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512805&idx=3&sn=2b9cd45477ba72588ea96b6567e45766&chksm=fbe04377cc97ca6121f8fb2110413c553a8ab83401b416f9cd3f2cc95310b0014c05d98ac636#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512777&idx=2&sn=a761d1ee00189b59904dcffaacaa8656&chksm=fbe0435bcc97ca4dba054c4cbf324a7a89d0a902874ab7b2f7c558211c085d26bf9840159032#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512741&idx=2&sn=472b88a824d88dc5c1c03cbb3445c6af&chksm=fbe04337cc97ca2149808dc398b170b54f70a91bee79aa4fd60ae4dc4f2d55d5e75ee9fd93eb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512714&idx=2&sn=bf88da65b476b356e8d7215bab4a092a&chksm=fbe04318cc97ca0e96422075c49a50cd45d3ffd30f03200e50d049129bdea7375045234cad7b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512714&idx=3&sn=a21b180ea68465df2689885fc99432fb&chksm=fbe04318cc97ca0e30da3119b9360c91d8cf9a3c5afbff05dfca528b34edf40e3303f12faa7e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512654&idx=2&sn=72ac88e77c43771ba7966f376ca91703&chksm=fbe043dccc97caca01e04314bdf4e53f28fd3bbb7662328bcc4a3fbd5d948189977f5054d239#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512641&idx=2&sn=331c2e38767863ac01481c05e08fbf6d&chksm=fbe043d3cc97cac58756d05d3b0e2175d02140fe5f7eac855178c80b47902921003425fe144d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512601&idx=2&sn=816ed0c0dc96d44ba417a9e11b9029e9&chksm=fbe0438bcc97ca9dfae5f492863d83a4f7c90aa3cb5288f03e6b59ad5da08c0e9473b0b626e8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512581&idx=2&sn=de2519597a13da727368b4bf7b568081&chksm=fbe04397cc97ca81c62ffb6ef151304679bcec420dd40ffbf5d195663971d5dfd8324d45ae7f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512539&idx=3&sn=03880bde65b2fc2557c8ccb639fcba24&chksm=fbe04049cc97c95f16e4c3a9804cf1270ccf4822cf657b1ec568ecf7ba8adb6ad7f87b89120a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512499&idx=2&sn=d1bf0e4357771aa5f6976fb557af8546&chksm=fbe04021cc97c937893e7e7d0423570a574fba04e1fdef80c8cc2fa2b30b6f1abf3151b0c807#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512483&idx=3&sn=0f795408b368c7b9c2ed3b6612c53a06&chksm=fbe04031cc97c927756cba5e026329903b86cbe90650feb3a3a45b74891e402c7de0347d07d7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512483&idx=4&sn=a0f2b8ffc550cecd7782f4a308f6a0db&chksm=fbe04031cc97c9271536907d541e1f3d1db368fdf00ba7850108e2d5004b3f3f68e7f59a3c4a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512377&idx=3&sn=419f518bc95ad674d03e6e78413ff399&chksm=fbe040abcc97c9bdd31e7ff293208621747e32a2f7b9f98ecebd6df9f14c54fb44d58d6449ab#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247512040&idx=2&sn=40b38058afdc8ad11a46e286f463381a&chksm=fbe05e7acc97d76c4f83910c7d3d86904fef7b867343042b358375e484815ef4c6514a58f46c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511986&idx=2&sn=878f732b5987802d6c772467552bf60f&chksm=fbe05e20cc97d7360b8cf19278f6d5313dd7f00873b57e7167baa4ea8b78b2c4bc15f8fb13ff#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511945&idx=3&sn=225ce53d2800e61db657c993fa9848b9&chksm=fbe05e1bcc97d70d249dfbee7aaeaa09767731b564d4d323bd08c98147ce538e3e9f9d37296a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511919&idx=3&sn=f4008050e63c147a0f2a5cef53f23b17&chksm=fbe05efdcc97d7eba3074765a67a5f21386538cedd0024c820574d0ad75cb790736aa2b7ac88#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511887&idx=3&sn=72b391f069a63e232751cc31e14ced13&chksm=fbe05eddcc97d7cbd1af0dcff2f688de17762a013ffdaa8b7857977a32ccf42ae75d04c7dae4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511849&idx=2&sn=3ca782d7175971187dae90493c495141&chksm=fbe05ebbcc97d7ad78e5692b6b60f79fed9e70a7e480b219b4ae46664f89f35aac8f013c6381#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511702&idx=3&sn=94bbff740c6d8f9648406fe9bd6b32ff&chksm=fbe05f04cc97d61252a0fb7ec5764b8843c7f0275e5e65b5792dcddf6083e76e70089efa1c18#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511646&idx=2&sn=2b1cd94e787b12f99f0c921b0a20245a&chksm=fbe05fcccc97d6dae08828545be1095b94f50a742f98831ff72c8a27718a4e99eb3a72d172be#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511607&idx=2&sn=2e07cb5d9430a86477c55ef5a3f89b35&chksm=fbe05fa5cc97d6b3764eff0cd4fba97ae8088004c45717b188c8f88cfd486bbbb5f9aba5deb5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511572&idx=2&sn=ea294639aec3cabc18b260276bdc6cef&chksm=fbe05f86cc97d690a002d8b2095a7917a826ef51c45dab5032b09fc135e60c965118258d7ca5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511561&idx=2&sn=564cc7b940735fe7a5dcf58e8806b79b&chksm=fbe05f9bcc97d68ddf505b2e61f7ed410a6a557dc30b5dad7b784f01a00757b527a6b569591b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511535&idx=2&sn=ea0111c94552be6bd916363fe86ed0aa&chksm=fbe05c7dcc97d56b7ff180315dcaad46f573805e47066552f3ffc95914fa05710e5e34fdaafb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511480&idx=2&sn=10808d780e8e2ee6d55d96bcae681769&chksm=fbe05c2acc97d53c53653057c6aee817524c430410663d648e09ad64ba587f786ea0d072d6d2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511440&idx=3&sn=c29f42015aa98e7ecbf915bcba23f6c0&chksm=fbe05c02cc97d51404352dbfbde4637c5375c98c94a17d19fd31218134ab652aa5d381632d1c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511351&idx=2&sn=58ca0068e33588bef0b342d967c20ba7&chksm=fbe05ca5cc97d5b3c5b955d7cdbdaf06f3309ff03406a57f9843a528014e6f481cebd6b3bba9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511310&idx=2&sn=441217f30ac51d067d5ed65cf27bc42b&chksm=fbe05c9ccc97d58a77d862ede3bac2b63a4e2d4ce45f2767913cac11fca8c62ae38a498628d2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511259&idx=2&sn=047bd9b515953b6491657f3792bd0a86&chksm=fbe05d49cc97d45f1bc103a5466297d077ed5428b04fd9c5b488e1f0a0b50e6b3d64305a9380#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511248&idx=2&sn=b23b22fde5b3fd4b4985d338c9ba0cc4&chksm=fbe05d42cc97d454901b85d504b629ff410ae4e58f4ec7fca50c19c39e09d690b689f6a00a4a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511227&idx=3&sn=177916c1c82e2426e91d39071b5a6c75&chksm=fbe05d29cc97d43f7a21fce4142ea7192f468fdafce6149e3efec46a2a61f1f5795e916413a2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511181&idx=2&sn=e545c17914151ccb9522c49cb59036e5&chksm=fbe05d1fcc97d40992e3e7786c674582df2f374b38dc529915219240d88720a5b0515427e158#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511127&idx=3&sn=47ecb39f08afd1b310dc8fe5a004b210&chksm=fbe05dc5cc97d4d3c16ec13c49ce59831947b6398a47ef7c82ca40fc97fe86601b8aa554c9b3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511086&idx=3&sn=40e4e575c1ac5ce5210f89257c86cfe3&chksm=fbe05dbccc97d4aa68f3505ae0b308d8a872d00fd6d40505a112ec41354a2802e2b3dee89430#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511038&idx=2&sn=7c462ae87a77b9403ee395516d6d71be&chksm=fbe05a6ccc97d37a1655516fefcf6e5873b693772c41178def16fa18dd80aaeda288986d8dce#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247511014&idx=3&sn=fea565f346159a716cb4d92e86add971&chksm=fbe05a74cc97d3620022f93f185d717a0e80d7149486850d435736500a3dabfe105c7723c4b7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510961&idx=2&sn=028d759e643663b0bb4001f0da863f04&chksm=fbe05a23cc97d33578cce35ffc46637f8b4c45f34898dbb255fe8f82c7606cc3332165b0d78f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510921&idx=3&sn=d1a94155b049cd88d8334786ba230eb2&chksm=fbe05a1bcc97d30d00448e66be986855ebd8a9315f0d41aaa3a042e6552ea27d1f458a6d87db#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510847&idx=3&sn=096d098382c691ee5c26f6c8e272ee4d&chksm=fbe05aadcc97d3bbee01682d7d6a62efd738b4f596f98220eb87ec4074f3bfda21d042b3b8c5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510804&idx=3&sn=118dcf74f2a3bfbbfdb64bbdefc11e5a&chksm=fbe05a86cc97d390ed7ca45b09ecc2c517358e237bc82c1493afc7e3f6ff9806b8f476d9ff73#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510804&idx=4&sn=122251e331435bc6fe49eb0ad594c5bd&chksm=fbe05a86cc97d390eae2af8573436ca6bc600916d372c61c7db8bf7d69ab73b487747f1764d7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510765&idx=4&sn=e2e2374714de1881e6c4d2239e656d75&chksm=fbe05b7fcc97d2693fd613a5470ff8165f3a80c78006e9a9b020b067245a0c4b936e3d8fb9e4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510765&idx=5&sn=196ca99597d33bc281e052760bd41014&chksm=fbe05b7fcc97d2693714e133eff9d1fbe06cd4817d70f8365e23280c0656a5095f5b12c19d62#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510629&idx=3&sn=64c8e939967d0ac805e22550c18ad25a&chksm=fbe05bf7cc97d2e1adc2d45f763a0f4d093fe1f16e1b4d99aa73a2a83129776e3f0b5d2efaa3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510597&idx=3&sn=d794326bbd869f5b0272c33c0ef0af47&chksm=fbe05bd7cc97d2c1d2a3d2f1bc2f10a1ae416edd9fdebaf852e5e468bb580b2684dc54802391#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510570&idx=3&sn=2b5707a2459e6a050042c9f37ba6a1ca&chksm=fbe05bb8cc97d2ae52c02bd5078afdd15b5e0678ca238a5f030caf617b7bb1a57f7b43ba945a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510545&idx=3&sn=12184d41bc6f78ca7bebb9b1fd238856&chksm=fbe05b83cc97d295830a4a0d36e73acb177aef01d2e4df9023bb20a6468abd49374feeb4d664#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510517&idx=2&sn=9268c15161a040534597768048e1cbce&chksm=fbe05867cc97d17181426a6d2d6dd8374beed0fff8b906764a0933c4dcbecc552d437b0b7cf9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510453&idx=2&sn=df0de89fdb137215fe994c33568f90ef&chksm=fbe05827cc97d131724cb89c0cfe360074babdd34cc2620da99a8cd5115131fec91ec8237bf1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510429&idx=2&sn=858d3405369227a64c7dbb9003ab6da2&chksm=fbe0580fcc97d119048e75553574c76a8ebc308989b2c2df1c064e5131445a7068eef630dd5d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510382&idx=2&sn=ddb080a549f997f13de1d5f0336e738c&chksm=fbe058fccc97d1eaa88ef8d08353ac4a418483d1f002bf5fc668a2d9a7cf9914748d40118fce#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510357&idx=3&sn=13e2b5e802abf1a67194dc78f6babe1f&chksm=fbe058c7cc97d1d1cc4870a88dca09c9454d1721c47bb992065d629a293c36f7f6dfce72a4b9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510276&idx=3&sn=5568469d13caf22f59aa4e98ea6a991e&chksm=fbe05896cc97d180ac7414162a6acefce21900deed4c849285dcea40932d60ed3a7d4488157f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510225&idx=2&sn=ffaaae7dafca7167ba7521c3a9d443c1&chksm=fbe05943cc97d055de4aa139419e61bd16d78f6911bd1d080f30bf6a6012a23b29e0589159db#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510145&idx=3&sn=1653cf7b3eb439b3a8912e3b0ea3575a&chksm=fbe05913cc97d005ec827c5ade0697b2e828aa2f830a05cec8c6753bf841ab60dd6a0fd9ac9e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247510119&idx=3&sn=010db67b2d5d79e9ca764ff13a4ec422&chksm=fbe059f5cc97d0e36527b3cd5154a719dec752c7754d3a9fb707e24c39a181c79d8875385eaf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509974&idx=3&sn=c93e89b0060da5309556eef8d15647ed&chksm=fbe05644cc97df528ef66cf9bdb8bbe908c837801be4fae6542bd7c38f5157a514a2d04f4dd3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509948&idx=3&sn=63ebae08084e294cb2ca2199dc504ee0&chksm=fbe0562ecc97df3854da0d10afca16329198379cd0e5f28525559859a590a5299b8f99c09ba6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509921&idx=3&sn=90e86017cf15231545ce4fc2fd3c4497&chksm=fbe05633cc97df259b112a54514c624e787e32dbcae4d1dc8bb679272ec91cda23f1d4440f1c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509854&idx=3&sn=58106a6caf90d4956cf2fe5374d807c2&chksm=fbe056cccc97dfda26f01c517c9e06dd00321b5e505f45ba786ae015dcb7e423bccd4922563c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509817&idx=3&sn=218d3bed3ef5f103943f879ee7961aee&chksm=fbe056abcc97dfbde5b55fd72f82a1344caadcea53bece4dff7d099f875140c591bd30c7f414#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509796&idx=3&sn=cb92de1d561edf9a72762ea48341effd&chksm=fbe056b6cc97dfa09b05d4225d32fa1eac5c49687d1e02a9a1ea694697d6378e854f4da56e4a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509768&idx=2&sn=ae34a912368036b0d1fff9d3b4c90b5d&chksm=fbe0569acc97df8c0cc25857a174c817a06ef174a4c1d127c5e41bb61c4ebea32a08d58045d6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509701&idx=2&sn=59f0d5186a0fa1af29c179d94cd3ceb1&chksm=fbe05757cc97de41bb88494f12ff2f8fb8eb48a96c52df048d3ff3f646aa8c2c28e9a070795f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509666&idx=2&sn=6c84260159c86d7b2eaeae812af37d02&chksm=fbe05730cc97de268330c0fbe89b1b4517b914cfb4c05ac3427f5238b28fa01bdf0ba1d709ee#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509623&idx=2&sn=79a5f193e85899d7d0f7dd1e04abeb9f&chksm=fbe057e5cc97def317eb1afc4aae790531922b9d0412aad6eb27ba19c7a466722ffdeb2eb1d1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509600&idx=2&sn=c39a00694adf4eaba8a948b39abe8553&chksm=fbe057f2cc97dee4d0fc549ace33a2f532d39667d1d0b02aaf1b6c5cec5b758769277b607af7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509549&idx=2&sn=1cf55b98e3b931a76f6c0a1d06bd3829&chksm=fbe057bfcc97dea911ac7df30a7abcad5472bb920351f5b50d80ceed6598ecc8cc002f2ee3f5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509446&idx=2&sn=77735dc3becf79839bb8373a17a09bc5&chksm=fbe05454cc97dd42c353ae9345edb0687c366c5dba6914cd805b6387807e5ae6f643f9c45c54#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509419&idx=2&sn=c5719c1a230f976853e0ce55b44b78ab&chksm=fbe05439cc97dd2f758438259c1904bdcf03b55bbf0927d5855e79b63023d3547323e7a5d1ad#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509351&idx=1&sn=8cb6cdb933980dc5d94ae818278ebf45&chksm=fbe054f5cc97dde332d6b9cf707aaec53d845b49667b9503fafba0ac697244d805018311a9f0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509317&idx=2&sn=c25e0cc01d6f555d0f046c113bd01cda&chksm=fbe054d7cc97ddc17fbdedd16860dfdf299fb15e2fb1c29d82eeb8da95de47e7dddf106cf112#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509250&idx=2&sn=aa08567670b74de2327fd3b5a0286c92&chksm=fbe05490cc97dd86edaf16e57b95110a1c1a15b5a0dfc399febcdce0fc208aeff56cbd4dc9bd#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509177&idx=4&sn=1a494c0ef64e32f9fb900fed596d7e29&chksm=fbe0552bcc97dc3dddce919cbe2362d7c681518f90eb70b8adfa2d7ceca8aedf1bb244326e0a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247509016&idx=3&sn=818b74bee39d9e4b96feacc6b81fc407&chksm=fbe0558acc97dc9c7f24da2cf9401e5b4f77630a161095bb0b35660efbeada35a1efdd9432d3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508995&idx=3&sn=677fe7075868b471032ca31286860f7d&chksm=fbe05591cc97dc870b2a135c2a037332f109bf3338a94ebe3f53ed481d5e78e5b9e2c564921a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508607&idx=3&sn=8d02033133d5eef1e8d764f06abf25d7&chksm=fbe053edcc97dafb7fe75f48e2cd9b27c8d29a15ec84aef76373b818afb9b4cb97add2a36eb8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508535&idx=3&sn=3a4132f8d36bb125c0d0f4a105eaeec4&chksm=fbe053a5cc97dab32e60249509750a867c920e589dbed4c76c84623823ec89e571e8ff9cf546#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508463&idx=3&sn=788894ff56eeac47d743ec820c6714a1&chksm=fbe0507dcc97d96b5349168b0472d20cc12907ab255232fafe3546c50758220317b39905008f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508429&idx=3&sn=ea45cd8d9381fb83e78f7d4f545385ec&chksm=fbe0505fcc97d949691405d7c81abde8d89bebfcf58332df456dcf121b6b9a999438997ccef1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508387&idx=3&sn=bd2733340b652006d4d8e8dd1bf8163e&chksm=fbe05031cc97d927d7003cf1e26d897de917260a1f26bf4af8f07de6559bd4ec0543bf6f60ca#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508358&idx=3&sn=8d3413dd9e9a6ef4234770a89e839f29&chksm=fbe05014cc97d9028d0d4a400e2a5249d1fa9b8f890cb70fdb64eb0d0701a163c9604af15697#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508309&idx=3&sn=c883810f62e4236fa9b2c4fa45bc8eb2&chksm=fbe050c7cc97d9d1b1dd64a7e2d591ed1ac9e9cf8025d59812dbc6558c19fa36f52c74ead110#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508283&idx=3&sn=ff48b816ac5f71bf4b12eeccac3ae040&chksm=fbe050a9cc97d9bf497119f8e41334ada0dd878a5e7c917cd13a157e20ff74e2775414992546#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508258&idx=3&sn=3c78334ebe02c6d11729093ab676feb1&chksm=fbe050b0cc97d9a63ee6bb23179483ee75d8a767434d3bfe3c82eea6bbe972d68549d9897244#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508228&idx=2&sn=0becfec7f313ca6f2819f138b22717cc&chksm=fbe05096cc97d980f12c059ab6ff853869b8144a80c21489b2c449ec1d30b5226be438a8a82a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508220&idx=3&sn=6ac5c1bb056ea7ef603ac79817705266&chksm=fbe0516ecc97d87806dfebc788d840e9d37b10bc3701af087799adb85e4514aad2089bd238af#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508168&idx=3&sn=fc5771e5e13fe7c0af2c85dc0d24ca1b&chksm=fbe0515acc97d84c6e69c99453f4c8b562fc630bfdb1bbfd3c4bbb614551cb1e962135be7e8c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247508080&idx=3&sn=54de0c654e148e9fc33598e7122631e2&chksm=fbe051e2cc97d8f40a1404ba2c1cb4e1436f9234f8b664d20108cb1806c5a1536a2afe1eac0e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507982&idx=3&sn=f83a569db6a341c4981aef3a7794b0e9&chksm=fbe0519ccc97d88a242dcc5b005a7db51ac66451bfd910bddb5274e4f76cacb1ffb43e8e9ab6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507946&idx=3&sn=c270e500ab89e02943b13be4af176b08&chksm=fbe02e78cc97a76eab16bc3b21e606d750b0ac0ba43b2954b9677c0f7838d4dd6b468e32541e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507874&idx=3&sn=c4fc59dd189e06b001b9f3141e3a95eb&chksm=fbe02e30cc97a726fb257bd9537bbbe77fea9c11e717d1cd3a0350fde9c4f3835ddeef42708d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507850&idx=3&sn=89702f6dd418013720fb83a355ec5618&chksm=fbe02e18cc97a70eb129e85f457b55c35a315f37bf45f42de6c34abaec100905013f7abf29fb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507826&idx=2&sn=521f8955a24c2dd98f975229b5a24d06&chksm=fbe02ee0cc97a7f6595ffd4166a1412356e06041ac7083d04a75f75ed3c89775733293fed305#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507794&idx=3&sn=0e625ec67e1eeb5133d32aa85e34f0fe&chksm=fbe02ec0cc97a7d6cdffe23a7e49fc4db5c5f1bac363146949a81d9097d681f66c1d86c59e07#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507764&idx=3&sn=4aa1459dd5934125d6f41352bb511a8a&chksm=fbe02ea6cc97a7b0ceb1a622fd7f56fda470b1332e119aaf3430e159f0ab7e4ad036ee01813b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507727&idx=3&sn=a842c5be173d5c3bd919dbf1328ba02f&chksm=fbe02e9dcc97a78bceaf08e11f3c818e946a7f50e80f5dae7e92d2213f88e0e8281e838a97f3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507677&idx=3&sn=9e404ce2c4eefc01e4700b6f459a1903&chksm=fbe02f4fcc97a6592787d935201d8e1ffeeb1f94faae9fd43683b5fe5b438c75da7d6d943a53#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507665&idx=2&sn=0140e58944f2738e0a96019f380e6458&chksm=fbe02f43cc97a655c611660baa9689dee5dd6e2317c0385ee16dc72b857f6505ba3a610f48ab#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507638&idx=3&sn=7c9bbd2c1aed6708b9c10e72c8826573&chksm=fbe02f24cc97a6324dec0ab22d962e0811a966bb4d7b062ad58cee553ff8f285e66b78741801#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507611&idx=3&sn=194124cf4eacf9f562c4b7e3e7a6436b&chksm=fbe02f09cc97a61f50d90e9187b33d436856a7981057693e215a2cbbdf8542b1c581e8162d62#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507586&idx=3&sn=d8b1fe51a9be00a3a7692de512ba81ec&chksm=fbe02f10cc97a606cd05bef1834ebb4ff101c9fb322a45dedddc73d72aaef2efc511a098bb80#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507552&idx=4&sn=93c5db330424725fc218864061810652&chksm=fbe02ff2cc97a6e456fabb8c606040ca27445e4ee5b0fa4d521ce824682959337fb34de9d6ce#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507529&idx=5&sn=ecba9b485bccc4c785c6d01a548b5234&chksm=fbe02fdbcc97a6cd771f3cf278c58597a2f2abaa9bf35d4841dc6f0319454e6f36672a059b46#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507450&idx=4&sn=efc7dd71da7a405b2dc9bf7992689ed5&chksm=fbe02c68cc97a57e0db1a835fe01be920597fe148271607d462543b5a32575e9100b62992a25#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507320&idx=2&sn=d93f129475b288ac2cfdf0dbb9bba5c7&chksm=fbe02ceacc97a5fc2172eeafec912c46502590b7001a63a291ff352878f4c374d31b6b07ea33#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507297&idx=3&sn=e538676984029373ad7529f325ef597b&chksm=fbe02cf3cc97a5e5b56ea5331bf0793b3ee6eda461ecd84b8c76899db0d0a3d1b27d32847a22#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507220&idx=3&sn=708f5728a92ed6c963e507b79c3b3fe4&chksm=fbe02c86cc97a5903e8c66920cf99dc05d7ed8013ac1aafe7be29c84ccc530f1af77f48b3fbd#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507162&idx=3&sn=c3f41eba26c7a6155927629db35d2b66&chksm=fbe02d48cc97a45ed5d6f3ef20b9d026eb1c104d44c647cd34203a2e8859e8c12891e0d13e63#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507117&idx=4&sn=763427274482d3ebad71d2ed8b43310f&chksm=fbe02d3fcc97a429fc3068aa486edc7c1c47fd7081163e124ce7f031199ef9bd1335568639f1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507041&idx=2&sn=458513567d9acf111696c40fb5acc7aa&chksm=fbe02df3cc97a4e5d8100fd41cffab2ae02209ea5df00f15f4191e02d4f1adf3e9e941284525#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507010&idx=3&sn=79cdceecd9e6d86686a7e01aa69f5338&chksm=fbe02dd0cc97a4c61947c868bfff96b37e4597f24caf355dbf13091ac4ceec194e37792a16a5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506989&idx=3&sn=38d5cc6e855d3e4f91412da3a642df0b&chksm=fbe02dbfcc97a4a9689b71a5970f493364643c4947717a52dc0c2322b5bd0b692e50f98297b7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506969&idx=3&sn=fb632c29959129b4f135935f086965a8&chksm=fbe02d8bcc97a49d1d3abc9e260cf9e788ad9d7bf50e68af7ff5d950e2282d4edc7a8bbdec94#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506913&idx=3&sn=aa20cfea272c17c5ee955a5555d266b7&chksm=fbe02a73cc97a3653f8f6abdbdfd34e8d76e24b0a21404676907c7fa5531cf855db964e64b3c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506853&idx=2&sn=2bce550b24032fd4b44d84db30337f40&chksm=fbe02a37cc97a321145374e99299d05bf1a1f0a509848a41c9792a007e92b253e00c1fcd840e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506809&idx=2&sn=d6c673aabef63630f98a8c580a348964&chksm=fbe02aebcc97a3fd51366ca40009271ac84b572f850737e2be090d45d24a3d3a6d58f705b20a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506792&idx=3&sn=4d297b89f3c6647649d95e6210da9d4d&chksm=fbe02afacc97a3ec6b63baa0df4b186807513ba7dccd4977a92a166da9e867b8f758b0feb67f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506744&idx=3&sn=b515967df53b6dc0ad6a229a552c4b97&chksm=fbe02aaacc97a3bc39cc5d0e9677597cba35590f46187116ab67c3bf72fdadcfd904dc05af03#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506726&idx=2&sn=06db82a166cd29c627e258a60f0da088&chksm=fbe02ab4cc97a3a27392c3fa417e2ad451dbfb0ad5c991f7faffe30138406f405af4c82aa80b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506707&idx=2&sn=86bc77533d567aba0d54fd6e2fdba123&chksm=fbe02a81cc97a3975a938f79ca7359a294ee8be89812da27c4d0db482043b3efb40a274f990e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506645&idx=3&sn=9274f32fae67c9a34711b70338bd46d2&chksm=fbe02b47cc97a25196b89076632ea086e492ae55c53873413a12618a8f27dd62badb2602ea5a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506627&idx=4&sn=b6c0adfc4a934a6c5a13f1ccfe66da45&chksm=fbe02b51cc97a2474225c6c1e0d8f6cff66dcd1ec14594a010b09fc6d2cdf73ae9606976389a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506445&idx=3&sn=268bf227aeade34b13b11ad1c47c59a7&chksm=fbe02b9fcc97a289fb0a3cbb91d99a60a10780bf0a9c80c0a315eec6a2714b5fb3f16761ae3d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506423&idx=2&sn=41a2b68801ea437e666d2e5285c45040&chksm=fbe02865cc97a1734a55c10aa25a4ce8605a9a4a91175d1bbe814d279e432d42e4e025ec660c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506417&idx=3&sn=9154ae4d12bfe67e5ba081558434cd48&chksm=fbe02863cc97a1755c4f46d801090c3dac2c4c418d2e25016b2bd9952ce80695e0c545e97146#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506384&idx=4&sn=4a77475025ebf8e66e61c6e2d74330d7&chksm=fbe02842cc97a154fa36158347e880bc759cf85ec6e3bbf636ee5dc587f884de60fab2b6717c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506363&idx=3&sn=758cef8caf49fa4c1ab8d3b01dea7271&chksm=fbe02829cc97a13f34cf450cfabe9bce4846ef323a766704f65d4a9c2cfdd0d9ca7c89bbc111#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506328&idx=2&sn=93cfc194de599af9856b37958bcff649&chksm=fbe0280acc97a11cf57228be8c4f683b6d5d5f1e627a9a3139ba30fa7fadccaebfba70726ff1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506239&idx=2&sn=f90487d5973486744d872ff035151ea1&chksm=fbe028adcc97a1bbfd669e1605f2780f09953a9fb4b474292f76c06dd637ad8b2f39c1ea6cdf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506221&idx=4&sn=d64996de98c4e64aab383c28bce5872d&chksm=fbe028bfcc97a1a98b7b098e8c8bc9af2c9f70279e3260e6a79f4e84fce46010d9bf8ccedcfb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506161&idx=2&sn=4519a4c84ab01e066e4af59809759f2e&chksm=fbe02963cc97a075de1c0f5ea8470b6648558fe67e42b05b42d5ad8c46ce45d508dde9ff3cd1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506144&idx=3&sn=1c265f2312fc455bd2c755089a56b4de&chksm=fbe02972cc97a064db3354010c9f68ea5257a6cf388076e3eeb24e83ae2e11a64bbdda2999bd#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506116&idx=1&sn=d55066cdfa272987f7110231114239cc&chksm=fbe02956cc97a0403b7e14f644bced2106228484c57bc558fa4f653b49b1093481c35eac7e29#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506097&idx=2&sn=9fa48261e2f8e78b699e34104f79b63f&chksm=fbe02923cc97a0357362acec31897a563e3da881af00b20b17286104bcbb17906f390e183519#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506077&idx=3&sn=57b77d903023507acc8bb447330c5b5a&chksm=fbe0290fcc97a01978e15db493e025e64ec6ac2ae5d731492e9e477ee53b1ffba070bd8df260#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247506057&idx=3&sn=7bed2dbb41d15deda54958ea5582172c&chksm=fbe0291bcc97a00dcc3f719e5c1f23433c9d7fb6186cb0dc6620b27094e38988707c2a11bb51#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505992&idx=2&sn=d51697af84a2ce207dec8347c6acd856&chksm=fbe029dacc97a0ccee6914422d2e4d7ec855ccbf51fb16c7c7902029022d0355bbf03a55a70c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505924&idx=2&sn=a25670860b5cc9d6e045e2d2fae4b08d&chksm=fbe02996cc97a080e9829f87adcf1d04945df6319e1ac47c1b0ce17d67806d0ea8e0bc3bcd8f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505905&idx=2&sn=5f16b1f10e086582b38f8f26999dad2e&chksm=fbe02663cc97af756c1a9378d87b636fe99cf6a0685bcdbad9c5f9dde427a5d8dd637679c5d3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505885&idx=2&sn=9bc108855bcfa5db076b9136629d984f&chksm=fbe0264fcc97af59bc75e87a30ec098e713f306b9e2dd38af7d3b449f4cf22eabb18f2afbdaa#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505827&idx=3&sn=394f849f2281a46433b770555c8b045a&chksm=fbe02631cc97af2738ebce8deb9fe014c02689ac89fa06100459fdb4863af28cca05a098826b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505793&idx=3&sn=38cddaa34687464eb57617afd9ee4383&chksm=fbe02613cc97af054e578bb8c9d8b3d2b53d3a15e01a465749a10ec2f8f32e5cc36f7d090baa#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505769&idx=2&sn=1c6daf5fec219df18030dde0223b4835&chksm=fbe026fbcc97afedfaf454e603a202502471982c2f7ebea49bf0b01416284d796a856fbc9024#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505748&idx=3&sn=f355caf18ec8f6a75354877ed52171d1&chksm=fbe026c6cc97afd0ff2f8dc1bd00d34be638cf0b687166294361777387e23aaced1172a88be0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505725&idx=1&sn=3a945a3104c80f2d094143b142b7fd61&chksm=fbe026afcc97afb92e13c11376e5051c86d12883bbb9997e04871c0c0bb8a30dc6a89ecd5599#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505699&idx=2&sn=62fbefe00274a7289bd486ab31923c49&chksm=fbe026b1cc97afa703c51379dd20d3736f10b1d34c5e0efad1614539a87fbe5fe9c2e42b91a3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505682&idx=2&sn=460b831a281c07fdc9f030e9de24494b&chksm=fbe02680cc97af96e6b27e60e1248348fe23e02ee3d7513d380ca1e2b8686be14d18756fb102#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505662&idx=3&sn=0f6181ce32c21c86d0a7bdc2c0b19c4f&chksm=fbe0276ccc97ae7a5613989ab0839a55604d29e25713b086cd69b840b6095dc2871406b571f9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505625&idx=2&sn=f1cc0f5bfb1388d67367f54f8ac49f70&chksm=fbe0274bcc97ae5d136375c3277daaaffc7ad8db3b6b45502cb9769bd010a9943e7c68c33d8b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505570&idx=2&sn=83dbaf9deef5d287553d6128c81db1c5&chksm=fbe02730cc97ae26b633b3acbbfef769d859d5d0a7a8312c80014d6b54f9d09c726117e23ad2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505536&idx=3&sn=2cf639935f279ec638b846c6435ee3b6&chksm=fbe02712cc97ae04e7dd1b8e11383eeb922a4eca798cec20a4822879bf829ea21e54277f12e7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505494&idx=1&sn=bff5bf9c31cc57865a970a901dcd5881&chksm=fbe027c4cc97aed2474aa41acaf3876db80d0ace69a5fe2ff4013298a333e9f9e8aedd6fda8f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505454&idx=2&sn=ad99c3b1da24c06bcf12277fc840d916&chksm=fbe027bccc97aeaa1f5c7f6c1c99f27acc6b376fbc9003c55068cde89df1e196ce20bff0adf0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505419&idx=2&sn=77f7b89b36b88c1d89ccac66f9ccf949&chksm=fbe02799cc97ae8fd72d409b8cd5e0087b8f84b62ecb19867d1a15ac94899cbf82d5f01e340a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505365&idx=2&sn=021a75e96c0393f2199ac24181db96d1&chksm=fbe02447cc97ad5112462237214d3675e85dfd3b3b00722fc556723940a5fc71652fa6ad2161#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505320&idx=3&sn=476dd86c7d07ab9ca91dfe315fb38893&chksm=fbe0243acc97ad2cddc25d22d718cf35d6f10bffa563fdacb504df3adbb6856144f3425a972f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505252&idx=3&sn=c3c93c166d00a060e4ef24df06a16d10&chksm=fbe024f6cc97ade00ed9d5d0ca80511ef768e62f48aca2879e31d6599947d471eed99c00902f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505150&idx=2&sn=b8b8952f3b0551ecb4bb35b948700bda&chksm=fbe0256ccc97ac7a257883999456b97908fe43dc4d7f04b616168abcd188e55fa63757a0ac30#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505109&idx=3&sn=981623b26540eea7e2d4f4f5991ac40f&chksm=fbe02547cc97ac5132a9e88d74be9af879ab85ec66c4724808b67a7ef6afab19151cfefcfab3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505096&idx=2&sn=a3d871139b115c3623d73556c7b7ac62&chksm=fbe0255acc97ac4ccd82c92f438389a764b8c9148a3a6e15b8176e3c4884f39d029d2f8d459f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505083&idx=3&sn=2968b5d8d2bd09f261403a7a17485237&chksm=fbe02529cc97ac3fed2c2552d261b3700fcfdf9027a71732152314f86c40bcac6e5f0cfef908#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505077&idx=2&sn=6c862f92c7e084a843e7fdd9c61d9321&chksm=fbe02527cc97ac310a9b64bd1fc3a5823e45b217cc440d300162b24f1a099dc5e446530ef213#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505071&idx=2&sn=bdf911a93f08f29e0b0f44ae1a2c2b97&chksm=fbe0253dcc97ac2b8baa7ac52341beea7f89433bcc710aab0563e7778b2b325fb35cf983d596#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505065&idx=4&sn=6562a2239459802d818ef85e9c01444c&chksm=fbe0253bcc97ac2d37542ebafb6629fd2129aa9903c6bc3be05aaea84f816fd87b13265c7122#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505056&idx=3&sn=f20c273b124b4aa04a66f1ad2664d3a5&chksm=fbe02532cc97ac24a5135a87b17e88689728fa7db3b9552435dcc2cb8f27982f4343f8ab86e4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505056&idx=4&sn=5fca679a787a92693cb862cb58d161e9&chksm=fbe02532cc97ac240bffde89237cc1213f26654a347a643902f359e1993eabc03524d260da7f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247505001&idx=3&sn=e251e940f4b83b0f09b84e2b27a80c6b&chksm=fbe025fbcc97aced736d24d89a0d8ed3b46a8f91a582d12930fc310ea139513f82beb21268cc#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504884&idx=2&sn=5468cb24134fdbf3ebe17fe2c96f7df1&chksm=fbe02266cc97ab70f7be5296fbe8a2ebee447c4a269c9047f2772bc01cdd4aef07e9cc09b11f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504876&idx=3&sn=2d9342e2b113e118edb6c39d392b4e03&chksm=fbe0227ecc97ab68eb91ffc57af43b4fc848160e3c10419aa88181ea8e391a6d871fd9e3f759#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504870&idx=2&sn=b2a993197266182902d10a2c9534c695&chksm=fbe02274cc97ab6265482acd86cbb146d42be81170c1bee41d144eeecb356ca229971424e3e3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504863&idx=2&sn=ac3002b9a6732a5fa29bf7269c2b7fa8&chksm=fbe0224dcc97ab5b05be70ff9b134142b77593574e6ac26371fb4abc68d8bf26e6183653228d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504856&idx=2&sn=46ec2a95bd6f47f01b745f86ffaeb320&chksm=fbe0224acc97ab5c05be3a38e6b55240bba583538ec9589a2e370b02e827d8413f92c8a14e23#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504849&idx=3&sn=6259cd0957e18c3526a486a41f4ddc99&chksm=fbe02243cc97ab55d207555a6ed123cd83d4ca9188c9e1f34701f486b4d7ea71ef598112f397#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504808&idx=3&sn=df51e84b4e514f42b350835c13aa96bd&chksm=fbe0223acc97ab2c9c40f9494607b643cd68a7d4202683c3f81ace63a76b7c122d6597939162#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504801&idx=2&sn=0a83370d84a739e43ce4f49f5b6c0b36&chksm=fbe02233cc97ab252203869cac24c11ff2a3a260a4e00bf920fb1a41ac459c59c0b27f6ca5c4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504795&idx=3&sn=e3220da4eb15eaf70f6687099a774f46&chksm=fbe02209cc97ab1f81d1997b18308d7857837e04dac11de14c4a76732236a3bb3472acc2552a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504779&idx=2&sn=a845fb4221944c99dda1b553b7222857&chksm=fbe02219cc97ab0fb28fdfadc1d996aab81247a39f0b5eeaa49ce5985a3683baae7d29bd4e0a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504774&idx=2&sn=21a0d18fa5cb2644ba82405927c06119&chksm=fbe02214cc97ab02799b84b0acad02db7a80f883d22042744b54b18f74cdfed688e2d152bbd3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504769&idx=2&sn=5f008ca128621861669b3dbcd10904c5&chksm=fbe02213cc97ab05b7e5ffd5b94858f92d413ed2f6323293d65e5e9ea4ef22a48e7c221fd800#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504757&idx=2&sn=e4da5a44e11c5aec9d4c33b55a13db93&chksm=fbe022e7cc97abf10231cc03a77c2769f6c4c380b905db7c94e1bb19fa6b3a949053285ff057#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504751&idx=2&sn=37389e1a82e602147c9cce9761284e66&chksm=fbe022fdcc97abebaaa61c992715244903b62d6953f0c449210462b49de4d04de1ae2daa40ba#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504745&idx=2&sn=f0adeae1a804919df72dcb48419fba20&chksm=fbe022fbcc97abed098a1a4515a572e1eca5f05d01a92dab619da2ab316f2c20864434a1bf70#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504739&idx=3&sn=9e5cb9ad8b9fdcca6cb993008573c8ef&chksm=fbe022f1cc97abe7d7f5d5a645102bb03795a3513ca120b5110317c1881aaf4a7dfd06e836f1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504708&idx=2&sn=93e119b87e9d82f7272b38c8340617fa&chksm=fbe022d6cc97abc033c82c31ca492f9021820171e5bed7d35834f57ae27d95a29d3466856731#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504703&idx=2&sn=a09280fcaa68dccc5835df894b57aed3&chksm=fbe022adcc97abbbfb4265d50ac7b604f131849d1ee6cfd5aea3cc537f6fc3df87029a1e70e0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504664&idx=2&sn=f56a450d7208da767dd04e5bc0245545&chksm=fbe0228acc97ab9c6229fbc2d7e3a457cfd40f0658b30f4586be79c03850a9702e286c65ee66#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504637&idx=3&sn=fac362f1a7e65cbbb1eb00c29451fe95&chksm=fbe0236fcc97aa793f592dde51e3523b7c1f0b4912147d7dd7355eb0b30bd39dd54b37e273fc#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504597&idx=3&sn=fadb060694035e9b3f876ea59b3347cc&chksm=fbe02347cc97aa512b8e0a5f3aa8aefc76acef159d2ce05b8a7f7bda72e54c54adeaaa8ad3e4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504591&idx=3&sn=5c58a4ff7b139e904ff40e6e1db6ffe0&chksm=fbe0235dcc97aa4bbb4d31690e72d9454ef762cb8661670cfcc6ea3a5a0e3382ab4d22cfa61c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504584&idx=3&sn=b61e2389c5d4f6947893175767268b16&chksm=fbe0235acc97aa4c20bbf4764f08d9499837056da3e19a9b5ed857519de74d48578c8beb7173#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504577&idx=2&sn=c98e2a9cb90e8153f156d61c705a189b&chksm=fbe02353cc97aa45955b595ec1b21035edd34f5c508bb01c6e62c89aae4fecf636bbfff6900f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504524&idx=4&sn=7bb36bab8838d14d9d1c798c80ee67af&chksm=fbe0231ecc97aa083e87b09d7332e5425ac2706e8a64667d8f7ccf551a62e5081b72a6d91a42#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504479&idx=3&sn=e8aa35492d09d896b7294629b3a0ffea&chksm=fbe023cdcc97aadb1df29081490007c7fb0546314ff21f55f720f87cda610e311a8c674b7e24#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504421&idx=2&sn=ec74cefb08ecfc24e5ddfeb74540236a&chksm=fbe023b7cc97aaa1be77fc51ce249e2962274ae31194bb7d9bebf5cb3028030010f9923107d6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504414&idx=3&sn=69da6cb929cf8c6eefef494b12dfd5ba&chksm=fbe0238ccc97aa9a6228548f1f62baa7553263f1ea53e180d94801f050d80ef73426d8a4a529#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504403&idx=3&sn=20632f4d82f01c6695a1f8e5adab8a3b&chksm=fbe02381cc97aa973e680abf6a97181018c6683c8b610cbd41706af11a95635491fb0e604c74#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504389&idx=3&sn=82ad2df2ab635e2752009a51100251d6&chksm=fbe02397cc97aa8161ff3e51317c48dad44271f3c81f9865f60815c531939798e1a3260a9495#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504369&idx=3&sn=7a62b1aa8517d69226b6c70baceb8cb3&chksm=fbe02063cc97a97552e9005d318ea7e3d1df4fb746c3d99cba96643c223397cdaaaccd2ef2f8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504342&idx=3&sn=c69a8e885bf72b83e75473e1dddde027&chksm=fbe02044cc97a9524c577296a808f44705f8f14614c2fe67f10055f5c3d7220037b2599c2a5e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504268&idx=2&sn=01afcfc3fd612385e46a82671c024dbc&chksm=fbe0201ecc97a9089124ea4f3a84ae947276871881a240243aea47b849abad472d152ce631eb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504227&idx=2&sn=f3e28ea3398adc84c3e43fff7a8fa639&chksm=fbe020f1cc97a9e78537d2e60c04e8ff213928a881b331de0ec9ec040f88fdee022b65a8d355#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504205&idx=2&sn=eb7f92670e45b08e4fe79ac5027c4f91&chksm=fbe020dfcc97a9c9605307f9896dc08a918b779956e1f9d9d091f31c37b4f1a24b254aa06380#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504220&idx=2&sn=d21d2436d465d0f0b725f4c973f7080d&chksm=fbe020cecc97a9d8d34481d95ba74023a5f7f7c7bb24cb9da33d7b22c53fca566f57ac7a5607#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504214&idx=2&sn=b56f16b30a0466af0a1d2e1cdb4c261a&chksm=fbe020c4cc97a9d22a58f827bf91ff1d858cfaeac6779047536e4e24295574eb0f4654f7e91d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504195&idx=3&sn=7124d6f0b63eb45611a7c06a5915bc20&chksm=fbe020d1cc97a9c7fbb32c19288ed93b6d272348de8387f47f66e6de3a4b03c99f2f1f218289#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504162&idx=2&sn=edb87917b6b5e7301b280957b38be1dc&chksm=fbe020b0cc97a9a601b5cdb69be968dfed36c05301fa16c5ae3166e44e71ddd0d439d93e02a9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504134&idx=2&sn=93775a34210aeb92c795cda2ecdff373&chksm=fbe02094cc97a982fe45543a99aa6e804195f3f3ee08de68e9921f02edfe930f9fec97337853#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504128&idx=2&sn=faa8db14f177b36186b601846d987ba7&chksm=fbe02092cc97a98414730384316586dbb156421de665962ebdaf37a7ef900cb7effaddbeca15#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504122&idx=2&sn=c8963a1aaf4c2d502b5dfba0a3930bcc&chksm=fbe02168cc97a87e376213ca5821e1361c97750c3e1bd479eed8260969a034a53a14bfba11a0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504118&idx=2&sn=d83d53f74baf88186023ffb69eb82637&chksm=fbe02164cc97a87247e47111013dbe30216b55d4ac431d1fc4242ed99d4cb44e292ee9aa7b6b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504108&idx=2&sn=3638f870f629ba42d57c893de328adbe&chksm=fbe0217ecc97a8685793ea919c48983c4312ef00e99ba649cd5d10967c8409cc5fddde3c23ae#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504103&idx=2&sn=765e0d47ee746349b512fe3638e5f377&chksm=fbe02175cc97a8632e116c8ec7cbe8c57551360d4728b413d4c0e42c0af6470850aa554f196a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504098&idx=3&sn=ac933470a24f797b53ecb183124a2f5e&chksm=fbe02170cc97a8668821e18ad92144f2a1416ad79f08aef613c1d633cfc67d0e83d8946a795a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504057&idx=2&sn=22845ee102489c0e78ed8e3cbcedbb8b&chksm=fbe0212bcc97a83dcfb1e69b23f5a871c1e00cd08c730622673a3db33427e64cf046fd62e00e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504013&idx=3&sn=6cfe7fe06bddf07d6b166c845b0c55b0&chksm=fbe0211fcc97a809682a69030192e26f65dfe459406a78bc2f29994c43659f4125f80e52ce0b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503955&idx=4&sn=1b60171853d9587f02f9ff2781858019&chksm=fbe021c1cc97a8d72b506ecee99e0a34a0d66032dc42d1ac819b316d5def1d80d2910166ff36#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503942&idx=3&sn=bf7f6e569be341fb076dc059d7bb1708&chksm=fbe021d4cc97a8c2bf1cdfc602d7df2852071c05fb24a3a0bdb1605fd050782ba639856fa6ef#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503927&idx=2&sn=a1f2b5165e5928cd629b5d87af9b5fca&chksm=fbe021a5cc97a8b35018b2b3036d19caa1bb6fa5e04abfe9949e42b4166e574f97ed4aeb1835#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503889&idx=3&sn=ac986f3afe828326658c7075b8e823fa&chksm=fbe02183cc97a895acb0a3a5532d072c0243b439d861d849ff7f43f3db10e30178d761e8257f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503884&idx=1&sn=379a51f96853e5538910280d918afc28&chksm=fbe0219ecc97a8882d0168baeb30d52ddbed84e60a2fe190b6a46bfd08c08f6fd43d658383f7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503854&idx=4&sn=4356b7f4070d15747d94acae4920008a&chksm=fbe03e7ccc97b76afda56ee4da9137d8a01c70fb84fdb42bc625a70a4b01ba171741b713f344#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503814&idx=3&sn=76e2777214ca53fd2c1b2cbc9c3c259c&chksm=fbe03e54cc97b742d78bb70d29c2f968513afb1204fe3f52b9a50b1376f29d7af5b320e0257d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503793&idx=3&sn=dc39fd2c171da6012428c642c57f02c9&chksm=fbe03e23cc97b735e75c044593f88d527955fe13b4c33422c49f3d38ecd94e086cb0e7ad757f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503784&idx=2&sn=53396f69ec5976525ad622ee6ffe7b80&chksm=fbe03e3acc97b72cfbb123dcf6382fb75c5b0951861e8c8779c9cd6b8e52467d3c1a024c93d2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503781&idx=3&sn=91d1272ca213066283d16291e6f4085a&chksm=fbe03e37cc97b7219ea8552b338ce792e3e6aec5a3c9397b58d404e9dd7901aa872618b89ac1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503701&idx=3&sn=764c2289490b84021b2832a723fedbb1&chksm=fbe03ec7cc97b7d138facba8e92b0d273729345a94e79ba989708b150fbf33764280f9d6260b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503671&idx=3&sn=b9eda43be7d080c6178844b0b24b58b1&chksm=fbe03ea5cc97b7b31c1b8ca9bcb0249b9c4be220a1af09dd2f38f45095eeb5bbc00b8cd4d6b3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503595&idx=3&sn=e9f563fc92c766cfc9306b9c6d526642&chksm=fbe03f79cc97b66fcd51626a730e0645cb20bd48f7ac53c75520316e8e6ecd1e64e1ab35fb01#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503297&idx=3&sn=888246f9e95e5583ba0356d571c4e5fb&chksm=fbe03c53cc97b5450a4825bc047cfa9ba26b87bfdeeab36c9f73d3e29a3d645e6c50f2172eb8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503289&idx=3&sn=4f42616e497c194fff4fc37d4963324f&chksm=fbe03c2bcc97b53df71418c5c3c052b2b4c29ddd44023c269a62e70b2829b92fabf2f0236d2c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503277&idx=3&sn=f7d64877b03da32c6f987b5cf676221a&chksm=fbe03c3fcc97b5293bab7d2aeb119602ec15e742427511ab98edba2cb00c98f84227cd7e33fe#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503266&idx=3&sn=f563a31f6f3d55dca69c1bdb8a57957b&chksm=fbe03c30cc97b526d2b745c42b4d88b03ad5caabf7aa6bd2ffff01537dda02e881bafcfb5494#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503257&idx=3&sn=c6f0c5691f34f52b6bca70b57b5b79cd&chksm=fbe03c0bcc97b51d3825009fa9f210ef9f1e5b390b5a9ecf52d6dd826e8e70c51485d6548563#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503251&idx=3&sn=cbe75947432f4f26033ffc41e0974250&chksm=fbe03c01cc97b517464aa74b6d99377cccbfb6e26b0c578ffbe33f543449423c8d7cad6e79e7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503234&idx=3&sn=89e534cbe609263cff712a99d58e86fa&chksm=fbe03c10cc97b5064d309b55593bc84fa732de9bf7ffec0a024c5a7156777eb4d56ec034422c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503172&idx=3&sn=fa5cdbddfb0d0546a8afa37320da925f&chksm=fbe03cd6cc97b5c09e7d1308d401ec4a8c0352dc2d050f4a8229acf7a628590234b00d8d65eb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503113&idx=3&sn=bd1810ed01e8733c2208117b7c254bdd&chksm=fbe03c9bcc97b58d295016e5a48286c960a2e2c917835c03f23a9eea94d902ca335dd221a8ae#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503099&idx=2&sn=2dbca99f30d1a34b1129ddc31368977a&chksm=fbe03d69cc97b47ff9f468a7dca32940ecf38e5bde7154a8dbb02115ba3874021bc51c03f383#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503075&idx=3&sn=871249dd71a430b55c2797b84084d7ce&chksm=fbe03d71cc97b46784a33251b978e533e4c38ee5dc660033323bbd3e7437f6aa7f6eb363542b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503033&idx=2&sn=e413c244d519c5022293389c7dc7518c&chksm=fbe03d2bcc97b43d531232904cd0610da952ac72c35c013a554a3600f10e2920261189943077#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503008&idx=2&sn=e74b1c188f9af60b5d5e70814c8809e9&chksm=fbe03d32cc97b42448dbb89c2d29219fcc68cfaedc4ad2e4c164825999950b258afff204a6e5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502961&idx=1&sn=43df848d28292d66d0d349587bb3ece7&chksm=fbe03de3cc97b4f5c860d0d3e22902cff0171f2244dcc0dec5740f6495a56f3fd8324015809c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502952&idx=3&sn=c99429b5e13af7555c6296dfc1477eef&chksm=fbe03dfacc97b4ec065f2d9f876e345578b5bce02ae32533d93755a45c1a0f5d7988d7739c8b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502926&idx=3&sn=c96e47f12891feb1f925026f7315c100&chksm=fbe03ddccc97b4cac347a8ef953645bbb3857e5d859a8bb5be714b70fde81e95c524a46854ac#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502851&idx=2&sn=7ee61da581c8024fb5852470c02070e5&chksm=fbe03d91cc97b4872076b679d4fbf63218f019b27c6a6c307d5d8a3119ef3bf4c4eddeaffefc#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502842&idx=2&sn=3f1c5c9ec8fa97aa6090d43eee928217&chksm=fbe03a68cc97b37e5b7bb42801967474b2f426d6963fa6c6b15a64a5633dcda825fc79a4e6bf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502832&idx=2&sn=00577369221a0815f97e8b689468d5c9&chksm=fbe03a62cc97b374b731ecbcf912d0c927375177738eadb718c59c3c6ab08d4474eef9c080c4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502822&idx=2&sn=129c5d5225da1e32bb7c494397d01ae1&chksm=fbe03a74cc97b3625b7010dc9c5fef89bc8e4ee58083fc28073431366df87e7b1419362f4347#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502811&idx=3&sn=4aca5c1fb398c18a22ccdd220a5752cd&chksm=fbe03a49cc97b35f01aec41544d8c0ee9e600a98d946d9ed8742f5759312db0bafac130878e5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502789&idx=2&sn=5b22c36738e36a56b61cef442eb5bae5&chksm=fbe03a57cc97b34108f460766977bbd26392f9e0685a1e9eba961590cbf0d591cc9e8bc391e0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502768&idx=2&sn=506f560d57e26045a58fbc6214fbe76f&chksm=fbe03a22cc97b334d12de44031c5a9d79ea1bb474fd5caeb74818e95c05db3cf8148eb23cf89#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502723&idx=3&sn=294977c5f3f006187e7efc1ae33b1910&chksm=fbe03a11cc97b3077077a0666bd86490c86d01ced7eafbffe1de4a90bad8cab89f6ee6365f25#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502693&idx=2&sn=dffde9b23debd104876d878bc0e8e04e&chksm=fbe03af7cc97b3e195c43493e4c905d140638defc6bc1eb9ada8a2541f40746812541bfd89bb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502687&idx=2&sn=1de79e08888a16dc0b8c02cadf5f3758&chksm=fbe03acdcc97b3dbe26d4ffbe5a75e4a43a76946a0b5a78b6d2ddb99bcb54eacf528cabb7c2d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502677&idx=2&sn=22c049553e8627c4bc4c938c5da155fd&chksm=fbe03ac7cc97b3d14b340bea0c090f5c5555699ebc9d850d64d37f3dd536b5aca1445cf9fa09#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502648&idx=1&sn=ed4470fcb64bc45881bf1ecf55a5dedf&chksm=fbe03aaacc97b3bcf1914e835825a2f16cd651082fd1338aae33c1d46aa45834a97243da38b2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502625&idx=2&sn=4460b1ed1e880241b77cbe0e5e901cba&chksm=fbe03ab3cc97b3a52f3d77c3a933c5f31bb660febc4b7e79960a0ad2571fdbb9e4b4b5e3eccb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502615&idx=2&sn=f20e8840e461b3b73b331f8bd92fd1be&chksm=fbe03a85cc97b3930efb8a38731b05a95c558bdbd7fab405d8159d6e6c1ad40ff78b1b6571e9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502605&idx=3&sn=4008350f202e337584d2fac9bceffb09&chksm=fbe03a9fcc97b38910b8b93c653a7bb6b01fa03408f5a259484b92a38c1b000560cd3660af03#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502591&idx=3&sn=d9cd678e33273b3f030364d37c521461&chksm=fbe03b6dcc97b27bee49a8299d219f99ccdd23b3927be3050af19ccba18b676d7e218f9807cd#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502579&idx=2&sn=77e28432f3a232722a13b4cd068b5740&chksm=fbe03b61cc97b277e4d7b24801281ff7a38f08ab76e978dfd015f33f87681475928089e2cd7d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502572&idx=2&sn=f0cb2c7367c78ff9ed369086ede5908c&chksm=fbe03b7ecc97b268924a2f7250a6f82f7f26264e38265a90f3603ab9c29ca956be666ec329df#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502560&idx=3&sn=51f52d78224e69429a9981f4b73d2906&chksm=fbe03b72cc97b2641eb216a63bec0a40ad6c5a5c5e8c2b9351432cbdf076cf11d93b19e196ec#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502509&idx=3&sn=c67b444381d047f2723531a771d5f4ba&chksm=fbe03b3fcc97b229cca49333e66f59bfdb27d4e8c239b295e336434e16a376d29a88189b1536#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502408&idx=5&sn=db239c34e374a16fff830dc090738ece&chksm=fbe03bdacc97b2cc92a1d42c49727ee712e256865a2b56673b23a9d09988be8b254076be9820#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502309&idx=2&sn=25c84014b5c44d18b111f4b29915ba55&chksm=fbe03877cc97b161ab687bc138fb804514c4848eee9189a4562b1e01425c754f59fbc817e818#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502309&idx=3&sn=c58508ac82a485be03f5e78013d775f2&chksm=fbe03877cc97b161f88bfb0acca340df6ba7180abf8ca9fa5f12c1acc3246799f5d46b356105#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502290&idx=3&sn=0aa5da2bc07dd1862dc5dfb783e69155&chksm=fbe03840cc97b1563c63532aba6bd2c856dee476806b21927746584e88dd83d8ccb382d62783#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502257&idx=2&sn=017960955601ebc93af4d1851461f9f4&chksm=fbe03823cc97b135e1ca1a05441a76e0dd2cf99356e15340f8f9be9b03d51762f8aa9d3ad31e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502234&idx=2&sn=d07f1ddd908a94d6bfd8d944aef1354b&chksm=fbe03808cc97b11ead2d281cfc62bda746601107640130c0055ad0a567da07335a037e3f4597#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502218&idx=3&sn=fd62a7929565cf9e241998e23d1724c6&chksm=fbe03818cc97b10e593d3f31b5b0f222c908d2685e5a0afc9d60c98e2d3c4d60f83f3222a87b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502203&idx=3&sn=b79810e50d690f4c60bc44f9231210fa&chksm=fbe038e9cc97b1ffb5bc1f616592bd46faf89839cd92e7adceefc8662ea11049912c507c21ee#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502195&idx=3&sn=cdc57d884bf31d02a5a89ddeeb09147b&chksm=fbe038e1cc97b1f79892f4ef26dea5bf0985af70e61d5f34d1402377e83befcf632262a29209#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502185&idx=3&sn=38b156a4c740117409d7d181d6825fe4&chksm=fbe038fbcc97b1edf3034d0f56a46fb1a4451e1e7e41a438dab49c7cdeb98663e168879054a1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502173&idx=3&sn=af8e3a1f07ad81ffc4cbfe30428c6685&chksm=fbe038cfcc97b1d9f1a1921b49540033c80272c4a2a9638af73979ca6f0760d0e5a729c7f4a1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502159&idx=3&sn=65e064118fc9fae170cdde344f5676e4&chksm=fbe038ddcc97b1cbf872b91040e9b36d90eecfa0704704fcc2631ddfb85e625683e8196d0ad8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502138&idx=2&sn=e9427be9963b410b49e501e43c227984&chksm=fbe038a8cc97b1beb4bd321babc5c663f08662e9f32964b0b1e944c6392ba4c3c4a710256c36#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502131&idx=2&sn=a82e1f3136e5be690e228c2227683188&chksm=fbe038a1cc97b1b76434bbf1bdcf24d3de516b323b4682e65a1bb97fe40b4ac646a9be5d925b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502094&idx=3&sn=ab69b388c876a6a0c1bcfe8416bdec82&chksm=fbe0389ccc97b18a14554cf36cf12066add1514cf66eb396e4ce95a8146277e1f3e00d43f996#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502061&idx=2&sn=0005db3e7283b8ed24a2e27c68aeea45&chksm=fbe0397fcc97b069c96a5279e7efc04e129478de6c86ffd06647d6bd4c4a4997fb97f55d42d4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502051&idx=2&sn=0c5eae85ca3698f32d5be15117de03f6&chksm=fbe03971cc97b067b2587e768bb51ac418f7a060f684ef087090cc9c6482979e42ccc7922bb2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502036&idx=3&sn=9445140d2f48e2b8770dbd437e929063&chksm=fbe03946cc97b0501745151a95d7fd68d60c0e303cc4ec3677fa2f1278df03c904fd16df975e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247502026&idx=3&sn=c43bf5dc72922121721abb5a2c999153&chksm=fbe03958cc97b04eae0ca815057e9f3f3eddfab6e4b1431f3b2a26439246523d5beb8857c96b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501942&idx=3&sn=c26af21802756585b43cbee1ddf01cb0&chksm=fbe039e4cc97b0f2db8b9995aca6a8efd1ef05eb6f99de96b81b6cf272a44522af00221ccc26#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501934&idx=3&sn=c5d29fc94dc13a5f16d6e15d4c1d50ec&chksm=fbe039fccc97b0ea86e2df268e058f6058be81346ea9855c78f60b22b71fa13fcf1aba7e33dc#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501923&idx=2&sn=a3abba17860747db77220308092f6400&chksm=fbe039f1cc97b0e7ac60c467365922edb1194f0f9bea477cb436369948a392f994527627d149#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501912&idx=3&sn=80915741d48251a47a7670a9b95df897&chksm=fbe039cacc97b0dc037a9264103a24aa52b5590b0b2c079db1ea7aa330cbf25ca2bc415fbc44#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501804&idx=3&sn=89e7493b024ca0517e5d01dbcafae5a2&chksm=fbe0367ecc97bf681c5c02bc4c441c682b4f94f5bdfacaf2653105c055712c0845715c9489ff#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501793&idx=3&sn=ed7b7adda8a0b85f282fbd474a888b8b&chksm=fbe03673cc97bf653df8934db67ef8334b6cb133ce89341dd292340709a041c4fdfef0024918#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501767&idx=4&sn=e67c487a47cdd0e84feb54c733a0eb07&chksm=fbe03655cc97bf4341e82de5caf87669dfab36c76f55c5a4764e7ba842d6a2fd7d7fd663b823#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501706&idx=2&sn=48dcad599726aeb8b4b1938d5fab3ba9&chksm=fbe03618cc97bf0ead1b3aef70ed96a1391efa1132dc1cc73f9a0251647352e1c0a07366f873#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501681&idx=2&sn=360270c06f5413229f5699466afd0b62&chksm=fbe036e3cc97bff5e97bd2ac58e63255a48ecd7a4fbc5296e1b07e0f57686266dac35617fc34#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501700&idx=2&sn=2ab1d0271121346cab8ce6d2b45e64a2&chksm=fbe03616cc97bf00384d1feb0713e7413f4263940a401e0a1336db586163c6fcfe3c0400d881#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501691&idx=2&sn=741a4e70d3727d7f5a41852de2f0adf6&chksm=fbe036e9cc97bfff1202d6b23874bb550773e97fb1c1c38446bff099fda7bd7d326adb9a4be0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501666&idx=2&sn=48909e86c249c782111284e507e023d7&chksm=fbe036f0cc97bfe60f8ac1da39bbf4128488e0f1cfb52dbd08bc0c084829aebebe2253b873b1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501657&idx=2&sn=3124a83bfa8b049619f1dc1996cc0211&chksm=fbe036cbcc97bfdddc01ffc26e0d0efb7a6e5501d6f5fe7485108716bc34e145c1e299fb7be4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501647&idx=4&sn=63676c0c41510a0758e6138e3b438425&chksm=fbe036ddcc97bfcbeebf175cfb98837b885d076ef61615950b5f88b864fc7438676fcaeb4c5c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501647&idx=5&sn=f2a5b4d8fc85b1f786a74c3f3dd103aa&chksm=fbe036ddcc97bfcbd64b0aa3b3890ed2a5ecfc807efe3006608602c2bb41df16388d02d4367c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501584&idx=2&sn=131201c0ce3444b2c069a0be561d1d53&chksm=fbe03682cc97bf940a111da549c3c40de9b70d3605359ff27140735403c64df004074173b9e6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501509&idx=3&sn=6621bf473dd2036a2e3d2e08eba72205&chksm=fbe03757cc97be4138e31ecf480a0a4656721db02cf3c5b73973cb56227b06bd10e03587bff2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501496&idx=3&sn=8969045b295e9334564be060ac802ee8&chksm=fbe0372acc97be3cd0e1ee9fe16f29272fc4f6addcb30f7a9c8816f8e4fb7067c92e58ba82ce#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501475&idx=2&sn=f9c4ec236a13bda2e9fd64ce96075017&chksm=fbe03731cc97be27cbae29a1af919c5c9b2b33782086f64326936c1159966f415f675dc6ff9f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501466&idx=2&sn=89a1ce743c8865c28675aa37a189047f&chksm=fbe03708cc97be1e592ab33ddf246db6fdb79435c25ac163387c5a7b62476ad9a53635a3d578#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501455&idx=2&sn=b01c3d677381991e70192012bbde3d2a&chksm=fbe0371dcc97be0b9db6746fbcbbdaabf46f8aab0e797747904d72ae5126328f3caa451899a7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501433&idx=3&sn=571c2b72f4514f60d92505cfc46b16d1&chksm=fbe037ebcc97befd9ba7129b6e7111b1ae8f78dd377d51289cee61e2de488a4335dc239a8c4f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501416&idx=3&sn=eb2392544fc02089d3e71de527aefe4d&chksm=fbe037facc97beec207c83d6245d819ce955df568d1579f6687056ef9fa68854cf80dfe7805a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501406&idx=3&sn=4ca9e1066cf44422862eb5ab2f334422&chksm=fbe037cccc97bedaddd662fc564b99cef155247f740ff7ff316441f7cc346dee248a2c74487e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501388&idx=2&sn=25370b9df43e3039f465dc657b1acacd&chksm=fbe037decc97bec840a55d87a629f3254178c35147d4365e21613afcc5b63b99a9fe05e37bf7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501373&idx=1&sn=5ff710167b56f01339595daac3aa722a&chksm=fbe037afcc97beb97e910ca1371d7d4e078d684fd7caccc6c4354a72d976393bde6bf7a8fde2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501370&idx=2&sn=49cc7b27b06eaa871c82ce8cf13a0d83&chksm=fbe037a8cc97bebeee154a549768cf4c6ae1f1b468f35422583f3904feb90b99b64d7e3ce3b3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501353&idx=2&sn=d81fc159929a1f31beb981d31a855e74&chksm=fbe037bbcc97beade65969af60d21d4cf426f12b5acf2b3eb7e9216fcbc98902e0fb0ed3da19#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501346&idx=2&sn=f8391764149af58226c1014411309276&chksm=fbe037b0cc97bea651dc36a0551df780dbf4f7ea841acf8ce30749f473288e1f325fe1f8fd49#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501338&idx=2&sn=0e9b43713639aa276d0547ce026c16f0&chksm=fbe03788cc97be9eb18f60abddf8a5e001a266d735817d5f4f2025ade70df4fa1a151e224217#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501327&idx=2&sn=af2900140dbf7b269090798a13511aba&chksm=fbe0379dcc97be8b6888376d7d7d75d9a1e80388d7ad7fabb13b0ec4c2bdee421fec2f5e4360#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501327&idx=3&sn=445cbad0c7eb1f3bf26d16386307d796&chksm=fbe0379dcc97be8b191432b5fa98a64cb02e9ddada4e4358eb98cb66879ba9bce3d997269e7a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501303&idx=2&sn=f783fdd8f967fda7b0835665f46f7aad&chksm=fbe03465cc97bd73b70c7f1250366ea8d073446d57eebaa24516219c25c81e8a72017e30870c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501296&idx=2&sn=9da314b19c3e6268727a56b622ceb191&chksm=fbe03462cc97bd7420b68d101cf829d1eea5eba45f76137157c0c52cac75cc3f9a761b580865#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501275&idx=2&sn=99f993722be516fec57c627c1da395c0&chksm=fbe03449cc97bd5f4989c9b3f16f3432eec8392be563c88615e904cd74087dc079cf80c83229#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501267&idx=3&sn=df07e65c5e980bbdf464da55d6714f31&chksm=fbe03441cc97bd57acfceecc39e3a6e0b3ee9238a3218c1eac3670a1cc134b8432b99dd648ea#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501251&idx=3&sn=827341d26855d00703bf5df5e21b055f&chksm=fbe03451cc97bd472e82928828dfc70f91bc1ebf2dbd05a60256c50d6b0c36336b26a10adbe0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501242&idx=3&sn=961639371714fee99e13de4aab4c33e9&chksm=fbe03428cc97bd3e5c5fe54746ac4d462477effb14969faf203895bfbe7079e1363feb0ae4ca#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501233&idx=2&sn=f37059395acffe2a52dda950fa50107b&chksm=fbe03423cc97bd35d6552cb1703e6bc2eaf570080dd81944db369851a178d5b3db261a203413#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501225&idx=2&sn=268d7f8bff8da3256daf94a373d7b87c&chksm=fbe0343bcc97bd2d383882bdd7fa7eadb63ece6cc195e657909b8eb6b1d404b933a291b871e1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501216&idx=3&sn=cf19af150a3e9e5b3ec76cdb77c837cf&chksm=fbe03432cc97bd2473d8ab2229cfdf37cda71b7150ee46276c7822ecb014ae84487ac004e24e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501198&idx=3&sn=6da2b5eea4db84f182ff019871cbfa07&chksm=fbe0341ccc97bd0ace8c356ad81e49302cb53d89355ec2310767daf032203cf872c3b942e5ff#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501187&idx=3&sn=c4ebd5d336c1121f96086fa13eb7d383&chksm=fbe03411cc97bd07f02f0e4b43e0711d99eff266569095f3adcbad6f401420743e211b6a715f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501173&idx=3&sn=516cb828684654ceca9ac6fa1c3904c9&chksm=fbe034e7cc97bdf1181a726173b64091fbce6207b4ff8059cbad38787d39d1942f8503732fa1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501124&idx=3&sn=bc75001bdd4638b4ad069d72fdd6d1ec&chksm=fbe034d6cc97bdc04302dc99cbae228a3abf0ed2d4267bb526237d52ae1942186f7af482ec7d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501109&idx=2&sn=c4ed01e9cccbf44c3435bcecd47ac0a8&chksm=fbe034a7cc97bdb1310ad7e177608cc0fe3105c94f67d00afe4f38e53486939378d5d9fbe629#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501100&idx=2&sn=bb3b5ff5ddcde9d412c336269d88ea48&chksm=fbe034becc97bda8732de187e2ba35cc7e9bef915d380670ee4a95cca0b7b20dec29f4429941#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247501035&idx=2&sn=8b79d1a5454c220726f6dd05244b840a&chksm=fbe03579cc97bc6f22e8625b188cd2eace5971387fca13acecaed430439e207460776a569f2b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500984&idx=2&sn=308e62dd5b463ce08ef9603c130a453d&chksm=fbe0352acc97bc3cd2ef11a0672bc6a3f9380f073986ab18918baeeeb9978e0d9573c0de4eaa#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500975&idx=3&sn=0d9908fc66502dda05447b0e1880d158&chksm=fbe0353dcc97bc2ba881b28610bc5947ea1394e07f9ebb3bfd6e60fa905fa2e5cbf9875acd09#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500957&idx=2&sn=d588958dd8e87b9648a270d005fd9621&chksm=fbe0350fcc97bc1963e8bd98316d0b82ac876e0f512bb23f18698746dc5a0712dcb08842a9f2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500947&idx=2&sn=7981ba629fc27bbb31d2f3c9f5cd5f73&chksm=fbe03501cc97bc179d800d14f29e8a15fb7fe03aaa00ac933ddc0e67aeabe927b0cf0b98b9c9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500938&idx=3&sn=17375de2035f704da4e8cf0cb66971f3&chksm=fbe03518cc97bc0e2786d057b86bf5870ed1a53c079281f274865272fab99f8415640742e997#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500930&idx=2&sn=9af294f9f8ed6fae04ed4382e8b987fa&chksm=fbe03510cc97bc0615b7198a930802fa29ca09290332f23a1abeac7f75aa7989220694672d79#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500918&idx=2&sn=4514bc06558d6df5b79867322c055e8a&chksm=fbe035e4cc97bcf2b816ef633cc4c0bf92dee029fb70741f2ad639c95da1dad0447c0aacd390#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500847&idx=2&sn=262cba0e7f0a34b1b9dca297e6e39dc1&chksm=fbe035bdcc97bcab74242f69e3e17b533808d935cb0d1feeefb90040e692363f310fff3272ed#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500837&idx=2&sn=956d934f1f15fcef91bb863fcb60a9ce&chksm=fbe035b7cc97bca112ac2db5ac01da69d529cdb62591aa41c413fcd26d23742aadc814b92548#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500828&idx=2&sn=d77b04897b7490d86c214ca45e7d5e78&chksm=fbe0358ecc97bc98a5a62ae2e154f273950f213df3bee676e6fd172aeec7b2718eba859d1af4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500822&idx=2&sn=31fe43f059acc27dec81be916b4bf668&chksm=fbe03584cc97bc924321c0efd9c6fdb81533e5dc631ed260e65bf9bdfa22fd58abfbac746134#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500811&idx=3&sn=353419fd5f1d0e4b75f2c2a570961832&chksm=fbe03599cc97bc8ffd9b52c647310ffb56d1003d01891a34389329325ec821e22ac89813a196#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500730&idx=3&sn=25e931709e4a38ef060bda1ed1852751&chksm=fbe03228cc97bb3e19a9968bfb8d4e24a54341f9e4d886f2fc6e2bfc5ab2a1d750d5c746aced#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500718&idx=3&sn=98a83faa2db2f1c845c4759e998aa391&chksm=fbe0323ccc97bb2a04dedf214221b1ff62bcfaae1c4a6442a75226575477b02ea265a9d1c64d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500650&idx=3&sn=444ea0b248c153f434d16ce81b5fbb2d&chksm=fbe032f8cc97bbee7b28643e5caac2b43419982c9dd78c30252f1193afdf8db608a2f3b4e722#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500631&idx=2&sn=5930e7c18410cc7b746eb8bd83000bcd&chksm=fbe032c5cc97bbd3a6032acbc71c66ef1b89814f97b14127e7b2e9f4b4d5ad21af00efeed8df#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500598&idx=2&sn=e9231d993aa86ac67929db2edb9991bd&chksm=fbe032a4cc97bbb2f8dc9042b17ef25a5fb11678ced8d3dfbeb7bee5b7e99c2dc02897f0d615#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500592&idx=2&sn=926dea25940f6905b9abdf8aa5635c9a&chksm=fbe032a2cc97bbb40baa319769e9c3a675c51a65b6755906c4830cd1e9102f21fc3e7d8573ba#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500583&idx=2&sn=28a4bad2ccde597534d9a330ce30a386&chksm=fbe032b5cc97bba3ce11919f844b59f15d4dae493e347df681139e256044cad8300640726123#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500575&idx=3&sn=ce09a6e18ae77f196f9eee965e992fa3&chksm=fbe0328dcc97bb9b7ccac9a615c19f6dd05d001e40530718bb83d7dafbd53a6e49110f5a9670#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500462&idx=3&sn=1baef189a2f66510a51986d7ff25f618&chksm=fbe0333ccc97ba2a811d74ca4fbd4415fb3db43da6a687267de45a673f65f28b0e1a0e644264#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500402&idx=3&sn=a02b992c757dac7da957f84f8a96e4ec&chksm=fbe033e0cc97baf6335e9c5ce2ae544179a85be779d0affcb83d351128a60180c465b30796d4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500367&idx=3&sn=9b5a0f358704646648346a4355c4251f&chksm=fbe033ddcc97bacb3949858517b10902eafda0cca7ed9e0c0eb923d25dd7bc2031264ae3835b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500357&idx=3&sn=84a69c5ad722780d2a4fc3f695f01766&chksm=fbe033d7cc97bac1019594b8d7741a3fa217f9ea73ccd39073ab69dba0633627ece89a8543e6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500349&idx=2&sn=e280c15bca010c37a186d4ee88ab2c6e&chksm=fbe033afcc97bab980f59403a3e82eb615d37901d6c4f84c8a2b0e98a96504bbd34452a49cbf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500331&idx=3&sn=5ff740f429f3272f95afb9f6aec1783b&chksm=fbe033b9cc97baaf50e215687c7b0d11799ae51dfcf13b665d0dee74a473059a1bf6a9828a13#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500217&idx=3&sn=1e7b515c53f5e39b1e6b8b2d7e30fff0&chksm=fbe0302bcc97b93d955a9557719d8824c25dcaad7ba2ab9ab7647857caf0f08482bb73f28527#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500192&idx=3&sn=0bc3be4b3b7c26b0b267454aff1f2f78&chksm=fbe03032cc97b924710129a5136787949d291b5be9369e4a5f85af95caacb53ce669ed1441dc#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500125&idx=3&sn=c89c892425f3ce9504aa8e688167bd47&chksm=fbe030cfcc97b9d92069410ba4f0e84430f157d1985697bfe6420e8f855c793262513cb1bbbf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500108&idx=3&sn=053e9f7c5ddc63a59e8d12324a5e55d3&chksm=fbe030decc97b9c8b2877db051f50ec5973779668ca1e4a395b14236e0af69040ed9d88c9de5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500091&idx=2&sn=aa983ea0cdc7d5ef5f073a155c86516c&chksm=fbe030a9cc97b9bfb19f7f722e04e66bf249fedb6c39f9ed5943b8ab33c816498c139468a153#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500042&idx=3&sn=97679a6c48ebd557113e528854203e54&chksm=fbe03098cc97b98e5cfb011faa1afaeb9758938ed13f47c000dc86378c7d31320ac68bcd387c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500020&idx=2&sn=b10212cab639ba0b69f330d61ad05afb&chksm=fbe03166cc97b870e72b55aeac25e4967c5f57dfca025b9da82ad6aa7c081a369c3d59e9ee4b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500013&idx=2&sn=7b0689653783c5be79eee6a570e4184f&chksm=fbe0317fcc97b8696fc6929cf5a36ddd8d83e0c66c5a051d1bdb5ce862eb1d3dfb39791dd606#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247500004&idx=2&sn=2314398d5db2d833e378bf4a99abb7a9&chksm=fbe03176cc97b860a7e7ba3a16554a6e811d4878232a792774029d05c9ee33a5009b10084930#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499994&idx=2&sn=871a5d56588d2963adb9e5f84e55dccb&chksm=fbe03148cc97b85e72b9285765ab4252463e5eeb686fe07f78caa5ba9751aad4adce86142874#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499980&idx=1&sn=92db9d3fc4a652b3a1fd93e91d4d237f&chksm=fbe0315ecc97b84880723735ee4eb62a09c66955013caac64bf56557123938f40c55b4778979#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499976&idx=2&sn=53a2c586fb767401ac5d7c49c4a0f8bf&chksm=fbe0315acc97b84cf07e603b70e7264fea20ca0dda9608f37e9b167555604c19e314f74bc8c0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499968&idx=3&sn=36b0906dba109b8b7316f0c0cb2e4932&chksm=fbe03152cc97b844647fab7db743dc7905f938bc0c37cedca99f3eb5323e6bb49fe3670b382c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499961&idx=3&sn=db422d47b5a40d050500dbfdfad33a76&chksm=fbe0312bcc97b83dafb8d81635eef43ac224025e7357413a817c34efb809282a8853f71a3891#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499952&idx=3&sn=71e8528d6e766887b5749beee6e038b6&chksm=fbe03122cc97b834e25e066131eb6a1ad8c22483115ae8c91b7a9f0eab9d039c3661abfe6820#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499944&idx=2&sn=1f64187a180eb0d745f0fef02c7c0155&chksm=fbe0313acc97b82ce729e780ad1bd771d77eb9533d3966ee6a896b5ad9a6b23bd4401220357b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499938&idx=3&sn=7c0ee628924135d0fd1fc73ad128ed80&chksm=fbe03130cc97b826b489a8be9218a154f6a5b499fe948af1d37054227be822766f55b6a30934#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499928&idx=4&sn=b08ac13a5c95fe4da8c5122d377d21fd&chksm=fbe0310acc97b81ca016d9acf0e42d53e85a0f328a46da86b3cd848c90a618ce11d02f18c160#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499867&idx=3&sn=0b4fbda8e3e1c1004943cdfd4e1cb096&chksm=fbe031c9cc97b8df4d81f786e7fb5c42edc3c8ace3a64089e3a9815a9bacc437dc73b27e4cc3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499766&idx=2&sn=98f8cd009d6194ccf6282ee003a704dc&chksm=fbe00e64cc9787729d5f5cbad247b25b656a53c7e4e0b44154e8b5da694a17239f297b82fbe9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499757&idx=3&sn=82c59ef529d6c9e8589fd0a468ecf89d&chksm=fbe00e7fcc9787691f93337c0e0e5cc5dd00f0c906495cbeef5af4609da6d2ae204fb6ab6f00#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499726&idx=3&sn=f81e324ce28e4eb8798fb2cbed9a1a2b&chksm=fbe00e5ccc97874a191ed0439a302344829c401518ec6e45ff80b05232c21213c9178adaad35#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499601&idx=4&sn=5a3f5c1e367cd61bbcd6da6b2cc63e5c&chksm=fbe00ec3cc9787d575097fdc1c72f12e6315b7fdc2b09fee54d19a06554f5a6c11156d401d8f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499569&idx=4&sn=8a5c8161704785949e20e278ba8351de&chksm=fbe00ea3cc9787b503c96165b69f1ccdfab4550fdfc6ec1ea82ad73bc8acd81096d11b0be204#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499499&idx=4&sn=81da4d707f25b760df2b37c0099f4eb4&chksm=fbe00f79cc97866ffbf9a83b4dd5d5f1b021fc5269bb288d052eea4c6e9ae44657511cfe7ea6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499436&idx=3&sn=eff83b419d40281430d74c81cb1257db&chksm=fbe00f3ecc978628888646743b2bd6ae93202ac22626bad54679c587ee267500a98a7407cfb8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499425&idx=2&sn=83f9017e8d6310d9553e662e74eaaf2a&chksm=fbe00f33cc9786255171fd6ef4aafd7b8b34816b1c9facd429bac4cb0d9dabd6c67306fef68b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499410&idx=3&sn=922240e461e64f171e8e342dcf4aba23&chksm=fbe00f00cc978616bbcb534974883c7b0599c27234a4da9f6e38c224ccfeb7efca1903c9110a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499337&idx=3&sn=e98131be87292ea1f79b8ccf98b55e01&chksm=fbe00fdbcc9786cd08f402ee9be4feb73d55a1f8740f0252179d7013bfb54965e302642bdd91#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499154&idx=3&sn=a1241b85a3a322ef5c1b66dc1e747f24&chksm=fbe00c00cc9785162c3d684d3d135cf97a57495e8c38d002ba6e7f3d1bbcaab29ae9b0908757#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247499111&idx=2&sn=b20c9813844eaf77abd6eb63d655f528&chksm=fbe00cf5cc9785e381f2c79fb9f43bf3aa8efc19610914cc4453d0d8dea311279c319b446cf8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498934&idx=2&sn=4cee45a346c20c7fa18fafd85c2ef25e&chksm=fbe00d24cc9784322bcf64a53e1a6367f52348eddb62e5e799bbfb983bdd8e1c4d795434c11e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498884&idx=2&sn=4669501ef542c9faaaa026d124b61b37&chksm=fbe00d16cc978400c867e0a709b731cbfa8f8465e838dfb8c1a35debff074fa78cbc67f07aff#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498873&idx=3&sn=2d123409c63da7ad7d5544a590267395&chksm=fbe00debcc9784fdeba3d1e8626b254d3fcca25a1c6fc6f5a3f09c71cbe14a155c4d29639264#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498864&idx=3&sn=a0a9c42342136c7a306b0e888278a146&chksm=fbe00de2cc9784f40870fce7aa1871804b5a4c56754c9ea1567e334c3c082d4f4ded323023f3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498846&idx=4&sn=d13ead6f4b20da24766fc1fb4dd7bd31&chksm=fbe00dcccc9784da51726738dd4a30cc81f5da9833aabcca947a0db9e2bdfba59bbd67058df1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498740&idx=4&sn=78417fd489ae46f2445f130058d35036&chksm=fbe00a66cc9783701f6e90d329f28304ade0891517c5756f6a57c207e356458bd505308ef839#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498564&idx=2&sn=45d10d290bc3db28c2b66bd17cc0a819&chksm=fbe00ad6cc9783c0e51f6fbff4caa590153c95f2ff54c0a1c5d6bc488572036c785a76c5c51d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498519&idx=3&sn=aec581f95ef730a9a6613e58132d871b&chksm=fbe00a85cc9783930351f3aa93348ef1217b2933db33112c95b2806af3448c67ae60393c28d0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498383&idx=2&sn=4af6bc90244eaba1f4463a8a55fcef5c&chksm=fbe00b1dcc97820b716f89b741445bc322ef1a03dd05257ca9ac4eee9ade484e875e46a8b138#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498330&idx=3&sn=a9be83058ac092fc970b94c36a4eda62&chksm=fbe00bc8cc9782deddcdfa6f8526cd7da02ddde3612a21811290d522d164bb7c32f2922e8890#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498321&idx=3&sn=47749689831caceaba77955bef91587b&chksm=fbe00bc3cc9782d5e2106b9871458e5d5b1889a44114e76328be36585d824f21de3f1abc131b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498307&idx=3&sn=f1492570095f2a35feeac6581ff01fab&chksm=fbe00bd1cc9782c7419f83e93cf7f3e006e1a7237d60c3a91acd3ba8a3dd743bdfc3c3078c28#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498246&idx=2&sn=c89e8ba4a47bf3cb7b29d0183e17b3a6&chksm=fbe00b94cc97828299243132a20996184e165b35864644eb554e19f814fb721eeb2d47bf41b3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498154&idx=3&sn=2ba1eb67d85aa24738f93e67d8d6b8bc&chksm=fbe00838cc97812e27eaaa3d54a075157b4f0d130897181b667468164bdb49d2f92b84cdfefd#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498127&idx=3&sn=6647d10d141ec470aef94003d22be12b&chksm=fbe0081dcc97810b833569dcb30324c2ca0a1f2548ede1c017ab6e43b67fbc5fe1086044966a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498091&idx=2&sn=f89e740aad1be6dc88a805c05f7878e0&chksm=fbe008f9cc9781efdfeb3846a424eb31c16ff32c04f5d34a01f8ef8b9a138c54dd2c0dc7086e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498078&idx=2&sn=565baebc1c9aaa9e0239eb62c172c9e2&chksm=fbe008cccc9781da61af3a1ceed14e2e240902b6405a8486ee9a7721f2c6714016fa92d67e89#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247498028&idx=3&sn=d9086df561b0e9c0dea5fc739e6abbcd&chksm=fbe008becc9781a8a70c08487ff06b944eb191918923b39ce142a65eceb423f8ae97460cfb4a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497989&idx=3&sn=c1fe38545777cce1780e4ef39243c469&chksm=fbe00897cc97818102db39329dff1bd4f165647e4fadf5cb3924500bec7adeb9b526bbc3a44e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497942&idx=3&sn=c93dd21d400d6c2608ac383c1f088868&chksm=fbe00944cc9780520b3d86180b83ac3ebda7ff00e365359b8f4203a6d440085a03d7efb0b2e6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497925&idx=3&sn=b51606a665a0acb7c3b1a8fb993db0d7&chksm=fbe00957cc9780416626f97b766e368782b8ce887d3f687d9be912f7d6c854ab1965e3e3244a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497906&idx=3&sn=eb57eb1addb9e0e54afa2263806085d0&chksm=fbe00920cc9780366a01327646d222826d6be753ce32e94b268ca0bac95980486186da0799ab#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497835&idx=2&sn=c1c4e63a8daaeb6713bceaae9d8f2096&chksm=fbe009f9cc9780ef3878be0399c4c951d1b6d1b6ea9033612fd35e15af33375be3598274eb15#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497826&idx=1&sn=256e5b5ea76c4d24b808195690867af3&chksm=fbe009f0cc9780e6e79e560d291fb75dc8dabf60e5a5e6cdcaf8e1d1cbe82694635501bf3cfa#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497817&idx=3&sn=4b11bfd38dcb787450de5b59249f6d0c&chksm=fbe009cbcc9780ddc61073883b28206072f207d6a122521759ada239923889d55c254532cca9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497803&idx=2&sn=632eea8002ed386392b6daafc5e43a5b&chksm=fbe009d9cc9780cf693d5b829f66aa48ed09f72327f4b4b853e32e1e345c82dc5dcc5cd6991a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497790&idx=4&sn=c1b2175595dc6d8f91bf225c9c748ca6&chksm=fbe009accc9780bac302ce3dc94d850187943269d2639eb411e4953967b547b9dd8a397d29b7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497780&idx=3&sn=091b172290707d4f57ed42c38450975c&chksm=fbe009a6cc9780b042f801751c87ffdb5de5ba06933c05fd71346ffc3c1d71d4dce11ed3427c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497680&idx=2&sn=4922069b533bbd2a8b276340a54c56b4&chksm=fbe00642cc978f54c26a0ad70a8dd06a67e149f771d668fb159a6c04f593a0df755540b3f244#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497656&idx=2&sn=6335c60c9fa8c43401beda36980740a8&chksm=fbe0062acc978f3cb9ab0bf2a23a208f48528e724c672749792d8cd032d9ad523558274ae950#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497645&idx=2&sn=792aaf85b7c64e1305c22e68fe8b8647&chksm=fbe0063fcc978f294ef3acfd2ec8f5c10fd8ded8eb79d0c396a9a9ee2fde0a516e0335b47cea#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497632&idx=3&sn=c837bdd4967772311915b264762f8a1c&chksm=fbe00632cc978f2474a32eadb0d23a3708c185c8855e6e99591b39ab4541bd65ba832a70818e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497618&idx=3&sn=1fddafd747412064d82a8af5fccc1181&chksm=fbe00600cc978f163130b3a74bb22e8d29ccea9316fa3e79192d3d5fcb9dd524b93efe24a6c8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497595&idx=2&sn=d31f64c295ce99591573f43a1606900e&chksm=fbe006e9cc978fff5e7a53a4e864aed3428c8f7614d7e6f48d1ef5275669f2b401aac7184fa0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497585&idx=3&sn=56264292af08825c331eb39f7335ff06&chksm=fbe006e3cc978ff58d38961d83fa2d380425bee0693de33dbc61acff247d5e15cf28641b996c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497571&idx=3&sn=65d2138d2301dcc9d5cd34aadc06a030&chksm=fbe006f1cc978fe71a0b1db42690e58d45b561d915b63ca8dc2558d414964ed771e1d773eb37#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497556&idx=3&sn=7d5306572e64f81d02824b2aaf9a0425&chksm=fbe006c6cc978fd0566860bf4d3eb86493ec3a596dc2eaf2b047dbfd827792cde2c76fc599e3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497543&idx=3&sn=b512056adf65e7ad7800c6749c839d05&chksm=fbe006d5cc978fc3dce0d7450a9e7f7ade7ce18580546285687f5d5c5ae189324ee8efcd6102#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497493&idx=3&sn=7aaa878e28dd92d6ca1675b1f4eef3a1&chksm=fbe00687cc978f91c33b4af0a745ed6e3a98efeab4bd7582d1a5e59864253ceedd1e4f167918#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497464&idx=2&sn=e81625ca34fe036f51728df81799c20e&chksm=fbe0076acc978e7c1d35882a3830bf119e74c50bb766e436c3a3b1e41ecf623fccd1a30bf489#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497441&idx=2&sn=8e11852d132220adf52fcb8d3a90ce80&chksm=fbe00773cc978e654432fe53f0432bb1486766c24d7301b293b301e78bd8cccb9033940df2df#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497431&idx=2&sn=ccde0e659af3d87af587fa52c2f09d71&chksm=fbe00745cc978e531135471239ccc0c51341fef66d72f1eb70166e4717ddf25504d4064b7176#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497421&idx=2&sn=4cf2ca4b888c900b159556cc38a9322a&chksm=fbe0075fcc978e49862c9b46fad30c7ffb68901d9adc2d614fcfc2bb276f501d9de48011c406#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497373&idx=3&sn=7304bc34c6e753298e78f88ff4e74fd8&chksm=fbe0070fcc978e19f394dcfa19229975e36223d34f93f6387f707c42d04f0ecfc45bcb235b18#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497355&idx=3&sn=a0f02a9ba2f1a954414f43a18bcf8f6d&chksm=fbe00719cc978e0f2a07ca5af0d8221fae0dbad7e1be504f1d86294df810cb285d21a9ef5d24#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497334&idx=3&sn=2cf69babf43e2651614336904428be80&chksm=fbe007e4cc978ef24459a3d6d28c30e4f2815f9acf6f4befddc6ff166874868a0c3b6590401b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497259&idx=3&sn=c93d5a8de4436ba28e9ccf0ca3701055&chksm=fbe007b9cc978eaf200a46e6ebeaf6db967549caba3d99ff53996450a4d44b13dbab43377f34#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497239&idx=2&sn=710098a4e323cc4b3ccc8c2f307d5092&chksm=fbe00785cc978e93f000d6f0354b99389b2e150a37487a46f7227e2fcb570ac18935cd16ac16#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497177&idx=2&sn=8ae2e0d9754f4944c762e40564dded2c&chksm=fbe0044bcc978d5db3c7342985e4723ca27a1c396f2d988e3c51221c085dfd2a40acf0574b3c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497167&idx=2&sn=39c67056aeaab05fe661c0d2d604704f&chksm=fbe0045dcc978d4b8938c7299d5cc17d93393fda4032828fc20d4f3a8400c45ab8977d85e881#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497157&idx=2&sn=11ddde7d4af6485be2ce4387c3b06784&chksm=fbe00457cc978d41582c08858718f48e21d0ae0a328e37c2613b7520481b0a1551553ae49881#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497146&idx=2&sn=2d7123cc04549fafb5b1e1f7eaa60c13&chksm=fbe00428cc978d3ea92fb2a6bdbd5c5da84adf45f3a13875e6fccd39b7d3c0517693a652f29a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497133&idx=2&sn=e90a12f7d31e604a760c8e95d658fac3&chksm=fbe0043fcc978d29ac827d9c9dfd21128c66fc3dd42ffbc3a4df7298e0acaf7bbbb53148869e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497087&idx=2&sn=df190b5538039ce5492485a51f0a7a17&chksm=fbe004edcc978dfb39d92e29f0e7c09779c993879dbe21cd11fc83d08fa1ef51eb7c2f112a69#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497073&idx=3&sn=eb809ec359585160c26572360754bb87&chksm=fbe004e3cc978df519fa460f27c72990f9363e2899c25ac4c2776969e6f52dd6a635d6121c22#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497061&idx=3&sn=c3eecb1ffdeed8f33def3e8f7f986487&chksm=fbe004f7cc978de1220b76d66208161864735008fbf68610b01aac8b847784748a00dcaef972#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497051&idx=3&sn=1b76f2756c0d990b4876bbf3baa8d51d&chksm=fbe004c9cc978ddf2bdebab19240e1d6bc797c28c64af28cdf9b663be5267dccf056ebbca4ea#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247497041&idx=3&sn=2057bb1b65994b7c308162de570d95ac&chksm=fbe004c3cc978dd5822be37e845440d7efa871bf619dbd68740a37050c4d6f77c779edae2054#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496995&idx=3&sn=8c8e7254ceb4dd7090e9ea5b9b89363f&chksm=fbe004b1cc978da718f7e3e0bb90f6bf6be822548e1cb5823a302289c60e7ed7ca5b7044e563#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496977&idx=3&sn=32514b4d6eea786b970e6561542a5dd6&chksm=fbe00483cc978d9591772c8840c2433e767669d9246d90b369d09970ef986346afef2d1d7520#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496968&idx=4&sn=65e41cb66dc6420e1265c8c47c7eeab8&chksm=fbe0049acc978d8c7418540c5f056fc741b5eb12dd20983b4886232df58ec762f5e2e238aea7#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496937&idx=3&sn=21a18690f85c4e97cd4e3d102be43450&chksm=fbe0057bcc978c6d02d9bd23ac844da0dc53b103fb1a9c87d8cbfaa2386eeb23a6cdd75c56b1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496924&idx=2&sn=93ec02e30c4b6496eb2a0fc23c569df0&chksm=fbe0054ecc978c587bc446ca15a8cdb75cd0be5aebb77096817f7aaa0926e6349472b3f64fe6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496915&idx=3&sn=aec92743cdd55674981a13087373a1ca&chksm=fbe00541cc978c572f996b58423138022c81d3fbc6a07eb1328745b949133681bec84fa6e798#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496906&idx=1&sn=120b263056ddf35b321bc45f0b959a89&chksm=fbe00558cc978c4ec16673d3ba90266128ce5755b49897db5a1307bd403df85f2feee087e61d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496891&idx=3&sn=dec49241528e836c34476467c102eb17&chksm=fbe00529cc978c3f3391c29d772124a55f25393cbf7aefae127010f527814fd4b515d33d7237#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496880&idx=2&sn=6284da187ba096ddaa1bac6a0652eb45&chksm=fbe00522cc978c3468673b0eb4880438e08d1a4c5ba8b438a31936b5227aacbee7db72a96661#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496865&idx=3&sn=ac14fdadf3c1069e67161d59c4dc160c&chksm=fbe00533cc978c257f7dd343210e0c30df0c364ce72cd3edd9ae75f94579e7b0c65fc7bb446a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496823&idx=2&sn=da28ba4f59ef0fa19aee2460b242a852&chksm=fbe005e5cc978cf322bc313db53db53e554c4702c954059395abc27e788bc28495a73a47cf19#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496585&idx=3&sn=bf83be980f88894a8a6ea2cd5ca14ca1&chksm=fbe0021bcc978b0d2337a0713d3fe376e061e4f3088aa26a696680e3ef22e88d34523feb1b23#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496571&idx=2&sn=d7c4d72c4961db4ac9009780af6d2958&chksm=fbe002e9cc978bff7f475e8ce935c665cb90b1d9093317bda7dc1adee69cda4083650084d4f9#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496556&idx=3&sn=76a25e2bef87bb4aeb7ab23967883cf7&chksm=fbe002fecc978be882b66529400869f52977df14759996fab316dcb041356c9a971986ce03e8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496528&idx=4&sn=6e8c59b48d68322a032b316514faf653&chksm=fbe002c2cc978bd42169bfba08daab65cd39d31a045421d8afb73526ed1224cb6564bb7c3dbf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496510&idx=2&sn=8ffccd98c376623bfd86aab9f615a343&chksm=fbe002accc978bba62840636422268f6884b0eb75864b1d36848e66de729d3be8e85c797038d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496480&idx=2&sn=a9e25da9a54e340b6bc08eb48df7eaa3&chksm=fbe002b2cc978ba499467e28ddb89263b5329151b7baaf33e71e612952777b07a39d8a41ccb2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496467&idx=2&sn=74e06eb515554ae38f02fb8a27836bc0&chksm=fbe00281cc978b970fc63150440d8db1051b44dcf1eeb5800eb738a11d8f4d703ce63b1f0e89#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496442&idx=3&sn=8d9b155870c2d9bfb6f85b1089b11670&chksm=fbe00368cc978a7e7e6a2e7f37d9b2bd1e5469462c8c586f05ec3b8e79d3928350ce6e4a6887#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496410&idx=2&sn=f6885e59db338e71287cf7db9f1a5ef5&chksm=fbe00348cc978a5e5efea9e2d43f9c234c6197f2ae4ee2e92067d1c6ffa23556cfbad406e259#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496390&idx=2&sn=ef20df8dc8aef35502c0d7d3ea9c6878&chksm=fbe00354cc978a423484362e74ee13334e42c95daef6f108ba63b4d98a1ec76dec63a5f4349d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496375&idx=2&sn=ffcd162282e890574e1b06bfdefc19ec&chksm=fbe00325cc978a33d0a68ed4f90c76dbab30053a47a638617fe273b83bd470117a3e693b3537#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496211&idx=1&sn=0da1d372c6b8f6a9c951c2492b706448&chksm=fbe00381cc978a97a36447432971aba599b02940b2eb4cba04068c330879d47d9098ea7852eb#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247496142&idx=2&sn=7a54335f582b1f963ec5e1c3a1ce7b34&chksm=fbe0005ccc97894a7a8e52e098dcaaa6b1692830a15180709f0c27918498efb81fc659762cc3#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495965&idx=2&sn=8fd7146a96d8c0f9912693c5eff4a20f&chksm=fbe0008fcc978999075181388e66814ae1bdae3f060f686295b1559805ea95b6b14cce27d645#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495954&idx=3&sn=f5466e28add3bb97d7b3c41fb4202757&chksm=fbe00080cc9789968859641972d4f252ae0018b0f79bf14e72256d36e9548cfdb6521eb7da6a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495904&idx=2&sn=131e6009d54e4a64338416ad3c7bcb6c&chksm=fbe00172cc978864147c8c43a8fc63e75f0835140341600c9725b9f5b9a9a267b5e5db857f2d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495893&idx=3&sn=4f0d4f1daf104b2e33d2ef8d8584f46e&chksm=fbe00147cc9788512460e9c0a06e4f3731d6125c6ed3d7a2cede081333d520857475a771e609#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495880&idx=3&sn=d0d902bb15ab7b3f62f5d2457a00d380&chksm=fbe0015acc97884c958f8b2a22efa460460e5130cc14b92ed3fadbfeea841a06ba639f9e2388#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495862&idx=2&sn=3aa60a88da0aad39572cf9cf1b508809&chksm=fbe00124cc97883295e2e2ed9cefa4c8bdaf59f5c2acbb27c3e6a12ff9f0a6c1f79c7fefe9b2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495848&idx=3&sn=4cc32beda50c1936d3c3b3d3d8d6b851&chksm=fbe0013acc97882c3cf6713e199a9286a396d9b7057f6ccc8853aa7feba6173c04f6e853bdc0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495817&idx=3&sn=e1c86d1a1324d7158dba76410748355a&chksm=fbe0011bcc97880db05aba7ad5893042a70100f9cd118faff96146d54213dac66a712cde94ba#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495706&idx=3&sn=d1839deefabb14d9068c1b0c05de72d4&chksm=fbe00188cc97889efa271044f4b5185b31e455b3067b941ed0f6c152e845560549f56b973900#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495599&idx=2&sn=2686dc47537f359c7db02494a813a1c5&chksm=fbe01e3dcc97972b8290ab7891ac5010bb1c37e6a1a9a0bd8b85f8bd4f3449438cb1bb93d066#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495474&idx=2&sn=b3279fc4e21406dc8eeb1f7658fac70f&chksm=fbe01ea0cc9797b654f5ac9580898b6d826e5c16e3b285f29d0b641b575f2c174ec3a431388a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495453&idx=3&sn=b576da4909cbfee5a33dbd479ac4bfab&chksm=fbe01e8fcc979799ee9d14edff7757770895dd8bcb38655e2cc86368081905f6aafa4c6a51c0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495387&idx=2&sn=fa97ddebccefcf492780a553c949f046&chksm=fbe01f49cc97965fb23df281030e0904ecfd83c1a98cd020782130d244030adb009a8a8998b8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495322&idx=3&sn=7a5ecb67d538d56020bcd9267fe0442d&chksm=fbe01f08cc97961ee06ff078e5de509d8cfa1753fc356bb1a289f60e1b233aa04ca649fa32c2#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495189&idx=4&sn=cd29460bbd2261f1c95ceb29d9ddeac4&chksm=fbe01f87cc979691f027e8df56aa043388f80f6aa2d50035e2d6fbe486445b6939da003cd92e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495260&idx=2&sn=2d50ac7108d19f77f3ab1e5ad8eb55d5&chksm=fbe01fcecc9796d8e6f854ff2f4e72d5803ff6b2767afe3ee56802b96eaa382481218331dafd#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495118&idx=2&sn=8e292560706bc6824000b12702a497e0&chksm=fbe01c5ccc97954a8677902ef4ed833bb35552f838157d168730748d010ecfebca2863d5e965#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495045&idx=2&sn=8f2f5dd3e641e48ed00a52ed93a83353&chksm=fbe01c17cc9795013ea00eb8d215f223734619f203660bcc879eec24fa89bb0b0345adc32e52#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247495031&idx=2&sn=b40458406a554be0d0811f6ae1ca4d45&chksm=fbe01ce5cc9795f3182cb87111239dab91d7701f477241981393a005b122604288a9d7aa8af0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494927&idx=2&sn=fa29aa7c7c325de5a7d82b20b6074393&chksm=fbe01c9dcc97958b3ee0f78c9a0e0eec1e014edd96cd756c6f45d494ef1a9ae5eb001eee43a4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494912&idx=2&sn=b072c388e72e391a2b6cf4a207f0df2e&chksm=fbe01c92cc9795846338146ab1698c0e269056596d19d1e38bad94711fe821f1c48ece509b6f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494874&idx=1&sn=a095d3230fd0dffdd0715ec1f4e63947&chksm=fbe01d48cc97945e34885486b8563ba535bb6e8c00632a3ca727e3103668ed0d415d45579ef6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494868&idx=4&sn=1200c9858a8b741ab5c67b6d67d143ac&chksm=fbe01d46cc979450578990e61e6951e2cfba5b828307740a20bf61763b1817d0a74fb0d77e82#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494836&idx=3&sn=ffc8fa04fb757bcb24056c03f1122568&chksm=fbe01d26cc9794301e6d3e3e6a972a9fbb752c22e247dee1dcf6994f96883a25abcde61dab8e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494818&idx=2&sn=c8d3ea96e216503d05c9fa133ef67c8f&chksm=fbe01d30cc979426bce65dd0eec7bf08ad86540a0cc8a3c63c6a0d230b91f7734ffbb5e0b70f#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494764&idx=2&sn=29abdd01c774a3682ee804b031689b60&chksm=fbe01dfecc9794e87e133fb460259f7b63b407f0f3ada9264f8f241eed8ed68a381a06000eda#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494750&idx=2&sn=62934756809cbcc43941478fecc48fff&chksm=fbe01dcccc9794dae793643bda3aecfa81efa5e445af5739ec9368f674566f80a43aebd19546#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494741&idx=3&sn=b00306ed1118a106941a323e02c5ee8d&chksm=fbe01dc7cc9794d1683d8221556d523185a35c2be5ece5ca4c6157aedf79ac83c00187da0c39#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494732&idx=2&sn=6bb2d4b20792e13446380637dacee922&chksm=fbe01ddecc9794c8bbbd48304efa17f37f777a1148239d7806c84c56cee731d5eb9073908f00#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494723&idx=2&sn=457a099eee9699263ab4a8c38cac4b05&chksm=fbe01dd1cc9794c78ca551074d944464ef0771cf5de888cb5e22b874adec79ed51ac7d658121#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494692&idx=4&sn=1b82b194315aa3763c0492a596639831&chksm=fbe01db6cc9794a03dfbd485486b578c84acb5774f8ab774ffb6d6820b3d34cae05212239666#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494680&idx=1&sn=3e0188900cc60fbebd2216f22f42971d&chksm=fbe01d8acc97949cb0567995de8a70a78860c53734a7c1c1823766b9b7988d496a1e1f892ca6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494680&idx=2&sn=873661f69574d4fc0574ddb88aa049cf&chksm=fbe01d8acc97949c984b7d4bb1eed988ef68adf88aacad2a9881d388b0db5d8b877df8e6ea1b#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494644&idx=3&sn=d2e91e822b0102adac1f8e13436b3de0&chksm=fbe01a66cc979370e3d3fd2ad0db8b48e235244c92ddec58d86ee61e1232d2bf913870abd402#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494630&idx=5&sn=f22accbcd341028943044123917edf08&chksm=fbe01a74cc9793626e46704cba9590cb5777e6fa3ebbd45cae229f99036dcdbd7ce75ecd7bd0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494532&idx=4&sn=21b89ce17104518728aca3d173b76a75&chksm=fbe01a16cc979300e7f88348abe1bc9cc9593db4f6a3fc704ef4de19df8db9d884c67db49af1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494489&idx=2&sn=f2a1183c776c65e25be1b6e70179d544&chksm=fbe01acbcc9793dd133877c52602f9e3278f848025f51dab5ace83422ae53a86077c5cb338d6#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494455&idx=3&sn=e9233f91a56622aceb99e1e8f07a37fd&chksm=fbe01aa5cc9793b3199cc74cec9dab1aa34ba4b4b29b4c799c0d151899bbffe407243a8ff980#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494369&idx=2&sn=0a03f504e637b73363ef3077ca61cc8f&chksm=fbe01b73cc979265ffcce2f66e79e9df3af6c026e4036d93990bc9be2571dd1fd9064da659ac#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494359&idx=2&sn=9f9baf785f923719d765bf35c35cf6a7&chksm=fbe01b45cc97925363e8e33a5e63445c951da288d29fcc641426d6231c53bc78d05fb30e07c0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494348&idx=2&sn=de9d9221a2d606ccf8061f7fe5bf7c7a&chksm=fbe01b5ecc979248f2e4b2a645a860555e41ecceeba2964a99a72e2ad8c10a0f6d05f4b31aa1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494323&idx=3&sn=1eb6b4bc5a2b6915ed29e8c4b547c482&chksm=fbe01b21cc97923730c4377d947bb1a74534014bbe5a9a89cb6d14411eadedefca362c16d078#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494274&idx=2&sn=b3674b35d5fc5be23a4b6434e7da3cb6&chksm=fbe01b10cc9792063463d63566e660f79a04a8e88d700b20edbba28c02fd7a3f7d833abd55f4#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494204&idx=4&sn=17f27c71f85d592c5ea3286b6cac7c8d&chksm=fbe01baecc9792b8ea3e03d7bbbbfe63c363d14317e37fa05b9a816b3971c9ec0c26cd3b769a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494094&idx=2&sn=fdc19e6de85711971422dff0ac5c35de&chksm=fbe0185ccc97914a1dcd4f801707bc1be4520410c06814379fc3e29361926ccad828f568bc17#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494074&idx=3&sn=8d62f0c7ae697edf7a7a680ee6ed52ec&chksm=fbe01828cc97913e996715f128899a83b8c96ebf2ff2adde710db13d3bba8bfed9e3c25677e8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494046&idx=2&sn=35a743ce050aacd6130f69a97b029f42&chksm=fbe0180ccc97911a1041b3a7d61740b6610f0e4a1d9a907bb5bc9c6a5034f0103b3a0bb9a115#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494032&idx=2&sn=814de5137d61466977ccee57dfb30777&chksm=fbe01802cc979114f72e32cc0146d6f7ec61fa5cc6bf9b568437a4ac34738e6036c5e3ce9209#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494022&idx=2&sn=2a6d7ad3fc7e820883e4ca6c18342515&chksm=fbe01814cc979102c761b1f35d3c2776e52a3b1ff9ea036b9400669bc7fbe2b98f8732135289#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247494005&idx=1&sn=a9aa159122aefdddcb53db1b2dff68f8&chksm=fbe018e7cc9791f19bc07d3e1e4dc760943e6769fda756087dca38ac871f942c5779ef801593#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493991&idx=3&sn=55d669d241146b49615017eb10b986da&chksm=fbe018f5cc9791e3ecebe764a6ea2631e89140e1c7aeef66e9bf4718770e90a1599559a37587#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493907&idx=2&sn=f08bfeda925f7e11d8a883b666fd6e53&chksm=fbe01881cc9791978ce8e0c27cb60af53e0a108a7a3016f4720275abb65e856a5c7ca655f3e0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493888&idx=2&sn=43fc7c3b27dc4f8cafa6416cb5fa0fff&chksm=fbe01892cc97918410c71da25b61552057470eb130c0ed6c4cdf7a54b05e4dc58fb061c9894e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493870&idx=2&sn=e5ca319f2dc30e4d136800ab7788fe69&chksm=fbe0197ccc97906afaf7fc14f925009e1e3d97a4835f236f48550bdcd9177c0550ed77f229ca#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493836&idx=2&sn=af6a6d7b5f99f9e60747e7b807a673a4&chksm=fbe0195ecc979048594ae303f4f238e82027c1e7b6778a098635da3b9fa9a7a82439701bca91#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493826&idx=2&sn=d57b9d5be810eca76d35b02c072969b3&chksm=fbe01950cc97904689d366ccb0edf373f406de7bf7cc0e976cf3bbfc3832ea4e93ed110a7b8c#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493814&idx=2&sn=db95e297f649343e4a901992eedc0fc6&chksm=fbe01924cc9790326bbe3cc42377c22413cffd41fb4edd1da681ff0544b0b3b2dc017cd48bee#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493797&idx=2&sn=85115d1e51dc6083fa4a9fc1decfe03f&chksm=fbe01937cc979021c831cd879553e4d22ff6437bbe268dbb25256cd6c4a361a076dfb796fac8#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493779&idx=2&sn=820edbce93cc421008acb9c9e16bb2c5&chksm=fbe01901cc9790179b29f159e7a90efef34b275518b9f6cd051293acd2776ee322c04de15ca0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493749&idx=2&sn=25df65f4adc9fb02d458145e8ecbe023&chksm=fbe019e7cc9790f1c3b8fda8c30dadac0fb1286e877ab5fe0a312a24352dd7c0d18ec626c0a1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493678&idx=2&sn=2b801ac81b6a023ab52c7284ae9193ae&chksm=fbe019bccc9790aa4f346f5fb45387f0bc83584293d33710b95c5e262b4e9978523bfeb9ef60#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493667&idx=2&sn=4e85f7e87088e4bcd4f16a694a8c54cc&chksm=fbe019b1cc9790a769f0a7db01d4ba573a9660d709d55842012d59a5ea4e1bbdc0f31d35c230#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493653&idx=4&sn=c090a28d5805657c282f63bcc293a5a0&chksm=fbe01987cc979091e4a514caabc8ce63b07a25fe0579caaad2ebe6cdc69ac400da4d85159e62#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493627&idx=2&sn=295447207b259cbc9178eab2884971ef&chksm=fbe01669cc979f7f73d2f8ec627685ad2985468c598e6f3b26e82278eec67601c3e041c25b8d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493593&idx=2&sn=1ff239d2185abe6663577370d2ccbb0d&chksm=fbe0164bcc979f5d8c567336211edc42967176df554bce31102c308eaa7eb360e8fef02a2b88#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493573&idx=2&sn=b7e09cd4a4ac4b589cc1351c54102719&chksm=fbe01657cc979f41ceda1388a867e41b808037a598a0dc97466d168563fc8d56f4e478d12108#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493536&idx=1&sn=f76d663162376d01f45735d7db7f8b51&chksm=fbe01632cc979f24330624a7f092e5251d9f1ace1b786bfa05f0cebf796073c652457f41d585#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493441&idx=3&sn=ba722e174c4bbddc92541b232a6c1422&chksm=fbe016d3cc979fc5412ed5613bcced9cc338c98e0e93ec9e76bb3ad25d482478b59def5238e0#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247493408&idx=2&sn=1bff12a03295c11ff1d54c0f04a22786&chksm=fbe016b2cc979fa4f54cef5432c415161b1f93362790b05d13f4d482edf29e95c22080f83f21#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247507273&idx=3&sn=6dbb2b575ac2eef0db3568c4c9772557&chksm=fbe02cdbcc97a5cd4916758e99b2d708aea2df72288a8699bb5ad3685735c0f10949679e0793#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504695&idx=2&sn=138c8eeead7adad72eba9873b9c408d0&chksm=fbe022a5cc97abb3cc83754e29f3087c3a725d158b63db9da92afc54615e43b8ac5fde3e62bf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504686&idx=2&sn=3de5f1d5798569714cc2478fbc954253&chksm=fbe022bccc97abaaf304d4e75549d4833e939d9aeb7e9c2e115fb5f79edb84fccaa928c3b8d1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247504675&idx=2&sn=37a2092ef4446b4bc5b13cf63afb0d93&chksm=fbe022b1cc97aba70a4e1dc9795e8d0756b44a40f31949e36c02e34bc891eec537f3ccc6c197#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503573&idx=3&sn=03cb5a0f3b6a31dcce73e70bb03f4842&chksm=fbe03f47cc97b6516276e0de65c4c067d6837e2acb5f9245687f92a63c6290b5a4d3f6b808be#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503526&idx=3&sn=c192fd9184e8da88d9835c508f02df5d&chksm=fbe03f34cc97b622b542c680610b37280e71520d8d9088eafc37151d3ed3a5944b07dfadbcdf#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503514&idx=3&sn=5b2a8f144576c9299ebc933c46cc6249&chksm=fbe03f08cc97b61e4ea28bbe615685778eb0199f05f6abd1d6bd5d6c00649b14e92911da0a27#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503507&idx=3&sn=fbf1b6a4f9df980af8f2259ecdda6970&chksm=fbe03f01cc97b617671205014c64ecb0edd636b8be7f14f2e9492d9491cce11602294ac8ab0e#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503501&idx=3&sn=855626a31155c1c847b245d1709a3b0c&chksm=fbe03f1fcc97b609dc1e8887e882df9b4ed23c3ad754715e83e122f7b2d021b2786aee6af584#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503483&idx=3&sn=94f1e9f942b794cb72658cdb5aab7810&chksm=fbe03fe9cc97b6ffea9ea51d6fe8f741bb91a765a6a8f4008384d5f072b3c531f7fc0989b8a5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503474&idx=3&sn=cfbf49d08ea4ae4844f40dc8276ed98e&chksm=fbe03fe0cc97b6f6471ccbdc20cd162710835a03fcbf67c069cccbd4995ef92869913dc3c5f5#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503429&idx=3&sn=efa26c980fba081b04ebfd8eaa9ad268&chksm=fbe03fd7cc97b6c19a9d80bdb04183dc99192d8e5d377bae777489b14558c55100c7404aa2c1#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503424&idx=2&sn=6c43d4a63345dac69dbf253eaf7ef87b&chksm=fbe03fd2cc97b6c4a9a87efacefa568834015cec6080888deb75af58cb0aa4d8e153791b1eae#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503406&idx=2&sn=be06ffe4db1ee42057b35e908e7e0f5d&chksm=fbe03fbccc97b6aac968d3ec8901d6ca3050983767a796a6a39aabebba8302cffef1fcba1e0d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503348&idx=3&sn=b6023a9d44c94797dd4631693ae939ae&chksm=fbe03c66cc97b570303c0d88cbf21a957b5f549885d2ac9d130f8d043e0638e9ea2676494f20#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503337&idx=3&sn=05ab9a30022e6e91942576deb3f09dae&chksm=fbe03c7bcc97b56d66466b5c81f44a8dd2ae21abff8a73a8d70a1de29c798c4dd0418dca176a#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503333&idx=3&sn=0230e0c28a6ea42483c3f7eb82ccdab2&chksm=fbe03c77cc97b5614aa676c946347f026455009c0f734ec02eac87ab84c2d4efcc764f4b3d11#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503326&idx=2&sn=afaf28f8c4ad3284c95b5fadc24d5e1c&chksm=fbe03c4ccc97b55afeafb3664ba9c68f392096f4ffeb0fcce5f97775b29939338dd47fc8673d#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503322&idx=3&sn=7dbe5615be7f73c9c9b2561282c2593e&chksm=fbe03c48cc97b55eea71f0decb8a189517e79cea8a498d4ecf0202678d395d7dc7745f606797#rd',
-    'http://mp.weixin.qq.com/s?__biz=MzU1NDQ5NDIwNQ==&mid=2247503318&idx=3&sn=36de8a856c1cdecda4e373b4b10bdbaf&chksm=fbe03c44cc97b552730e97cca9076750534d78c9d3aa8f79e7e47403a44a579d0f0af921a03d#rd']
@@ -1,116 +1,216 @@
+import asyncio
 import concurrent.futures
+import datetime
+from html import escape
 import os
-import random
-import re
-from uuid import uuid4
+import threading
 
-import requests
-from PyQt6.QtCore import QObject, pyqtSignal, QThreadPool, QThread, QRunnable
-from bs4 import BeautifulSoup
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, QThread, QRunnable
 
+from . import aionet, media, net, parsers, textutils
 from .db import Database
-from .urls import urls_before_20220605
+from .extract import extract_article
+from .pipeline import AsyncStage, Pipeline, Stage
+from .recorder import NoteRecorder
+from .registry import UrlRegistry
+from .urlkeys import article_id, lookup_page_ids, record_urls, url_key
 from aqt import mw
 
 
 class UrlWorker(QObject):
     message_signal = pyqtSignal(str)
     complete_signal = pyqtSignal(list)
+    KNOWN_URLS_TO_STOP = 10
 
     def __init__(self):
         super().__init__()
         self.urls_to_handle = None
         self.mw = mw
         self.all_urls = None
+        self.collection_notes = {}
         self.db_path = os.path.join(os.path.dirname(__file__), 'user_files', 'data.db')
-        self.db = Database(self.db_path)
+        self.db = Database.shared(self.db_path)
         self.urls_to_handle = None
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/101.0.4951.64 Safari/537.36'}
 
     def get_page_urls_in_database(self):
         # prepare news page urls, if first run (nothing in database) , set it to pre-prepared urls otherwise read
         # from database
-        if not (urls_in_db := self.db.table('urls').get('url')):
-            self.all_urls = urls_before_20220605
-            self.db.table('urls').insertmany('url', self.all_urls)
+        if not (urls_in_db := self.db.table('urls').get('url', order_by='id')):
+            # the seed list is only needed on first run, so it is read here rather than at add-on load
+            from .seed import load_seed_urls
+            self.all_urls = UrlRegistry(load_seed_urls(), key=url_key)
+            record_urls(self.db, self.all_urls)
         else:
-            self.all_urls = urls_in_db
+            self.all_urls = UrlRegistry(urls_in_db, key=url_key)
 
-    def get_new_urls(self):
+    def get_new_urls(self, more=False):
+        """
+        walk article pages from the album heads to find new urls,
+        the walk is skipped when no album has a newer article than the last crawl,
+        with more=True it resumes from the pages the last crawl left unvisited
+        """
         # firstly get starting urls from albums
         self.message_signal.emit('Getting starting links from album...')
-        starting_urls_in_album = []
+        starting_urls_in_album = UrlRegistry(key=url_key)
+        album_heads = {}
         album_ids = ['1951342454759030784', '1517700086812704771']
-        for mid in album_ids:
-            album_link = f'https://mp.weixin.qq.com/mp/appmsgalbum?__biz=MzU1NDQ5NDIwNQ==&action=getalbum&album_id={mid}'
-            res = requests.get(album_link, headers=self.headers)
-            if res.status_code == 200:
-                html = res.text
-                soup = BeautifulSoup(html, 'html.parser')
-                for tag in soup.find_all('li', {'data-title': re.compile('【NHK新闻听译】')}):
-                    if '收藏版' not in tag['data-title']:
-                        url = tag['data-link']
-                        if url not in starting_urls_in_album:
-                            starting_urls_in_album.append(url)
-        self.message_signal.emit('Getting latest new news urls from starting urls...')
-        self.get_urls_from_starting_url(starting_urls_in_album)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(album_ids), thread_name_prefix='album') as e:
+            for album_id, links in zip(album_ids, e.map(self.get_album_links, album_ids)):
+                for link in links:
+                    starting_urls_in_album.add(link)
+                    _, mid, _ = article_id(link) or (None, 0, None)
+                    album_heads[album_id] = max(album_heads.get(album_id) or 0, mid)
+
+        if not starting_urls_in_album:
+            # nothing to compare heads with, the saved checkpoint stays as it is for the next crawl
+            self.message_signal.emit('<span style="color:salmon">Getting links from albums failed.</span>')
+            if not more:
+                return
+
+        if more:
+            starting_urls = self.db.table('frontier').get('url', order_by='added_at') or list(starting_urls_in_album)
+            if not starting_urls:
+                self.message_signal.emit('<span style="color:salmon">No pages left to walk.</span>')
+                return
+        elif self.albums_changed(album_heads):
+            starting_urls = list(starting_urls_in_album)
+        else:
+            self.message_signal.emit('<span style="color:salmon">No new articles in albums since last crawl.</span>')
+            return
 
-    def get_urls_from_starting_url(self, starting_urls: list) -> None:
-        """get latest new urls from album starting urls"""
+        self.message_signal.emit('Getting latest new news urls from starting urls...')
+        frontier = self.get_urls_from_starting_url(starting_urls)
+        self.save_checkpoint(album_heads, frontier)
+
+    def get_album_links(self, album_id) -> list:
+        """article links listed on an album page"""
+        album_link = f'https://mp.weixin.qq.com/mp/appmsgalbum?__biz=MzU1NDQ5NDIwNQ==&action=getalbum&album_id={album_id}'
+        html = net.get_text(album_link)
+        links = []
+        if html is not None:
+            for tag in parsers.find_all(html, 'li', **{'data-title': True, 'data-link': True}):
+                if '【NHK新闻听译】' in tag.attrs['data-title'] and '收藏版' not in tag.attrs['data-title']:
+                    links.append(tag.attrs['data-link'])
+        return links
+
+    def get_links_on_page(self, url) -> list:
+        """links to other news on an article page"""
+        html = net.get_text(url, fresh=net.ARTICLE_FRESHNESS) or ''
+        return [tag.attrs['href'] for tag in parsers.find_all(html, 'a', href=True) if '【NHK新闻听译】' in tag.text]
+
+    def albums_changed(self, album_heads: dict) -> bool:
+        """check if any album has an article newer than the head recorded by the last crawl"""
+        recorded_heads = dict(self.db.table('albums').select(['id', 'head_mid']))
+        return any(head > (recorded_heads.get(album_id) or 0) for album_id, head in album_heads.items())
+
+    def save_checkpoint(self, album_heads: dict, frontier: list) -> None:
+        """persist album heads and the pages still to be walked"""
+        now = datetime.datetime.now().isoformat(timespec='seconds')
+        with self.db.transaction():
+            self.db.table('albums').upsert_many(
+                ['id', 'head_mid', 'seen_at'], [(album_id, head, now) for album_id, head in album_heads.items()],
+                ('id',), ('head_mid', 'seen_at'))
+            self.db.execute('delete from frontier')
+            self.db.table('frontier').insertmany(['url', 'added_at'], [(url, now) for url in frontier],
+                                                 conflict='ignore')
+
+    def get_urls_from_starting_url(self, starting_urls: list) -> list:
+        """
+        get latest new urls from album starting urls,
+        up to crawl_workers pages are fetched at a time and the walk stops once
+        KNOWN_URLS_TO_STOP links already in database have been seen across all pages
+        :return: urls found but not walked yet
+        """
         urls_to_search = starting_urls
         new_url_count = 0
         url_existed_in_db_count = 0
-        while url_existed_in_db_count < 10:
-            urls_on_page = []
-            url = urls_to_search.pop()
-            html = requests.get(url, headers=self.headers).text
-            soup = BeautifulSoup(html, 'html.parser')
-            # get new urls on the page
-            for tag in soup.find_all('a', text=re.compile('【NHK新闻听译】')):
-                urls_on_page.append(tag['href'])
-
-            for url_on_page in urls_on_page:
-                if url_on_page not in self.all_urls:
-                    self.all_urls.append(url_on_page)
-                    urls_to_search.append(url_on_page)
-                    new_url_count += 1
-                    self.db.table('urls').insert(url=url_on_page)
-                else:
-                    url_existed_in_db_count += 1
-
-            # if found 10 urls already in database, write new urls into db then stop searching
-            if url_existed_in_db_count > 10:
-                if new_url_count > 0:
-                    self.message_signal.emit(f'Found {new_url_count} new urls and recorded into database')
-                else:
-                    self.message_signal.emit(f'<span style="color:salmon">No new urls found.</span>')
-                break
+        workers = (self.mw.addonManager.getConfig(__name__) or {}).get('crawl_workers', 4)
+        e = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='crawler')
+        fetching = {}
+        try:
+            while (urls_to_search or fetching) and url_existed_in_db_count < self.KNOWN_URLS_TO_STOP:
+                while urls_to_search and len(fetching) < workers:
+                    url = urls_to_search.pop()
+                    fetching[e.submit(self.get_links_on_page, url)] = url
+                done, _ = concurrent.futures.wait(fetching, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                new_urls_on_page = []
+                for future in done:
+                    url = fetching.pop(future)
+                    try:
+                        urls_on_page = future.result()
+                    except Exception as error:
+                        # any failure of one page, network, parser or cache, only skips that page
+                        self.message_signal.emit(f'<span style="color:salmon">Fetching <a href="{url}">page</a> failed: '
+                                                 f'{escape(f"{type(error).__name__}: {error}")}</span>')
+                        continue
+                    for url_on_page in urls_on_page:
+                        if self.all_urls.add(url_on_page):
+                            urls_to_search.append(url_on_page)
+                            new_urls_on_page.append(url_on_page)
+                        else:
+                            url_existed_in_db_count += 1
+                if new_urls_on_page:
+                    record_urls(self.db, new_urls_on_page)
+                    new_url_count += len(new_urls_on_page)
+        finally:
+            # the walk is over, queued fetches are dropped and the ones already running are not waited for,
+            # their pages are left for the next crawl
+            e.shutdown(wait=False, cancel_futures=True)
+        urls_to_search.extend(fetching.values())
+
+        if new_url_count > 0:
+            self.message_signal.emit(f'Found {new_url_count} new urls and recorded into database')
+        else:
+            self.message_signal.emit(f'<span style="color:salmon">No new urls found.</span>')
+        return urls_to_search
+
+    def scan_collection(self) -> dict:
+        """
+        read PageUrl and AudioUrl of every nhknews note straight from the notes table in one query
+        :return: {note id: (page url, audio url)}
+        """
+        model = self.mw.col.models.by_name('nhknews')
+        if not model:
+            return {}
+        field_index = {field['name']: field['ord'] for field in model['flds']}
+        page_url_index, audio_url_index = field_index['PageUrl'], field_index['AudioUrl']
+        notes = {}
+        for nid, flds in self.mw.col.db.all('select id, flds from notes where mid=?', model['id']):
+            fields = flds.split('\x1f')
+            notes[nid] = (fields[page_url_index], fields[audio_url_index])
+        return notes
 
     def check_collection(self):
         """check collection to find notes are not recorded in database"""
-        nids = self.mw.col.find_notes("note:nhknews")
-        for nid in nids:
-            if nid not in self.db.table('notes').get('id'):
-                note = self.mw.col.get_note(nid)
-                page_url = note['PageUrl']
-                audio_url = note['AudioUrl']
-                page_id = self.db.table('urls').getone('id', url=page_url)
-                self.db.table('notes').insert(id=nid, page_id=page_id, audio_url=audio_url)
-            if nid not in self.db.table('log').get('note_id'):
-                user_id = self.db.table('users').getone('id', name=self.mw.pm.name)
-                self.db.table('log').insert(note_id=nid, user_id=user_id)
+        nids = set(self.collection_notes)
+        # a profile added or renamed since init_db has no users row yet
+        self.db.table('users').insertmany('name', [self.mw.pm.name], conflict='ignore')
+        user_id = self.db.table('users').getone('id', name=self.mw.pm.name)
+        recorded_nids = set(self.db.table('notes').iter_get('id'))
+        # like before, a note logged for any user is left alone
+        logged_nids = set(self.db.table('log').iter_get('note_id'))
+
+        notes_to_record = [(nid, *self.collection_notes[nid]) for nid in nids - recorded_nids]
+        page_ids = lookup_page_ids(self.db.table('urls'), [page_url for _, page_url, _ in notes_to_record])
+
+        with self.db.transaction():
+            self.db.table('notes').upsert_many(
+                ['id', 'page_id', 'audio_url'],
+                [(nid, page_ids.get(page_url), audio_url) for nid, page_url, audio_url in notes_to_record],
+                ('id',))
+            self.db.table('log').upsert_many(
+                ['note_id', 'user_id'], [(nid, user_id) for nid in nids - logged_nids], ('note_id', 'user_id'))
 
     def get_urls_in_collection(self):
         """get news page urls in anki collection"""
-        nids = self.mw.col.find_notes('note:nhknews')
-        urls_in_collection = []
-        for nid in nids:
-            note = self.mw.col.get_note(nid)
-            urls_in_collection.append(note['PageUrl'])
-        return urls_in_collection
+        return [page_url for page_url, _ in self.collection_notes.values()]
 
-    def run(self):
+    def download_more(self):
+        """resume the crawl from where the last one stopped"""
+        self.run(more=True)
+
+    def run(self, more=False):
         """prepare urls to be handled
             1. check if urls used by notes but not recorded in database
             2. get page urls recorded in database
@@ -119,18 +219,42 @@ class UrlWorker(QObject):
         """
         self.message_signal.emit('Preparing urls to be handled...')
         self.get_page_urls_in_database()
-        self.get_new_urls()
+        self.get_new_urls(more)
+        self.collection_notes = self.scan_collection()
         self.check_collection()
-        urls_in_anki_collection = self.get_urls_in_collection()
+        urls_in_anki_collection = UrlRegistry(self.get_urls_in_collection(), key=url_key)
         self.urls_to_handle = [url for url in self.all_urls if url not in urls_in_anki_collection]
         self.complete_signal.emit(self.urls_to_handle)
 
 
+class AudioDeduper(QObject):
+    """media.dedupe_audio off the GUI thread, progress goes out through message_signal"""
+    message_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.mw = mw
+        self.db_path = os.path.join(os.path.dirname(__file__), 'user_files', 'data.db')
+        self.db = Database.shared(self.db_path)
+
+    def run(self):
+        self.message_signal.emit('Deduplicating nhknews audio...')
+        try:
+            changed, removed = media.dedupe_audio(self.mw.col, self.db, self.message_signal.emit)
+        except Exception as e:
+            self.message_signal.emit(f'<span style="color:salmon">Deduplicating audio failed: {escape(str(e))}</span>')
+        else:
+            self.message_signal.emit(f'<span style="color: MediumSeaGreen">{changed} notes now share audio by media id, '
+                                     f'{removed} duplicate files moved to trash</span>')
+        self.finished_signal.emit()
+
+
 class TaskManager(QObject):
+    PIPELINE_WORKERS = {'fetch': 5, 'parse': 1, 'build': 1, 'media': 4, 'commit': 1}
     message_signal = pyqtSignal(str)
     all_tasks_finished_signal = pyqtSignal()
-    note_data_ready_signal = pyqtSignal(str, str, str, str)
-    note_record_signal = pyqtSignal(int, str, str)
+    note_record_signal = pyqtSignal(int, str, str, str)
     task_finished_signal = pyqtSignal()
 
     def __init__(self, urls):
@@ -138,18 +262,22 @@ class TaskManager(QObject):
         self.tasks_finished = 0
         self.total_tasks = len(urls)
         self.urls = urls
-        self.thread_pool = QThreadPool()
         self.mw = mw
         self.task_count = 0
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/101.0.4951.64 Safari/537.36'}
+        self.lock = threading.Lock()
+        self.pending_notes = {}
+        self.pipeline = None
 
         self.db_path = os.path.join(os.path.dirname(__file__), 'user_files', 'data.db')
-        self.db = Database(self.db_path)
+        self.db = Database.shared(self.db_path)
+        self.recorder = NoteRecorder(self.db)
+        self.recorder.message_signal.connect(self.message_signal)
 
-        self.note_data_ready_signal.connect(self.new_note)
-        self.note_record_signal.connect(self.record_data_to_database)
-        self.task_finished_signal.connect(self.tasks_progress)
+        # record on the emitting worker thread, it only queues the note for the recorder
+        self.note_record_signal.connect(self.record_data_to_database, Qt.ConnectionType.DirectConnection)
+        self.all_tasks_finished_signal.connect(self.recorder.flush, Qt.ConnectionType.DirectConnection)
+        # count on the emitting pipeline thread, run() keeps this object's thread busy until the pipeline drains
+        self.task_finished_signal.connect(self.tasks_progress, Qt.ConnectionType.DirectConnection)
 
     def set_urls(self, urls):
         self.urls = urls
@@ -158,41 +286,89 @@ class TaskManager(QObject):
         self.task_count = 0
         self.tasks_finished = 0
         self.total_tasks = len(self.urls)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5, thread_name_prefix='worker') as e:
-            e.map(self.task, self.urls)
+        self.pending_notes = {}
+        self.pipeline = self.create_pipeline()
+        self.pipeline.start()
+        for url in self.urls:
+            self.pipeline.put(url)
+        self.pipeline.join()
+        self.message_signal.emit(self.pipeline.report())
+
+    def create_pipeline(self):
+        """
+        fetch → parse → build → media → commit, pages go through the first three stages,
+        every note of a page goes through media and commit on its own
+        """
+        config = self.mw.addonManager.getConfig(__name__) or {}
+        workers = {**self.PIPELINE_WORKERS, **config.get('pipeline_workers', {})}
+        max_queued = config.get('pipeline_queue_size', 50)
+        # every media worker holds one audio stream open, so this also caps concurrent downloads
+        workers['media'] = config.get('audio_streams', workers['media'])
+        stages = [Stage(name, handler, workers[name], max_queued) for name, handler in [
+            ('fetch', self.fetch_page),
+            ('parse', self.parse_page),
+            ('build', self.build_notes),
+            ('media', self.download_media),
+            ('commit', self.commit_note),
+        ]]
+        if config.get('fetch_engine') == 'async':
+            if aionet.available():
+                # network stages run as coroutines on the engine's loop, the rest keep their threads
+                concurrency = config.get('async_concurrency', aionet.CONCURRENCY)
+                engine = aionet.engine(concurrency)
+                stages[0] = AsyncStage('fetch', self.fetch_page_async, engine, concurrency, max_queued)
+                stages[3] = AsyncStage('media', self.download_media_async, engine, workers['media'], max_queued)
+            else:
+                self.message_signal.emit('<span style="color:salmon">aiohttp is not installed, '
+                                         'fetching with threads</span>')
+        pipeline = Pipeline(stages)
+        pipeline.error_signal.connect(self.stage_failed, Qt.ConnectionType.DirectConnection)
+        return pipeline
 
     def tasks_progress(self):
-        self.tasks_finished += 1
-        if self.tasks_finished == self.total_tasks:
+        with self.lock:
+            self.tasks_finished += 1
+            all_finished = self.tasks_finished == self.total_tasks
+        if all_finished:
             self.all_tasks_finished_signal.emit()
             self.message_signal.emit('<span style="color: MediumSeaGreen; font-size: 32px;">All tasks finished</span>')
 
-    def task(self, url):
-        """grab content from page
-             1. get html
-             2. get news text
-             3. get rid of unwanted part
-             4. replace brackets with word from new words list
-             5. get audio links
-             6. remove url from self.urls
+    def fetch_page(self, url):
+        """get html"""
+        self.task_starting(url)
+        yield url, net.get_text(url, fresh=net.ARTICLE_FRESHNESS) or ''
+
+    async def fetch_page_async(self, url):
+        self.task_starting(url)
+        return [(url, await aionet.engine().get_text(url, fresh=net.ARTICLE_FRESHNESS) or '')]
+
+    def task_starting(self, url):
+        with self.lock:
+            self.task_count += 1
+            task_count = self.task_count
+        self.message_signal.emit(f'{task_count}/{self.total_tasks} task starting....')
+        self.message_signal.emit(f'Worker {threading.current_thread().name} is working on '
+                                 f'<a href="{url}" style="color: SlateGray">page{task_count}</a>')
+
+    def parse_page(self, item):
+        """get news text, new words and audio ids in one pass over the page"""
+        url, html = item
+        yield url, extract_article(html)
+
+    def build_notes(self, item):
+        """
+        one note per section
+             1. get rid of unwanted part
+             2. replace brackets with word from new words list
+             3. get audio links
          """
-        self.task_count += 1
-        self.message_signal.emit(f'{self.task_count}/{self.total_tasks} task starting....')
-        thread = self.thread()
-        self.message_signal.emit(
-            f'Worker {thread.objectName()} is working on <a href="{url}" style="color: SlateGray">page{self.task_count}</a>')
-
-        html = requests.get(url, headers=self.headers).text
-        soup = BeautifulSoup(html, 'html.parser')
-        sections = soup.find_all('section', {'data-autoskip': "1"})
-        words_list = self.get_words_list(html)
-
-        if sections:
-            audio_urls = self.get_audios(html)
-            for n, section in enumerate(sections):
-                text = section.text
-                text = self.remove_certain_text(text)
-                jp, cn = self.split_text(text)
+        url, article = item
+        notes = []
+        if article.sections:
+            words_list = article.words_list
+            audio_urls = self.get_audios(article.audio_ids)
+            texts = [self.remove_certain_text(text) for text in article.sections]
+            for n, (jp, cn) in enumerate(textutils.split_texts(texts)):
                 if self.is_replaceable(jp):
                     if not words_list == [[]]:
                         try:
@@ -204,16 +380,64 @@ class TaskManager(QObject):
                     audio_url = audio_urls[n]
                 except IndexError:
                     continue
-                else:
-                    # self.note_data_ready_signal.emit(jp, cn, self.url, audio_url)
-                    self.new_note(jp, cn, url, audio_url)
+                if note := self.build_note(jp, cn, url, audio_url):
+                    notes.append((url, note))
         else:
             self.message_signal.emit('<span style="color: salmon">No news information was found.</span>')
-            self.task_finished_signal.emit()
+        self.start_page(url, len(notes))
+        return notes
+
+    def download_media(self, item):
+        url, note = item
+        if not self.audio_reused(note):
+            self.download_audio(note['AudioUrl'], self.audio_filename(note))
+        yield url, note, self.audio_hash(note)
+
+    async def download_media_async(self, item):
+        url, note = item
+        if not self.audio_reused(note):
+            downloaded = await aionet.engine().download(note['AudioUrl'], self.audio_path(note))
+            self.audio_downloaded(note['AudioUrl'], self.audio_filename(note), downloaded)
+        return [(url, note, await asyncio.to_thread(self.audio_hash, note))]
+
+    def commit_note(self, item):
+        url, note, audio_hash = item
+        self.add_note(note, audio_hash)
+        self.note_done(url)
+
+    def start_page(self, url, notes):
+        """a page is finished once all of its notes are committed"""
+        if notes:
+            with self.lock:
+                self.pending_notes[url] = notes
+        else:
+            self.page_finished()
+
+    def note_done(self, url):
+        with self.lock:
+            self.pending_notes[url] -= 1
+            finished = not self.pending_notes[url]
+            if finished:
+                del self.pending_notes[url]
+        if finished:
+            self.page_finished()
+
+    def page_finished(self):
+        self.message_signal.emit(f'<span style="color: SlateGray">queued: {self.pipeline.depths()}</span>')
+        self.task_finished_signal.emit()
 
-    def get_audios(self, html: str) -> list:
-        """get audio links in html"""
-        audio_keys = re.findall('voice_encode_fileid="(.*?)"', html)
+    def stage_failed(self, stage, item, error):
+        """a failed page or note still counts as finished, so all_tasks_finished_signal is emitted"""
+        url = item if isinstance(item, str) else item[0]
+        self.message_signal.emit(
+            f'<span style="color:salmon">{stage} failed for <a href="{url}">page</a>: {escape(error)}</span>')
+        if stage in ('media', 'commit'):
+            self.note_done(url)
+        else:
+            self.page_finished()
+
+    def get_audios(self, audio_keys: list) -> list:
+        """get audio links of voice_encode_fileid values"""
         audio_links = []
         if audio_keys:
             for audio_key in audio_keys:
@@ -224,138 +448,72 @@ class TaskManager(QObject):
             self.message_signal.emit('<span style="color: salmon">No audio found</span>')
             return []
 
-    @staticmethod
-    def remove_certain_text(text):
-        """Get rid of some unwanted text"""
-        part_list = ['生词', '背景知识', '単語', '单词']
-        for part in part_list:
-            if part in text:
-                text = text[:text.index(part)]
-        return text
-
-    @staticmethod
-    def get_words_list(html) -> list:
-        """Get hidden new words list"""
-        words_list = []
-
-        # get all hidden sections
-        hidden_sections = re.findall(r'<section.+?overflow: hidden.+?>(.+?)</section>', html)
-
-        # get rid of sections without section tag
-        hidden_sections = [sec for sec in hidden_sections if 'section' in sec]
-
-        for hidden_section in hidden_sections:
-            # get rid of tags
-            text = re.sub('<.+?>', '', hidden_section)
-            text = text.replace('&nbsp;', ' ')
-            word_pattern = r'[（(]?\d+[.）)]\s*([ぁ-んァ-ンー\u4e00-\u9fff]+)[^ぁ-んァ-ンー\u4e00-\u9fff]'
-            words = re.findall(word_pattern, text)
-            words_list.append(words)
-
-        return words_list
-
-    @staticmethod
-    def replace_brackets_with_words(jp, words):
-        """replace brackets in text"""
-        for n, word in enumerate(words):
-            jp = re.sub(fr'[(（]\s*{n + 1}\s*[)）]', word, jp)
-        return jp
+    # text helpers live in textutils, kept here under their old names
+    remove_certain_text = staticmethod(textutils.remove_certain_text)
+    replace_brackets_with_words = staticmethod(textutils.replace_brackets_with_words)
+    split_text = staticmethod(textutils.split_text)
+    is_jp = staticmethod(textutils.is_jp)
+    is_replaceable = staticmethod(textutils.is_replaceable)
 
     def get_news_title(self, url):
         """Get new title"""
-        res = requests.get(url, headers=self.headers)
-        if res.status_code == 200:
-            html = res.text
-            soup = BeautifulSoup(html, features='html.parser')
-            title = soup.h1.text.strip()
-            return title
-
-    def split_text(self, text):
-        """split text into jp and cn two segments"""
-        text = re.sub(r'(。」|。”|。)', r'\g<1>\n', text)
-        sentences = text.split('\n')
-        jp, cn = "", ""
-        p = ""
-        current_lang_is_jp = True
-        for sentence in sentences:
-            if self.is_jp(sentence) != current_lang_is_jp:
-                if current_lang_is_jp:
-                    jp += f'<p>{p}</p>\n'
-                else:
-                    cn += f'<p>{p}</p>\n'
-                current_lang_is_jp = not current_lang_is_jp
-                p = ""
-            if all([current_lang_is_jp, self.is_jp(sentence)]):
-                p += sentence.strip()
-            elif all([not current_lang_is_jp, not self.is_jp(sentence)]):
-                p += sentence.strip()
-        return jp, cn
-
-    @staticmethod
-    def is_jp(p: str) -> bool:
-        """Check if text is japanese"""
-        # if there are at least two blocks of kana return true
-        if len(re.findall(r'[ぁ-んァ-ンー]+', p)) > 1:
-            return True
-        # if all are kana return true
-        elif len(re.findall('[ぁ-んァ-ンー]', p[1:-1])) == len(p[1:-1]):
-            return True
-        # otherwise return false
-        else:
-            return False
-
-    @staticmethod
-    def is_replaceable(text) -> bool:
-        """check if there are brackets and digits in the text to be replaced"""
-        pattern = '[(（]\s*\d+\s*[)）]'
-        if re.search(pattern, text):
-            return True
-        else:
-            return False
+        html = net.get_text(url, fresh=net.ARTICLE_FRESHNESS)
+        if html is not None:
+            if headings := parsers.find_all(html, 'h1'):
+                return headings[0].text.strip()
 
-    def new_note(self, jp, cn, page_url, audio_url):
-        """create note with data"""
+    def build_note(self, jp, cn, page_url, audio_url):
+        """a new note with data, None if it is already in the collection"""
         if not self.mw.col.find_notes(f'note:nhknews Japanese:re:{jp}'):
             nhknews_model = self.mw.col.models.by_name('nhknews')
             note = self.mw.col.new_note(nhknews_model)
             note['Japanese'] = jp
-            audio_filename = uuid4().hex + '.mp3'
-            self.download_audio(audio_url, audio_filename)
-            note['Pronunciation'] = f'[sound:{audio_filename}]'
+            note['Pronunciation'] = f'[sound:{media.audio_filename(audio_url)}]'
             note['Chinese'] = cn
             note['PageUrl'] = page_url
             note['AudioUrl'] = audio_url
-            langu_config = self.mw.addonManager.getConfig(__name__)
-            nhknews_deck_name = langu_config.get('nhknews_deck', 'japanese')
-            nhknews_deck = self.mw.col.decks.by_name(nhknews_deck_name)
-            self.mw.col.add_note(note, nhknews_deck['id'])
-            self.note_record_signal.emit(note.id, page_url, audio_url)
+            return note
         else:
             self.message_signal.emit('<span style="color:salmon">Note already existed in collection</span>')
 
-        self.task_finished_signal.emit()
+    @staticmethod
+    def audio_filename(note):
+        return note['Pronunciation'][len('[sound:'):-len(']')]
+
+    def audio_path(self, note):
+        return os.path.join(self.mw.col.media.dir(), self.audio_filename(note))
+
+    def audio_reused(self, note):
+        """a clip already in the media folder is used as it is, without a request"""
+        if os.path.exists(self.audio_path(note)):
+            self.message_signal.emit(f'Reused {self.audio_filename(note)}')
+            return True
+        return False
+
+    def audio_hash(self, note):
+        """content hash of the note's audio, empty when the download failed"""
+        path = self.audio_path(note)
+        return media.file_hash(path) if os.path.exists(path) else ''
+
+    def add_note(self, note, audio_hash=''):
+        langu_config = self.mw.addonManager.getConfig(__name__)
+        nhknews_deck_name = langu_config.get('nhknews_deck', 'japanese')
+        nhknews_deck = self.mw.col.decks.by_name(nhknews_deck_name)
+        self.mw.col.add_note(note, nhknews_deck['id'])
+        self.note_record_signal.emit(note.id, note['PageUrl'], note['AudioUrl'], audio_hash)
 
     def download_audio(self, audio_url, audio_filename):
-        """download audio into media folder"""
-        res = requests.get(audio_url, headers=self.headers)
-        if res.status_code == 200:
-            audio_bytes = res.content
-            audio_absolute_path = os.path.join(self.mw.col.media.dir(), audio_filename)
-            assert type(audio_bytes) == bytes, 'audio data is NOT bytes'
-            with open(audio_absolute_path, 'wb') as f:
-                f.write(audio_bytes)
-                self.message_signal.emit(f'Downloaded {audio_filename}')
+        """stream audio into media folder"""
+        downloaded = net.download(audio_url, os.path.join(self.mw.col.media.dir(), audio_filename))
+        self.audio_downloaded(audio_url, audio_filename, downloaded)
+
+    def audio_downloaded(self, audio_url, audio_filename, downloaded):
+        if downloaded:
+            self.message_signal.emit(f'Downloaded {audio_filename}')
         else:
             self.message_signal.emit(
                 f'<span style="color:salmon">Downloading <a href="{audio_url}">Audio</a> failed</span>')
 
-    def record_data_to_database(self, note_id, page_url, audio_url):
-        """write note and user info into database"""
-        user = self.mw.pm.name
-        user_id = self.db.table('users').getone('id', name=user)
-        page_id = self.db.table('urls').getone('id', url=page_url)
-        self.db.table('notes').insert(id=note_id, page_id=page_id, audio_url=audio_url)
-        self.db.table('log').insert(note_id=note_id, user_id=user_id)
-        color = f'#{random.randint(0, 2 ** 24 - 1):06x}'
-        self.message_signal.emit(
-            f'Wrote Card ID <b style="color:{color}">{note_id}</b> info for User <b style="color:{color}">{user}</b> into database')
+    def record_data_to_database(self, note_id, page_url, audio_url, audio_hash):
+        """queue note and user info to be written into database"""
+        self.recorder.put(note_id, page_url, audio_url, self.mw.pm.name, audio_hash or None)